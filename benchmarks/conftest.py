@@ -0,0 +1,15 @@
+import pytest
+
+
+
+def pytest_addoption(parser):
+    parser.addoption('--bench-max-size', type=int, default=10**6,
+            help='skip benchmarks with more than this many coefficients')
+
+def pytest_collection_modifyitems(config, items):
+    maxsize = config.getoption('--bench-max-size')
+    skip = pytest.mark.skip(reason=f'larger than --bench-max-size={maxsize}')
+    for item in items:
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None and callspec.params.get('n', 0) > maxsize:
+            item.add_marker(skip)
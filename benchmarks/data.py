@@ -0,0 +1,78 @@
+"""Reproducible benchmark inputs.
+
+All generators are seeded, so the same parameters always give the same
+vectors & tensors and timings are comparable between commits.
+"""
+
+import tracemalloc
+from math import isqrt
+from random import Random
+from fractions import Fraction
+import numpy as np
+
+
+
+SIZES = (10, 10**2, 10**3, 10**4, 10**5, 10**6)
+DENSITIES = (0.001, 0.01, 0.1)
+KINDS = ('int', 'float', 'complex', 'Fraction')
+
+
+
+def coefficients(kind, n, seed=0):
+    """Return `n` random nonzero coefficients of the given kind."""
+    rng = Random(seed)
+    match kind:
+        case 'int':
+            return [rng.randint(1, 2**16) for _ in range(n)]
+        case 'float':
+            return [rng.random()+0.5 for _ in range(n)]
+        case 'complex':
+            return [complex(rng.random()+0.5, rng.random()) for _ in range(n)]
+        case 'Fraction':
+            return [Fraction(rng.randint(1, 2**16), rng.randint(1, 2**16)) for _ in range(n)]
+    raise ValueError(f'unknown coefficient kind {kind!r}')
+
+def dense(kind, n, seed=0):
+    """Return a dense vector (`tuple`) of length `n`."""
+    return tuple(coefficients(kind, n, seed))
+
+def sparse(kind, n, density, seed=0):
+    """Return a sparse vector (`dict`) of dimension `n` with `n*density` nonzeros."""
+    k = max(1, round(n*density))
+    return dict(zip(sorted(Random(seed).sample(range(n), k)), coefficients(kind, k, seed)))
+
+def tensor(kind, n, seed=0, native=False):
+    """Return a square matrix (`numpy.ndarray`) with about `n` coefficients.
+    
+    `Fraction` coefficients are stored as Python objects, `int`s as well
+    (like the multilinear functions would produce them)
+    unless `native` is set, then as `numpy.int64`.
+    """
+    r = isqrt(n)
+    dtype = {'int':np.int64 if native else object,
+             'float':np.float64, 'complex':np.complex128}.get(kind, object)
+    t = np.empty(r*r, dtype=dtype)
+    t[:] = coefficients(kind, r*r, seed)
+    return t.reshape(r, r)
+
+def sparsetensor(kind, n, density, seed=0):
+    """Return a sparse square matrix (`dict`) of about `n` entries with `n*density` nonzeros."""
+    r = isqrt(n)
+    return {divmod(i, r):vi for i, vi in sparse(kind, r*r, density, seed).items()}
+
+
+
+def measure(benchmark, f, *args):
+    """Benchmark `f(*args)` and record its peak memory allocation.
+    
+    The peak (in bytes, measured by `tracemalloc` in a separate untimed call)
+    is stored as `peak_bytes` in the benchmarks `extra_info`,
+    so it ends up in the JSON results next to the timings.
+    """
+    tracemalloc.start()
+    try:
+        f(*args)
+        benchmark.extra_info['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return benchmark(f, *args)
@@ -0,0 +1,62 @@
+from vector import *
+from vector.dense import algebra
+from .data import SIZES, KINDS, dense, measure
+import pytest
+
+
+
+OPS = {
+    #utility
+    'veceq': lambda v, w: veceq(v, w),
+    'vectrim': lambda v, w: vectrim(v),
+    #Hilbert space
+    'vecconj': lambda v, w: vecconj(v),
+    'vecabsq': lambda v, w: vecabsq(v),
+    'vecabs': lambda v, w: vecabs(v),
+    'vecdot': lambda v, w: vecdot(v, w),
+    #vector space
+    'vecpos': lambda v, w: vecpos(v),
+    'vecneg': lambda v, w: vecneg(v),
+    'vecadd': lambda v, w: vecadd(v, w),
+    'vecsub': lambda v, w: vecsub(v, w),
+    'vecmul': lambda v, w: vecmul(v, 3),
+    'vectruediv': lambda v, w: vectruediv(v, 3),
+    #elementwise
+    'vechadamard': lambda v, w: vechadamard(v, w),
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', OPS)
+def test_dense(benchmark, op, n, kind):
+    benchmark.group = f'dense-{op}'
+    measure(benchmark, OPS[op], dense(kind, n, 0), dense(kind, n, 1))
+
+
+
+#convolution crossovers: every algorithm forced on the same inputs,
+#the fastest per length justifies KARATSUBA_THRESHOLD & FFT_THRESHOLD
+CONV_SIZES = (8, 16, 32, 64, 128, 256, 512, 1024)
+CONV_ALGORITHMS = {
+    'schoolbook': {'KARATSUBA_THRESHOLD':float('inf'), 'FFT_THRESHOLD':float('inf')},
+    'karatsuba': {'KARATSUBA_THRESHOLD':16, 'FFT_THRESHOLD':float('inf')},
+    'fft': {'KARATSUBA_THRESHOLD':float('inf'), 'FFT_THRESHOLD':0},
+    'default': {},
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('n', CONV_SIZES)
+@pytest.mark.parametrize('algorithm', CONV_ALGORITHMS)
+def test_dense_conv(benchmark, monkeypatch, algorithm, n, kind):
+    if algorithm=='karatsuba' and kind in {'float', 'complex'}:
+        pytest.skip('Karatsuba is only used for exact coefficients')
+    if algorithm=='fft' and kind in {'int', 'Fraction'}:
+        pytest.skip('FFT is only used for floating point coefficients')
+    for name, value in CONV_ALGORITHMS[algorithm].items():
+        monkeypatch.setattr(algebra, name, value)
+    benchmark.group = f'dense-vecconv-{kind}-{n}'
+    measure(benchmark, vecconv, dense(kind, n, 0), dense(kind, n, 1))
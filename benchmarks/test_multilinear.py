@@ -0,0 +1,30 @@
+from vector import *
+from .data import SIZES, KINDS, tensor, measure
+import pytest
+
+
+
+OPS = {
+    #utility
+    'tentrim': lambda s, t: tentrim(s),
+    #Hilbert space
+    'tenconj': lambda s, t: tenconj(s),
+    #vector space
+    'tenpos': lambda s, t: tenpos(s),
+    'tenneg': lambda s, t: tenneg(s),
+    'tenadd': lambda s, t: tenadd(s, t),
+    'tensub': lambda s, t: tensub(s, t),
+    'tenmul': lambda s, t: tenmul(s, 3),
+    'tentruediv': lambda s, t: tentruediv(s, 3),
+    #elementwise
+    'tenhadamard': lambda s, t: tenhadamard(s, t),
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', OPS)
+def test_multilinear(benchmark, op, n, kind):
+    benchmark.group = f'multilinear-{op}'
+    measure(benchmark, OPS[op], tensor(kind, n, 0), tensor(kind, n, 1))
@@ -0,0 +1,32 @@
+from vector import *
+from .data import SIZES, DENSITIES, KINDS, sparsetensor, measure
+import pytest
+
+
+
+OPS = {
+    #utility
+    'tenseq': lambda s, t: tenseq(s, t),
+    'tenstrim': lambda s, t: tenstrim(s),
+    #Hilbert space
+    'tensconj': lambda s, t: tensconj(s),
+    #vector space
+    'tenspos': lambda s, t: tenspos(s),
+    'tensneg': lambda s, t: tensneg(s),
+    'tensadd': lambda s, t: tensadd(s, t),
+    'tenssub': lambda s, t: tenssub(s, t),
+    'tensmul': lambda s, t: tensmul(s, 3),
+    'tenstruediv': lambda s, t: tenstruediv(s, 3),
+    #elementwise
+    'tenshadamard': lambda s, t: tenshadamard(s, t),
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('density', DENSITIES)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', OPS)
+def test_multilinear_sparse(benchmark, op, n, density, kind):
+    benchmark.group = f'multilinear_sparse-{op}'
+    measure(benchmark, OPS[op], sparsetensor(kind, n, density, 0), sparsetensor(kind, n, density, 1))
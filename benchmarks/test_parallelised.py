@@ -0,0 +1,34 @@
+from vector import *
+from .data import SIZES, KINDS, tensor, measure
+import pytest
+
+
+
+OPS = {
+    #utility
+    'vecnpeq': lambda v, w: vecnpeq(v, w),
+    'vecnptrim': lambda v, w: vecnptrim(v),
+    #Hilbert space
+    'vecnpabsq': lambda v, w: vecnpabsq(v),
+    'vecnpabs': lambda v, w: vecnpabs(v),
+    'vecnpdot': lambda v, w: vecnpdot(v, w),
+    #vector space
+    'vecnppos': lambda v, w: vecnppos(v),
+    'vecnpneg': lambda v, w: vecnpneg(v),
+    'vecnpadd': lambda v, w: vecnpadd(v, w),
+    'vecnpsub': lambda v, w: vecnpsub(v, w),
+    'vecnpmul': lambda v, w: vecnpmul(v, 3),
+    'vecnptruediv': lambda v, w: vecnptruediv(v, 3),
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', OPS)
+def test_parallelised(benchmark, op, n, kind):
+    if op=='vecnpabs' and kind=='Fraction':
+        pytest.skip('numpy.linalg.norm does not support object arrays')
+    #rows of a square matrix as multiple vectors
+    benchmark.group = f'parallelised-{op}'
+    measure(benchmark, OPS[op], tensor(kind, n, 0, native=True), tensor(kind, n, 1, native=True))
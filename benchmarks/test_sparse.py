@@ -0,0 +1,52 @@
+from vector import *
+from .data import SIZES, DENSITIES, KINDS, sparse, measure
+import pytest
+
+
+
+OPS = {
+    #utility
+    'vecseq': lambda v, w: vecseq(v, w),
+    'vecstrim': lambda v, w: vecstrim(v),
+    #Hilbert space
+    'vecsconj': lambda v, w: vecsconj(v),
+    'vecsabsq': lambda v, w: vecsabsq(v),
+    'vecsabs': lambda v, w: vecsabs(v),
+    'vecsdot': lambda v, w: vecsdot(v, w),
+    #vector space
+    'vecspos': lambda v, w: vecspos(v),
+    'vecsneg': lambda v, w: vecsneg(v),
+    'vecsadd': lambda v, w: vecsadd(v, w),
+    'vecssub': lambda v, w: vecssub(v, w),
+    'vecsmul': lambda v, w: vecsmul(v, 3),
+    'vecstruediv': lambda v, w: vecstruediv(v, 3),
+    #elementwise
+    'vecshadamard': lambda v, w: vecshadamard(v, w),
+}
+
+SORTED = {
+    'vecsoadd': vecsoadd,
+    'vecsosub': vecsosub,
+    'vecsodot': vecsodot,
+    'vecsohadamard': vecsohadamard,
+}
+
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('density', DENSITIES)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', OPS)
+def test_sparse(benchmark, op, n, density, kind):
+    benchmark.group = f'sparse-{op}'
+    measure(benchmark, OPS[op], sparse(kind, n, density, 0), sparse(kind, n, density, 1))
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('density', DENSITIES)
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('op', SORTED)
+def test_sparse_sorted(benchmark, op, n, density, kind):
+    benchmark.group = f'sparse-{op}'
+    v = vecstoso(sparse(kind, n, density, 0))
+    w = vecstoso(sparse(kind, n, density, 1))
+    measure(benchmark, SORTED[op], v, w)
@@ -0,0 +1,41 @@
+"""Build hook compiling the optional C extensions.
+
+If compilation fails (e.g. no compiler available) a warning is printed and a
+pure Python wheel is built instead, the package falls back to the Python
+implementations at import time.
+"""
+
+from pathlib import Path
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+
+EXTENSIONS = {'vector.dense._cdense': ['vector/dense/_cdense.c']}
+
+
+
+class CustomBuildHook(BuildHookInterface):
+    def initialize(self, version, build_data):
+        if self.target_name != 'wheel':
+            return
+        try:
+            from setuptools import Distribution, Extension
+            from setuptools.command.build_ext import build_ext
+
+            dist = Distribution({'ext_modules': [Extension(name, sources)
+                    for name, sources in EXTENSIONS.items()]})
+            cmd = build_ext(dist)
+            cmd.build_lib = str(Path(self.root) / 'build' / 'lib')
+            cmd.build_temp = str(Path(self.root) / 'build' / 'temp')
+            cmd.ensure_finalized()
+            cmd.run()
+        except Exception as e:
+            self.app.display_warning(
+                    f'C extensions not built, using pure Python fallback: {e}')
+            return
+
+        for name in EXTENSIONS:
+            path = Path(cmd.get_ext_fullpath(name))
+            build_data['force_include'][str(path)] = str(path.relative_to(cmd.build_lib))
+        build_data['pure_python'] = False
+        build_data['infer_tag'] = True
@@ -0,0 +1,59 @@
+from vector import *
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import pytest
+
+
+
+async def source(vs):
+    for v in vs:
+        await asyncio.sleep(0)
+        yield v
+
+def test_aiochunks():
+    async def chunks(*args, **kwargs):
+        return [c async for c in aiochunks(*args, **kwargs)]
+    assert asyncio.run(chunks(source(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert asyncio.run(chunks(range(7), 3, prefetch=1)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert asyncio.run(chunks([], 3, prefetch=2)) == []
+    async def failing():
+        yield 1
+        raise RuntimeError
+    with pytest.raises(RuntimeError):
+        asyncio.run(chunks(failing(), 3, prefetch=1))
+    #backpressure: the producer runs at most prefetch chunks ahead
+    async def pulled():
+        n = 0
+        async def counting():
+            nonlocal n
+            for i in range(100):
+                n += 1
+                yield i
+        async for _ in aiochunks(counting(), 5, prefetch=2):
+            await asyncio.sleep(0.01)
+            break
+        return n
+    assert asyncio.run(pulled()) <= 5*(2+2)
+
+def test_Accumulator():
+    vs = [{i%7:Fraction(1, i+1), i%5:i} for i in range(50)]
+    assert asyncio.run(Accumulator().feed(source(vs))) == vecsadd(*vs)
+    assert asyncio.run(Accumulator().feed(source(vs), chunk=8, prefetch=2)) == vecsadd(*vs)
+    with ProcessPoolExecutor(2) as executor:
+        assert asyncio.run(Accumulator().feed(vs, chunk=16, executor=executor)) == vecsadd(*vs)
+    ws = [[i, 1, 2][:i%3+1] for i in range(20)]
+    assert asyncio.run(Accumulator([], veciadd).feed(source(ws), chunk=6)) == vecadd(*ws, factory=list)
+    acc = Accumulator({0:1}).iadd({1:2}, {0:3})
+    assert acc.value == {0:4, 1:2}
+
+def test_aiovecsdot():
+    vs, w = [{i:i+1, i+1:2} for i in range(10)], {i:Fraction(1, i+1) for i in range(12)}
+    assert asyncio.run(aiovecsdot(source(vs), w)) == vecsdot(vecsadd(*vs), w)
+    assert asyncio.run(aiovecsdot(source(vs), w, chunk=3, prefetch=1)) == vecsdot(vecsadd(*vs), w)
+    assert asyncio.run(aiovecsdot([], w)) == 0
+
+def test_aiovecsabsq():
+    vs = [{2*i:i, 2*i+1:1j} for i in range(10)]
+    assert asyncio.run(aiovecsabsq(source(vs), conjugate=True)) == vecsabsq(vecsadd(*vs), conjugate=True)
+    assert asyncio.run(aiovecsabsq(vs, chunk=4)) == vecsabsq(vecsadd(*vs))
@@ -4,6 +4,7 @@ from itertools import islice, count
 from random import randint
 from operationcounter import OperationCounter, count_ops
 from collections import Counter
+import numpy as np
 
 
 
@@ -175,6 +176,26 @@ def test_vecdivmod():
         assert counter == Counter({'divmod':n})
 
 
+def test_vecaxpy():
+    for _ in range(20):
+        m, n = randint(0, 20), randint(0, 20)
+        a = randint(-100, +100)
+        x = tuple(OperationCounter(randint(-100, +100)) for _ in range(m))
+        y = tuple(OperationCounter(randint(-100, +100)) for _ in range(n))
+        with count_ops() as counter:
+            vecaxpy(a, x, y)
+        assert counter == Counter({'rmul':m, 'add':min(m, n)})
+
+def test_veclincomb():
+    for _ in range(20):
+        ns = [randint(0, 20) for _ in range(randint(0, 5))]
+        coeffs = [randint(-100, +100) for _ in ns]
+        vs = [tuple(OperationCounter(randint(-100, +100)) for _ in range(n)) for n in ns]
+        with count_ops() as counter:
+            veclincomb(coeffs, vs)
+        assert counter == Counter({'rmul':sum(ns), 'add':sum(ns)-max(ns, default=0)})
+
+
 #elementwise
 def test_vechadamard():
     for _ in range(20):
@@ -237,3 +258,78 @@ def test_vechadamardmax():
         with count_ops() as counter:
             vechadamardmax(v, w)
         assert counter == Counter({'gt':min(n, m)})
+
+
+
+#sparse
+def test_vecsaxpy():
+    for _ in range(20):
+        a = randint(-100, +100)
+        x = {randint(0, 30):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))}
+        y = {randint(0, 30):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))}
+        k = len(x.keys() & y.keys())
+        with count_ops() as counter:
+            vecsaxpy(a, x, y)
+        assert counter == Counter({'rmul':len(x), 'add':k})
+        with count_ops() as counter:
+            vecsiaxpy(y, a, x)
+        assert counter == Counter({'rmul':len(x), 'iadd':k})
+
+def test_vecslincomb():
+    for _ in range(20):
+        vs = [{randint(0, 30):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))} for _ in range(randint(0, 5))]
+        coeffs = [randint(-100, +100) for _ in vs]
+        with count_ops() as counter:
+            vecslincomb(coeffs, vs)
+        n = sum(map(len, vs))
+        assert counter == Counter({'rmul':n, 'iadd':n-len(set().union(*vs))})
+
+
+#multilinear
+def _tenrand(shape):
+    t = np.empty(shape, dtype=object)
+    for i in np.ndindex(shape):
+        t[i] = OperationCounter(randint(-100, +100))
+    return t
+
+def test_tenaxpy():
+    for _ in range(20):
+        a = randint(-100, +100)
+        x = _tenrand((randint(0, 5), randint(0, 5)))
+        y = _tenrand((randint(0, 5), randint(0, 5)))
+        with count_ops() as counter:
+            tenaxpy(a, x, y)
+        assert counter == Counter({'rmul':x.size, 'add':x.size})
+
+def test_tenlincomb():
+    for _ in range(20):
+        ts = [_tenrand((randint(0, 5), randint(0, 5))) for _ in range(randint(1, 5))]
+        coeffs = [randint(-100, +100) for _ in ts]
+        with count_ops() as counter:
+            tenlincomb(coeffs, ts)
+        n = sum(t.size for t in ts)
+        assert counter == Counter({'rmul':n, 'add':n})
+
+
+#multilinear sparse
+def test_tensaxpy():
+    for _ in range(20):
+        a = randint(-100, +100)
+        x = {(randint(0, 5), randint(0, 5)):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))}
+        y = {(randint(0, 5), randint(0, 5)):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))}
+        k = len(x.keys() & y.keys())
+        with count_ops() as counter:
+            tensaxpy(a, x, y)
+        assert counter == Counter({'rmul':len(x), 'add':k})
+        with count_ops() as counter:
+            tensiaxpy(y, a, x)
+        assert counter == Counter({'rmul':len(x), 'iadd':k})
+
+def test_tenslincomb():
+    for _ in range(20):
+        ts = [{(randint(0, 5), randint(0, 5)):OperationCounter(randint(-100, +100)) for _ in range(randint(0, 20))} for _ in range(randint(0, 5))]
+        coeffs = [randint(-100, +100) for _ in ts]
+        with count_ops() as counter:
+            tenslincomb(coeffs, ts)
+        n = sum(map(len, ts))
+        assert counter == Counter({'rmul':n, 'iadd':n-len(set().union(*ts))})
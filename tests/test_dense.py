@@ -1,10 +1,15 @@
 import pytest
+import warnings
 from vector import *
-from math import isclose, sqrt
+from math import isclose, sqrt, inf
 from itertools import islice, count
+from functools import partial
+from fractions import Fraction
 from random import randint
 from operationcounter import OperationCounter, count_ops
 from collections import Counter
+from array import array
+import numpy as np
 
 
 
@@ -124,6 +129,35 @@ def test_vecdot():
     assert vecdot((1,), veczero) == 0
     assert vecdot((1, 2), (3, 4, 5)) == 11
 
+def test_vecsummation():
+    #catastrophic cancellation, only compensated & exact sums recover it
+    v = (1e16, 1.0, -1e16) * 3
+    for summation, r in (('naive', 0.0), ('pairwise', 0.0), ('kahan', 3.0), ('exact', 3.0)):
+        assert vecdot(v, (1,)*9, summation=summation) == r
+        assert vecdot(np.array(v), np.ones(9), summation=summation) == r
+        assert summate(v, summation) == r
+    #infinite sums stay infinite, no inf-inf compensation
+    for summation in ('naive', 'pairwise', 'kahan', 'exact'):
+        assert summate([inf, 1.0], summation) == summate([1.0, inf], summation) == inf
+        assert vecdot((inf, 1.0), (1, 1), summation=summation) == inf
+    assert summate([0.1]*10, 'pairwise') == 1.0
+    assert summate([1+1e16j, 1, -1e16j], 'kahan') == 2
+    assert summate((), 'exact', zero=5) == 5
+    assert vecabsq((1j, 2, 3j), conjugate=True, summation='kahan') == 14
+    assert vecabs(array('d', (3, 4)), summation='exact') == 5
+    with pytest.raises(ValueError):
+        summate((1, 2), 'unknown')
+
+def test_vecgram():
+    vs = [(1, 2), (3j, 4, 5), (1,)]
+    for conjugate in (False, True):
+        assert vecgram(vs, conjugate=conjugate) == tuple(tuple(vecdot(v, w, conjugate=conjugate) for w in vs) for v in vs)
+    assert vecgram(vs, [(1, 1)]) == ((3,), (4+3j,), (1,))
+    assert vecgram(vs, triangular=True) == ((5, 8+3j, 1), (0, 32, 3j), (0, 0, 1))
+    assert list(vecgram(vs, block=2, triangular=True)) \
+            == [(0, 0, [[5, 8+3j], [0, 32]]), (0, 2, [[1], [3j]]), (2, 2, [[1]])]
+    assert vecgram([]) == ()
+
 
 
 #vector space
@@ -237,6 +271,106 @@ def test_vecdivmod():
     assert vecdivmod(v, a) == (vecfloordiv(v, a), vecmod(v, a))
 
 
+def test_vectyped():
+    v, w = (1.5, -2.0, 3.25), (4.0, 0.5)
+    for cast in (partial(array, 'd'), np.array, lambda v: memoryview(array('d', v))):
+        r = vecadd(cast(v), cast(w), cast(w))
+        assert type(r) is type(cast(v)) and tuple(r) == vecadd(v, w, w)
+        assert tuple(vecsub(cast(w), cast(v))) == vecsub(w, v)
+        assert tuple(vecneg(cast(v))) == vecneg(v)
+        assert tuple(vecmul(cast(v), 3)) == vecmul(v, 3)
+        assert tuple(vecrmul(3, cast(v))) == vecrmul(3, v)
+        assert tuple(vectruediv(cast(v), 4)) == vectruediv(v, 4)
+        assert tuple(vecfloordiv(cast(v), 2)) == vecfloordiv(v, 2)
+        assert tuple(vecmod(cast(v), 2)) == vecmod(v, 2)
+        assert vecadd(cast(v), cast(w), factory=tuple) == vecadd(v, w)
+    with pytest.raises(ZeroDivisionError):
+        vectruediv(array('d', v), 0, factory=tuple)
+    #integers stay on the generic path
+    assert vecadd(array('q', (2**62,)), array('q', (2**62,)), factory=tuple) == (2**63,)
+    #single precision too, the same as coefficient by coefficient
+    r = vecmul(array('f', [3.0]), 0.1, factory=tuple)
+    assert r == vecmul((3.0,), 0.1) and r[0] == 0.30000000000000004 and type(r[0]) is float
+    assert vecadd(array('f', [0.1]), (0.2,), factory=tuple) == vecadd(array('f', [0.1]).tolist(), (0.2,), factory=tuple)
+    a = np.array([0.1, 0.7], dtype=np.float32)
+    assert vecsub(a, (0.2,), factory=tuple) == vecsub(list(a), (0.2,), factory=tuple)
+
+def test_vectypedreductions():
+    v, w = (1.5, -2.0, 3.25, 0.0, 0.0), (4.0, 0.5j)
+    for cast in (partial(array, 'd'), np.array, lambda v: memoryview(array('d', v))):
+        assert vecabsq(cast(v)) == vecabsq(v)
+        assert vecdot(cast(v), cast(v), weights=cast((1.0, 2.0))) == 1.5**2 + 2*2.0**2
+        assert veceq(cast(v), cast(v[:3])) and not veceq(cast(v), cast(v[:2]))
+        assert tuple(vectrim(cast(v))) == v[:3]
+    assert vecdot(np.array(w), np.array(v), conjugate=True) == vecdot(w, v, conjugate=True)
+    assert vecdot(np.full(10, 0.1), np.full(10, 0.1)) == 0.1
+    assert vecabsq(np.array((np.inf, 1.0))) == float('inf')
+    #trimming slices without copying
+    a = np.array(v)
+    assert np.shares_memory(vectrim(a), a)
+    assert vectrim(np.zeros(3)).size == 0
+
+def test_vecout():
+    out = [9, 9, 9, 9]
+    assert vecadd((1, 2), (3, 4, 5), out=out) is out and out == [4, 6, 5]
+    assert vecsub((1, 2, 3, 4, 5), (1,), out=out) is out and out == [0, 2, 3, 4, 5]
+    assert vechadamard((1, 2), (3, 4, 5), out=out) is out and out == [3, 8]
+    assert vecaddc((1,), 2, i=2, out=out) == [1, 0, 2]
+    assert vecrmul(2, iter((1, 2)), out=out) == [2, 4]
+    #operands may be written to
+    assert vecmul(out, 3, out=out) == [6, 12]
+    out = array('d')
+    assert vecadd(array('d', (1.0, 2.0)), array('d', (3.0,)), out=out) is out
+    assert out == array('d', (4.0, 2.0))
+    assert vecneg(np.array((1.0, 2.0, 3.0)), out=out) == array('d', (-1.0, -2.0, -3.0))
+
+def test_vecinto():
+    out = np.zeros(4)
+    r = vecadd(np.array((1.0, 2.0)), np.array((3.0, 4.0, 5.0)), factory=vecinto(out))
+    assert np.shares_memory(r, out) and tuple(out) == (4, 6, 5, 0)
+    out = array('q', (0,)*3)
+    assert tuple(vecadd((1, 2), (3,), factory=vecinto(out))) == (4, 2)
+    assert tuple(out) == (4, 2, 0)
+    with pytest.raises(ValueError):
+        vecadd((1, 2), factory=vecinto(array('q', (0,))))
+
+def test_cdense():
+    cdense = pytest.importorskip('vector.dense._cdense')
+    v, w = (1, 2+1j, 3.5), (4, 5, 6, 7)
+    assert cdense.vecadd(v, w, w) == vecadd(v, w, w) == (9, 12+1j, 15.5, 14)
+    assert cdense.vecadd(iter(v), factory=list) == list(v)
+    assert cdense.vecsub(v, w) == vecsub(v, w) == (-3, -3+1j, -2.5, -7)
+    assert cdense.vecdot(v, w, conjugate=True) == 4+10-5j+21
+    assert cdense.vecabsq(v, weights=w, conjugate=True) == 4+25+73.5
+    assert cdense.vecdot((), (), zero=0.0) == 0.0
+    assert cdense.vecdot((0.1,)*10, (0.1,)*10) == 0.1
+
+
+
+def test_vecaxpy():
+    assert vecaxpy(2, (1, 2, 3), (4, 5)) == (6, 9, 6)
+    assert vecaxpy(2, (1,), (4, 5)) == (6, 5)
+    assert vecaxpy(2, veczero, veczero) == veczero
+
+def test_veciaxpy():
+    y = [4, 5]
+    assert veciaxpy(y, 2, (1, 2, 3)) is y
+    assert y == [6, 9, 6]
+    y = [4, 5]
+    assert veciaxpy(y, 2, (1,)) == [6, 5]
+
+def test_veclincomb():
+    assert veclincomb((), ()) == veczero
+    assert veclincomb((2, 3, -1), ((1, 2, 3), (4, 5), (6,))) == (8, 19, 6)
+    assert veclincomb((2,), ([1, 2],)) == [2, 4]
+    with pytest.raises(ValueError):
+        veclincomb((1, 2), ((1,),))
+
+def test_vecilincomb():
+    v = [1]
+    assert vecilincomb(v, (2, 3), ((1, 2, 3), (4, 5))) is v
+    assert v == [15, 19, 6]
+
 
 #elementwise
 def test_vechadamard():
@@ -327,3 +461,131 @@ def test_vechadamardmax():
     w = ( 5, 2, 3, 6,  1, 9)
     assert vechadamardmax(u, v, w) == (10, 6, 7, 9, 10, 9)
     assert vechadamardmax(u) == u
+
+
+
+#algebra
+def test_vecconv():
+    #(1+2x)(3+4x+5x^2) = 3+10x+13x^2+10x^3
+    assert vecconv((1, 2), (3, 4, 5)) == (3, 10, 13, 10)
+    assert vecconv((), (1, 2)) == ()
+    assert vecconv([Fraction(1, 2)], [2, 4]) == [1, 2]
+    #Karatsuba (exact) & FFT (floats) against the schoolbook method
+    for n, m in ((70, 130), (200, 200), (129, 64)):
+        v, w = [randint(-2**40, 2**40) for _ in range(n)], [randint(-2**40, 2**40) for _ in range(m)]
+        r = tuple(sum(v[i]*w[k-i] for i in range(max(0, k-m+1), min(k, n-1)+1)) for k in range(n+m-1))
+        assert vecconv(v, w, factory=tuple) == r
+        f = vecconv(list(map(float, v)), list(map(float, w)))
+        assert all(isclose(fi, ri, abs_tol=1e-12*max(map(abs, r))) for fi, ri in zip(f, r))
+    v = array('d', [1, 2])
+    assert vecconv(v, array('d', [3, 4, 5])) == array('d', [3, 10, 13, 10])
+    assert vecconv(v, [1j], factory=list) == [1j, 2j]
+    assert (Vector((1, 2)) @ Vector((3, 4, 5))).data == (3, 10, 13, 10)
+
+def test_veciconv():
+    v = [1, 2]
+    assert veciconv(v, (3, 4, 5)) is v
+    assert v == [3, 10, 13, 10]
+    v = array('d', [1, 2])
+    assert veciconv(v, array('d', [3, 4, 5])) == array('d', [3, 10, 13, 10])
+
+
+
+#chunked
+def test_vecread(tmp_path):
+    v = np.arange(10, dtype=float)
+    v.tofile(tmp_path/'v.bin')
+    np.save(tmp_path/'v.npy', v)
+    (tmp_path/'v.txt').write_text('\n'.join(map(str, v)) + '\n')
+    for chunks, w in ((vecreadraw(tmp_path/'v.bin', chunk=4, offset=8), v[1:]),
+                      (vecreadnpy(tmp_path/'v.npy', chunk=4), v),
+                      (vecreadtext(tmp_path/'v.txt', chunk=4), v)):
+        chunks = list(chunks)
+        assert all(len(c) <= 4 for c in chunks)
+        assert np.array_equal(np.concatenate(chunks), w)
+    with open(tmp_path/'v.bin', 'rb') as f:
+        assert np.array_equal(np.concatenate(list(vecreadraw(f, chunk=3))), v)
+    #partial trailing coefficient
+    with pytest.raises(ValueError, match='partial element, expected itemsize 8'):
+        list(vecreadraw(tmp_path/'v.bin', chunk=4, offset=4))
+    #blocks of comments & empty lines don't give empty chunks
+    (tmp_path/'c.txt').write_text('# header\n\n#\n1\n2 # two\n# a\n  \n# b\n3\n')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        chunks = list(vecreadtext(tmp_path/'c.txt', chunk=2))
+    assert [c.tolist() for c in chunks] == [[1, 2], [3]]
+
+def test_vecchunkdot():
+    v, w = np.random.rand(1000), np.random.rand(900)
+    vs, ws = np.array_split(v, 7), np.array_split(w, 3)
+    assert isclose(vecchunkdot(vs, ws), vecdot(v, w))
+    assert isclose(vecchunkabsq(vs), vecabsq(v))
+    assert isclose(vecchunkabs(iter(vs)), vecabs(v))
+    #compensated across chunks
+    assert vecchunkabsq([[1e8], [1.0]]*1000) == 1000*(1e16+1)
+    z = v + 1j*np.random.rand(1000)
+    assert abs(vecchunkabsq(np.array_split(z, 5), conjugate=True) - vecabsq(z, conjugate=True)) < 1e-9
+    #exact for integers
+    assert vecchunkdot([[2**62], [2**62]], [[4, 4]]) == 2**65
+    #infinite products stay infinite across chunks
+    assert vecchunkdot([np.array([inf]), np.array([1.0])], [np.ones(2)]) == inf
+    assert vecchunkdot([], [[1]]) == 0
+
+
+
+#objectoriented
+def test_Vector():
+    v, w = Vector((1, 2)), Vector((3, 4, 5))
+    assert (v + w).data == (4, 6, 5)
+    assert (v - w).data == (-2, -2, -5)
+    assert (2 * v).data == (v * 2).data == (2, 4)
+    assert (-v).data == (-1, -2)
+    assert v.hadamard(w).data == (3, 8)
+    assert v == Vector((1, 2, 0))
+    assert v == (1, 2) and v != (1, 3) and v != None
+    #plain iterables as operands
+    assert (v + (3, 4)).data == (4, 6) and (v - [1]).data == (0, 2)
+    assert v.hadamard([3, 4], w).data == (9, 32) and v.hadamardmin((0, 5)).data == (0, 2)
+    assert (v @ [1, 1]).data == (1, 3, 2)
+    assert isclose(abs(v), sqrt(5))
+
+def test_Vectormemmap(tmp_path):
+    filename = tmp_path / 'v.bin'
+    np.array((3.0, 4.0, 0.0)).tofile(filename)
+    v = Vector.memmap(filename)
+    assert isinstance(v.data, np.memmap)
+    assert abs(v) == 5
+    assert v == Vector((3, 4))
+    assert len(v.trim()) == 2
+
+def test_VectorLazy():
+    x, y, z = Vector((1, 2, 3)), Vector((4, 5)), Vector((Fraction(1, 3),))
+    e = 2*x.lazy() + 3*y.lazy() - z
+    assert isinstance(e, VectorLazy)
+    assert e.compute() == 2*x + 3*y - z
+    assert e.data == (2*x + 3*y - z).data
+    assert (z - x.lazy()).data == (z - x).data
+    assert (z + x.lazy()/2).data == (z + x/2).data
+    assert (-(x.lazy() % 2) + y).compute(factory=list) == [-1+4, 0+5, -1]
+    assert (x.lazy() // 2 - y).data == vecsub(vecfloordiv(x.data, 2), y.data)
+    assert VectorLazy().compute() == Vector()
+    #long chains built in a loop
+    vs = [Vector(tuple(range(k%5))) for k in range(1000)]
+    e, r = vs[0].lazy(), vs[0]
+    for k, v in enumerate(vs[1:]):
+        e, r = (e + v, r + v) if k%3 else (e - v, r - v)
+    assert e.data == r.data
+    assert (x.lazy() - (y + e)).data == (x - (y + r)).data
+    #scaled accumulation & right nested chains
+    e, r = x.lazy(), x
+    for k in range(300):
+        e, r = 0.5*e + y, 0.5*r + y
+    assert e.data == r.data
+    e, r = x.lazy(), x
+    for k in range(300):
+        e, r = y - e, y - r
+    assert e.data == r.data
+    e, r = z.lazy(), z
+    for k in range(5000):
+        e, r = e + x, r + x
+    assert e.data == r.data
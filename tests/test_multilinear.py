@@ -1,4 +1,5 @@
 from vector import *
+from fractions import Fraction
 import numpy as np
 
 
@@ -114,6 +115,27 @@ def test_tenmod():
                                                      [1, 2, 4]])
 
 
+def test_tenaxpy():
+    assert np.array_equal(tenaxpy(2, [[1, 2], [3, 4]], [5, 6, 7]), [[7, 4], [12, 8], [7, 0]])
+    assert np.array_equal(tenaxpy(2, tenzero, [1, 2]), [1, 2])
+    #the dtype comes from the tensors, like for tenadd(tenrmul(a, x), y)
+    for a in (Fraction(1, 2), 0.5):
+        assert np.array_equal(tenaxpy(a, [1, 2], [1]), tenadd(tenrmul(a, [1, 2]), [1]))
+    assert tenaxpy(2**70, [1, 2], [1]).tolist() == [2**70+1, 2**71]
+    assert tenaxpy(2, [1, 2], [1]).dtype == np.int64
+    assert tenaxpy(2, [1, 2], [1], dtype=np.float32).dtype == np.float32
+    assert tenaxpy(2, [2**62], [1], checked=True).tolist() == [2**63+1]
+    assert tenaxpy(2, [2**61], [1], checked=True).dtype == np.int64
+
+def test_tenlincomb():
+    assert np.array_equal(tenlincomb((2, -1), ([[1, 2], [3, 4]], [5, 6, 7])),
+                          tensub(tenrmul(2, [[1, 2], [3, 4]]), [5, 6, 7]))
+    assert np.array_equal(tenlincomb((), ()), tenzero)
+    assert tenlincomb([Fraction(1, 2), 2**70], [[1, 2], [1]]).tolist() == [2**70+Fraction(1, 2), 1]
+    assert tenlincomb([2, 3], [[2**62], [2**62, 1]], checked=True).tolist() == [5*2**62, 3]
+    assert tenlincomb([1, 1], [[1], [1]], checked=True, dtype=np.int32).dtype == np.int32
+
+
 #elementwise
 def test_tenhadamardmin():
     a = np.array([1, 2])
@@ -137,4 +159,59 @@ def test_tenhadamardmax():
         tenhadamardmax(a, b, c),
         np.array([[7, 8, 9],
                   [5, 6, 0]])
-    )
\ No newline at end of file
+    )
+
+def test_tenhadamardminmaxkey():
+    a = np.array([1, -2])
+    b = np.array([[-3, 4],
+                  [5, 2]])
+    c = np.array([[7, -8, 9]])
+    for key in (abs, np.abs):
+        assert np.array_equal(
+            tenhadamardmin(a, b, c, key=key),
+            np.array([[1, 4, 9],
+                      [-2, 2, 0]])
+        )
+        assert np.array_equal(
+            tenhadamardmax(a, b, c, key=key),
+            np.array([[7, -8, 9],
+                      [5, 2, 0]])
+        )
+    #ties keep the first
+    assert np.array_equal(tenhadamardmin([2, 3], [-2, -3], key=abs), [2, 3])
+    assert tenhadamardmax(key=abs) == 0
+
+
+#dtype
+def test_tendtype():
+    a = np.array([[1, 2],
+                  [3, 4]])
+    assert tenadd(a, tenzero).dtype == tensub(tenzero, a).dtype == np.int64
+    assert tenadd([1, 2], [3], dtype=np.float32).dtype == np.float32
+    assert tenhadamard([1, 2], [3, 4], dtype=complex).dtype == complex
+    #operands are not modified
+    tenhadamard(a, a)
+    assert np.array_equal(a, [[1, 2], [3, 4]])
+
+def test_tenchecked():
+    big = np.array([2**62, 1])
+    assert tenadd(big, big, checked=True).tolist() == [2**63, 2]
+    assert tenhadamard(big, [4, 3], checked=True).tolist() == [2**64, 3]
+    m = np.iinfo(np.int64).min
+    assert tensub([m, 0], [1, 4], checked=True).tolist() == [-2**63-1, -4]
+    assert tenhadamard([m], [-1], checked=True).tolist() == [2**63]
+    #no overflow keeps the native dtype
+    assert tenadd(big, -big, checked=True).dtype == np.int64
+    assert tenhadamard(big, [1, 3], checked=True).dtype == np.int64
+
+
+#algebra
+def test_tenconv():
+    #(1+2x)(3+y) = 3+6x+y+2xy
+    assert np.array_equal(tenconv([1, 2], [[3, 1]]), [[3, 1], [6, 2]])
+    assert np.array_equal(tenconv(tenzero, [1, 2]), [0, 0])
+    s, t = np.random.rand(5, 3, 4), np.random.rand(2, 7)
+    assert np.allclose(tenconv(s, t, fft=True), tenconv(s, t, fft=False))
+    s, t = s + 1j*np.random.rand(5, 3, 4), t.astype(np.float32)
+    r = tenconv(s, t, fft=True)
+    assert r.dtype == complex and np.allclose(r, tenconv(s, t, fft=False))
@@ -72,6 +72,23 @@ def test_tenmod():
     assert tensmod({(1, 2, 3):5}, 4) == {(1, 2, 3):5%4}
 
 
+def test_tensaxpy():
+    assert tensaxpy(2, {(1, 2):3}, {(1, 2):4, (4,):5}) == {(1, 2):10, (4,):5}
+
+def test_tensiaxpy():
+    y = {(1, 2):4}
+    assert tensiaxpy(y, 2, {(1, 2):3, (0,):1}) is y
+    assert y == {(1, 2):10, (0,):2}
+
+def test_tenslincomb():
+    assert tenslincomb((2, -1), ({(1, 2):3}, {(1, 2):4, (4,):5})) == {(1, 2):2, (4,):-5}
+
+def test_tensilincomb():
+    s = {():1}
+    assert tensilincomb(s, (2,), ({():3},)) is s
+    assert s == {():7}
+
+
 #elementwise
 def test_tenshadamard():
     assert tenshadamard() == tenszero
@@ -89,3 +106,42 @@ def test_tensfloordiv():
 def test_tenshadamardmod():
     assert tenshadamardmod(tenszero, {(1, 2, 3):4}) == tenszero
     assert tenshadamardmod({(1, 2, 3):5}, {(1, 2, 3):4, (4, 5):6}) == {(1, 2, 3):5%4}
+
+
+#COO
+def test_tenstoc():
+    t = {():1, (1, 2):3.5, (0, 0, 4):-2}
+    c = tenstoc(t)
+    assert c.indices.shape == (3, 3) and tensctos(c) == t
+    assert TensorSparse(c).data == t
+    assert c[(1, 2)] == c[(1, 2, 0)] == 3.5 and c[(5,)] == 0
+    assert (0, 0, 4) in c and (4,) not in c
+    assert tenscrank(c) == 3 and tenscdim(c) == (2, 3, 5)
+    assert tensctos(tenstoc(tenszero)) == tenszero
+    #duplicate indices are added
+    c = TensorSparseCOO([[1, 0], [0, 1], [1, 0]], [1, 2, 3])
+    assert tensctos(c) == {(1,):4, (0, 1):2}
+
+def test_tenscarithmetic():
+    s, t = {(1, 2, 3):4, (1,):1}, {(1, 2, 3):5, (4, 5):6}
+    S, T = tenstoc(s), tenstoc(t)
+    assert tensctos(tenscadd(S, T)) == tensadd(s, t)
+    assert tensctos(S - T) == tenssub(s, t)
+    assert tensctos(-S) == tensneg(s)
+    assert tensctos(2*S) == tensctos(S*2) == tensrmul(2, s)
+    assert tensctos(S.hadamard(T)) == tenshadamard(s, t)
+    assert tensctos(S >> (1, 0, 0, 2)) == {(2, 2, 3, 2):4, (2, 0, 0, 2):1}
+    assert tensctos(S << (1, 1)) == {(0, 1, 3):4}
+    assert S == S + tenstoc({(7,):0}) and not S == T
+    assert tensctos(tenstoc({(1, 5):0, (2,):1}).trim()) == {(2,):1}
+
+
+#algebra
+def test_tensconv():
+    #(1+2x)(3+y) = 3+6x+y+2xy
+    assert tensconv({():1, (1,):2}, {():3, (0, 1):1}) == {():3, (1,):6, (0, 1):1, (1, 1):2}
+    assert tensconv({(1, 1):1, (2,):1}, {(1, 1):1, (2,):-1}) == {(2, 2):1, (3, 1):0, (4,):-1}
+    assert tensconv({}, {(1,):1}) == {}
+    assert (TensorSparse({(1,):2}) @ TensorSparse({(0, 1):3})).data == {(1, 1):6}
+    s, t = tensrand(3, 2, 4), tensrand(2, 5)
+    assert tensconv(s, t).keys() == tensadd(*(tensrshift({j:si*tj for j, tj in t.items()}, i) for i, si in s.items())).keys()
@@ -0,0 +1,20 @@
+from vector import *
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+
+
+
+def test_parmap():
+    argss = [((Fraction(i, 3), 1), (2, Fraction(1, i+1))) for i in range(50)]
+    assert parmap(vecdot, argss, chunksize=7, max_workers=2) == [vecdot(*args) for args in argss]
+    assert parmap(vecdot, [], max_workers=2) == []
+
+def test_parimap():
+    with ThreadPoolExecutor(2) as executor:
+        argss = (((i,), (i, 1)) for i in count())
+        r = list(islice(parimap(vecadd, argss, chunksize=3, executor=executor, prefetch=2), 10))
+        assert r == [(2*i, 1) for i in range(10)]
+        argss = [({0:i}, {1:i}) for i in range(20)]
+        assert list(parimap(vecsadd, argss, chunksize=4, executor=executor)) \
+                == [vecsadd(*args) for args in argss]
@@ -1,3 +1,4 @@
+import pytest
 from vector import *
 import numpy as np
 from numpy.polynomial.polynomial import polyadd, polysub
@@ -10,11 +11,16 @@ def test_vecnpzero():
     assert np.array_equal(vecnpzero(1), [[0]])
     assert np.array_equal(vecnpzero(2), [[0],
                                          [0]])
+    assert vecnpzero(dtype=np.int64).dtype == np.int64
+    #object zeros don't promote native vectors
+    assert vecnpadd(vecnpzero(), [1, 2]).dtype == np.int64
+    assert vecnpsub([[1.0], [2.0]], vecnpzero(2)).dtype == np.float64
 
 def test_vecnpbasis():
     assert np.array_equal(vecnpbasis(2, 3), [0, 0, 3])
     assert np.array_equal(vecnpbasis(4, 3, 2), [[0, 0, 0, 0, 3],
                                                 [0, 0, 0, 0, 3]])
+    assert vecnpbasis(1, 2, dtype=float).dtype == float
 
 def test_vecnprand():
     assert vecnprand(2).shape == (2,)
@@ -37,6 +43,10 @@ def test_vecnpeq():
     assert np.array_equal(vecnpeq([[1, 2],
                                    [3, 4]], [[1, 2, 0],
                                              [3, 4, 1]]), [True, False])
+    assert vecnpeq([], [0, 0]) and not vecnpeq([], [0, 1])
+    for _ in range(100):
+        v, w = np.random.randint(0, 2, (5, np.random.randint(0, 6))), np.random.randint(0, 2, np.random.randint(0, 6))
+        assert np.array_equal(vecnpeq(v, w), [veceq(vi, w) for vi in v])
 
 def test_vecnptrim():
     assert np.array_equal(vecnptrim([0, 0]), [0])
@@ -47,6 +57,14 @@ def test_vecnptrim():
     assert np.array_equal(vecnptrim([[1, 2, 3e-10, 4e-12],
                                      [5, 6, 7    , 8e-13]]), [[1, 2, 3e-10],
                                                               [5, 6, 7]])
+    v, lengths = vecnptrim([[1, 0, 0],
+                            [1, 2, 1e-10],
+                            [0, 0, 0]], lengths=True)
+    assert np.array_equal(v, [[1, 0],
+                              [1, 2],
+                              [0, 0]]) and np.array_equal(lengths, [1, 2, 1])
+    assert vecnptrim([0, 3, 0], lengths=True)[1] == 2
+    assert np.isnan(vecnptrim([1, np.nan, 0])[-1])
 
 
 #Hilbert space
@@ -70,6 +88,28 @@ def test_vecnpdot():
                                     [3, 4]], [[5, 6,  7],
                                               [8, 9, 10]]), [17, 60])
 
+def test_vecnpsummation():
+    v = np.array([[1e16, 1.0, -1e16]*3,
+                  [1, 2, 3]*3])
+    for summation, r in (('naive', 0), ('pairwise', 0), ('kahan', 3), ('exact', 3)):
+        assert np.array_equal(vecnpdot(v, np.ones(9), summation=summation), [r, 18])
+    assert np.array_equal(vecnpabs([[3, 4], [5, 12]], summation='kahan'), [5, 13])
+    assert vecnpabsq([1j, 2], summation='exact') == 5
+    #infinite sums stay infinite, no inf-inf compensation
+    with np.errstate(all='raise'):
+        assert vecnpdot(np.array([np.inf, 1.0]), np.ones(2), summation='kahan') == np.inf
+        assert np.array_equal(vecnpdot(np.array([[np.inf, 1], [1, 2]]), np.ones(2), summation='kahan'), [np.inf, 3])
+
+def test_vecnpgram():
+    vs = [np.array([1, 2]), np.array([3j, 4, 5]), np.array([1])]
+    ws = np.array([[1, 1], [0, 2]])
+    for conjugate in (False, True):
+        assert np.array_equal(vecnpgram(vs, conjugate=conjugate), vecgram(vs, conjugate=conjugate))
+        assert np.array_equal(vecnpgram(vs, ws, conjugate=conjugate), vecgram(vs, ws, conjugate=conjugate))
+    assert np.array_equal(vecnpgram(vs, triangular=True), np.triu(vecnpgram(vs)))
+    tiles = {(i, j):t for i, j, t in vecnpgram(vs, block=2)}
+    assert np.array_equal(tiles[2, 0], vecnpgram(vs)[2:, :2])
+
 
 #vector space
 def test_vecnppos():
@@ -129,6 +169,66 @@ def test_vecnpsub():
         assert np.allclose(vecnpsub(v, w),
                 [polysub(vi, wi) for vi, wi in zip(v, w)])
 
+def test_vecnpraggedadd():
+    assert np.array_equal(vecnpraggedadd([[1, 2], [3], [], [4, 5, 6]]), [8, 7, 6])
+    assert np.array_equal(vecnpraggedadd(np.array([[1, 2, 9],
+                                                   [3, 9, 9],
+                                                   [4, 5, 6]]), lengths=[2, 1, 3]), [8, 7, 6])
+    assert np.array_equal(vecnpraggedadd([]), vecnpzero())
+    out = np.full(5, 9)
+    assert vecnpraggedadd([[1, 2], [3]], out=out) is out
+    assert np.array_equal(out, [4, 2, 0, 0, 0])
+    with pytest.raises(ValueError):
+        vecnpraggedadd([[1, 2], [3]], lengths=[2, 1])
+    with pytest.raises(ValueError):
+        vecnpraggedadd(np.zeros((2, 3)), lengths=[2, 4])
+    for _ in range(100):
+        vs = [np.random.normal(size=np.random.randint(0, 20)) for _ in range(np.random.randint(1, 20))]
+        if any(len(v) for v in vs):
+            assert np.allclose(vecnpraggedadd(vs), vecnpadd(*vs))
+            assert np.allclose(vecnpraggedsub(vs[0], vs[1:]), vecnpsub(vs[0], vecnpadd(*vs[1:])) if vs[1:] else vs[0])
+
+def test_vecnpraggedsub():
+    assert np.array_equal(vecnpraggedsub([1, 2], [[3, 5, 7], [1]]), [-3, -3, -7])
+    out = np.zeros(4, dtype=int)
+    assert vecnpraggedsub([1, 2], np.array([[1, 1], [1, 1]]), lengths=[2, 0], out=out) is out
+    assert np.array_equal(out, [0, 1, 0, 0])
+
+def test_vecnpchecked():
+    big = 2**62
+    v, w = np.array([[big, 1], [1, 1]]), np.array([[big, 1], [2, 3]])
+    r = vecnpadd(v, w, checked=True)
+    assert r.dtype == object and r.tolist() == [[2*big, 2], [3, 4]]
+    assert vecnpadd(v, w)[0, 0] < 0 #wraps around
+    assert vecnpadd(np.array([1, 2]), [3], checked=True).dtype == np.int64
+    assert vecnpsub([-big, 0], [big+big-1, 1], checked=True).tolist() == [-3*big+1, -1]
+    assert vecnpsub([-big], [big], checked=True).dtype == np.int64 #-2**63 fits
+    assert vecnpmul(4, v, checked=True).tolist() == [[4*big, 4], [4, 4]]
+    assert vecnpdot([big, big], [2, 1], checked=True) == 3*big
+    assert vecnpdot(v, w, checked=True).tolist() == [big*big+1, 5]
+    assert vecnpadd([1, 2], [3], dtype=np.int8).dtype == np.int8
+    with pytest.raises(OverflowError):
+        vecnpadd(v, w, out=np.zeros((2, 2), dtype=np.int64), checked=True)
+    out = np.zeros((2, 3), dtype=object)
+    assert vecnpadd(v, w, out=out, checked=True) is out
+    assert out.tolist() == [[2*big, 2, 0], [3, 4, 0]]
+
+def test_vecnpworkers():
+    v, w = np.random.normal(size=(1001, 17)), np.random.normal(size=(1001, 13))
+    #same kernels per row, bit identical
+    assert np.array_equal(vecnpadd(v, w, w[0], workers=4), vecnpadd(v, w, w[0]))
+    assert np.array_equal(vecnpdot(v, w, workers=3), vecnpdot(v, w))
+    assert np.array_equal(vecnpdot(v, w, summation='kahan', workers=3), vecnpdot(v, w, summation='kahan'))
+    assert np.array_equal(vecnpabs(v, workers=5), vecnpabs(v))
+    v[:,9:] = 0
+    assert np.array_equal(vecnptrim(v, workers=4), vecnptrim(v)) and vecnptrim(v, workers=4).shape == (1001, 9)
+    out = np.full((1001, 20), 9.0)
+    assert vecnpadd(v, w, out=out, workers=2) is out and np.array_equal(out, vecnpadd(v, w, out=np.zeros((1001, 20))))
+    r = 2*v
+    assert vecnpadd(v, v, out=v, workers=2) is v and np.array_equal(v, r)
+    big = np.array([[2**62], [1]]*3)
+    assert vecnpadd(big, big, checked=True, workers=2).tolist() == [[2**63], [2]]*3
+
 def test_vecnpmul():
     assert np.array_equal(vecnpmul(5, [1, 2, 3]), [5, 10, 15])
 
@@ -146,3 +246,32 @@ def test_vecnpmod():
     assert np.array_equal(vecnpmod([[1, 10, 16],
                                     [6, 22, 39]], 5), [[1, 0, 1],
                                                        [1, 2, 4]])
+
+def test_vecnpout():
+    out = np.full(4, 9)
+    assert vecnpadd([1, 2], [3, 4, 5], out=out) is out
+    assert np.array_equal(out, [4, 6, 5, 0])
+    v = np.array([[1, 2], [3, 4]])
+    out = np.empty((2, 3), dtype=int)
+    assert np.array_equal(vecnpadd(v, [5, 6, 7], out=out), [[6, 8, 7], [8, 10, 7]])
+    assert np.array_equal(vecnpsub([1, 2], [3, 5, 7], out=out[0]), [-2, -3, -7])
+    assert np.array_equal(vecnpneg([1, 2], out=np.empty(3, dtype=int)), [-1, -2, 0])
+    assert np.array_equal(vecnpmul(5, [1, 2], out=np.empty(2, dtype=int)), [5, 10])
+    assert np.array_equal(vecnpmod([7, 8], 5, out=np.empty(2, dtype=int)), [2, 3])
+    #aliasing operands
+    v, w = np.array([1., 2.]), np.array([3., 4., 5.])
+    assert np.array_equal(vecnpadd(v, w, out=w), [4, 6, 5])
+    w = np.array([3., 4.])
+    assert np.array_equal(vecnpsub(v, w, out=w), [-2, -2])
+    with pytest.raises(ValueError):
+        vecnpadd([1, 2, 3], out=np.empty(2))
+
+def test_vecnpconv():
+    v, w = np.array([[1, 2], [3, 4]]), np.array([5, 6, 7])
+    assert np.array_equal(vecnpconv(v, w), [np.convolve(vi, w) for vi in v])
+    assert vecnpconv(v, w).dtype == np.int64
+    assert vecnpconv([], [1, 2]).shape == (0,)
+    v, w = np.random.rand(3, 100), np.random.rand(3, 80)
+    assert np.allclose(vecnpconv(v, w), [np.convolve(vi, wi) for vi, wi in zip(v, w)])
+    with pytest.raises(ValueError):
+        vecnpconv(np.zeros((2, 3)), np.zeros((3, 3)))
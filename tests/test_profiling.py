@@ -0,0 +1,27 @@
+from vector import *
+import sys
+import pytest
+
+
+
+def test_Profile():
+    with Profile() as p:
+        vecadd((1, 2), (3, 4, 5))
+        vecadd((1,), (2,), (3,))
+        vecsdot({0:1}, {0:2, 1:3})
+        with pytest.raises(ZeroDivisionError):
+            vectruediv((1,), 0)
+    assert p.stats['vecadd'].calls == 2
+    assert p.stats['vecadd'].insize == 5+3
+    assert p.stats['vecadd'].outsize == 3+1
+    assert p.stats['vecadd'].time > 0
+    assert p.stats['vecsdot'].insize == 3
+    assert 'vectruediv' not in p.stats
+    #disabled again
+    assert sys.monitoring.get_tool(Profile.TOOL_ID) is None
+    vecadd((1,), (2,))
+    assert p.stats['vecadd'].calls == 2
+    #accumulating
+    with p:
+        vecadd((1,), (2,))
+    assert p.stats['vecadd'].calls == 3
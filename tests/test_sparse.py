@@ -4,6 +4,8 @@ from itertools import islice, count
 from random import randint, random
 from operationcounter import OperationCounter, count_ops
 from collections import Counter
+import numpy as np
+import pytest
 
 
 
@@ -85,6 +87,28 @@ def test_vecsdot():
     assert vecsdot({0:1}, vecszero) == 0
     assert vecsdot({0:1, 5:2}, {0:3, 5:4, 6:5}) == 11
 
+def test_vecssummation():
+    v = {i:x for i, x in enumerate((1e16, 1.0, -1e16) * 3)}
+    w = {i:1 for i in range(9)}
+    for summation, r in (('naive', 0.0), ('kahan', 3.0), ('exact', 3.0)):
+        assert vecsdot(v, w, summation=summation) == r
+        assert vecsdot(v, w, weights=w, summation=summation) == r
+        assert vecsodot(vecstoso(v), vecstoso(w), summation=summation) == r
+        assert vecsbdot(vecstob([v]), vecstob([w]), summation=summation).tolist() == [r]
+    assert vecsabsq({0:1j, 1:2, 5:3j}, conjugate=True, summation='pairwise') == 14
+    assert vecsbabsq(vecstob([{0:3, 2:4}]), summation='exact').tolist() == [25]
+
+def test_vecsgram():
+    vs = [{0:1, 2:3j}, {}, {2:2, 5:1}]
+    ws = [{0:2}, {2:1, 5:4}]
+    for conjugate in (False, True):
+        assert vecsgram(vs, conjugate=conjugate) == tuple(tuple(vecsdot(v, w, conjugate=conjugate) for w in vs) for v in vs)
+    weights = {i:i+1 for i in range(6)}
+    assert vecsgram(vs, ws, weights=weights) == tuple(tuple(vecsdot(v, w, weights=weights) for w in ws) for v in vs)
+    assert vecsgram(vs, triangular=True)[2] == (0, 0, 5)
+    tiles = list(vecsgram(vs, block=2))
+    assert [(i, j) for i, j, _ in tiles] == [(0, 0), (0, 2), (2, 0), (2, 2)]
+
 
 #vector space
 def test_vecspos():
@@ -135,6 +159,25 @@ def test_vecsdivmod():
     assert vecsdivmod(v, a) == (vecsfloordiv(v, a), vecsmod(v, a))
 
 
+def test_vecsaxpy():
+    assert vecsaxpy(2, {0:1, 2:3}, {0:4, 1:5}) == {0:6, 1:5, 2:6}
+    assert vecsaxpy(2, vecszero, vecszero) == vecszero
+
+def test_vecsiaxpy():
+    y = {0:4, 1:5}
+    assert vecsiaxpy(y, 2, {0:1, 2:3}) is y
+    assert y == {0:6, 1:5, 2:6}
+
+def test_vecslincomb():
+    assert vecslincomb((), ()) == vecszero
+    assert vecslincomb((2, 3, -1), ({0:1, 2:3}, {0:4, 1:5}, {5:6})) == {0:14, 1:15, 2:6, 5:-6}
+
+def test_vecsilincomb():
+    v = {0:1}
+    assert vecsilincomb(v, (2, 3), ({0:1, 2:3}, {1:4})) is v
+    assert v == {0:3, 1:12, 2:6}
+
+
 #elementwise
 def test_vecshadamard():
     assert vecshadamard() == vecszero
@@ -180,3 +223,139 @@ def test_vecshadamardmax():
     w = {0: 5, 1:2, 2:3, 3:6, 4: 1, 5:9}
     assert vecshadamardmax(u, v, w) == {0:10, 1:6, 2:7, 3:9, 4:10, 5:9}
     assert vecshadamardmax(u) == u
+
+
+
+#batch
+def test_vecstob():
+    vs = [{}, {3:1.5, 0:2.5}, {1:2**70, 4:0}, {2:1j}]
+    b = vecstob(vs)
+    assert len(b) == 4
+    assert b.indices.tolist() == [0, 3, 1, 4, 2]
+    assert vecbtos(b) == vs
+    assert type(vecbtos(b)[2][1]) is int
+    assert vecstob([{0:1.0}, {1:2.0}]).values.dtype == np.float64
+    assert vecstob([{0:1j}]).values.dtype == np.complex128
+    assert vecstob([{0:1, 1:1.0}]).values.dtype == object
+    assert vecbtos(vecstob([])) == []
+
+def test_vecsbadd():
+    us = [{0:1, 2:3}, {}, {5:1}]
+    vs = [{0:2, 1:4}, {1:1}, {}]
+    ws = [{2:1}, {1:2, 7:3}, {5:-1}]
+    assert vecbtos(vecsbadd(vecstob(us), vecstob(vs), vecstob(ws))) \
+            == [vecsadd(u, v, w) for u, v, w in zip(us, vs, ws)]
+    assert vecbtos(vecsbadd(vecstob(us))) == us
+    assert vecbtos(vecsbadd()) == []
+    with pytest.raises(ValueError):
+        vecsbadd(vecstob(us), vecstob(vs[:2]))
+
+def test_vecsbdot():
+    vs = [{0:1, 2:3}, {}, {5:1j, 6:2}]
+    ws = [{0:2, 1:4, 2:5}, {1:1}, {5:1j, 7:3}]
+    assert vecsbdot(vecstob(vs), vecstob(ws)).tolist() \
+            == [vecsdot(v, w) for v, w in zip(vs, ws)]
+    assert vecsbdot(vecstob(vs), vecstob(ws), conjugate=True).tolist() \
+            == [vecsdot(v, w, conjugate=True) for v, w in zip(vs, ws)]
+    weights = {i:i+1 for i in range(8)}
+    assert vecsbdot(vecstob(vs), vecstob(ws), weights=weights).tolist() \
+            == [vecsdot(v, w, weights=weights) for v, w in zip(vs, ws)]
+
+def test_vecsbabsq():
+    vs = [{0:1.5, 2:3.0}, {}, {5:1j, 6:2j}]
+    assert vecsbabsq(vecstob(vs)).tolist() == [vecsabsq(v) for v in vs]
+    assert vecsbabsq(vecstob(vs), conjugate=True).tolist() \
+            == [vecsabsq(v, conjugate=True) for v in vs]
+
+def test_vecsbtrim():
+    vs = [{0:1, 1:0}, {2:0.1, 3:-2}, {}]
+    assert vecbtos(vecsbtrim(vecstob(vs))) == [vecstrim(v) for v in vs]
+    assert vecbtos(vecsbtrim(vecstob(vs), tol=0.5)) == [vecstrim(v, tol=0.5) for v in vs]
+
+def test_vecsbhadamard():
+    us = [{0:1, 1:2, 2:3}, {0:1}, {}]
+    vs = [{0:4, 1:5}, {1:1}, {0:1}]
+    ws = [{0:6, 1:7, 2:8, 3:9}, {0:1, 1:1}, {0:1}]
+    assert vecbtos(vecsbhadamard(vecstob(us), vecstob(vs), vecstob(ws))) \
+            == [vecshadamard(u, v, w) for u, v, w in zip(us, vs, ws)]
+
+
+
+#sorted
+def test_vecstoso():
+    v = {3:1, 0:2.5, 7:1j}
+    assert vecstoso(v) == ([0, 3, 7], [2.5, 1, 1j])
+    assert vecsotos(vecstoso(v)) == v
+    assert vecstoso(vecszero) == ([], [])
+
+def test_vecsoadd():
+    u, v, w = {0:1, 2:3}, {0:2, 1:4, 5:6}, {2:-3, 9:1}
+    assert vecsotos(vecsoadd()) == vecsadd()
+    assert vecsotos(vecsoadd(vecstoso(u))) == vecsadd(u)
+    assert vecsotos(vecsoadd(vecstoso(u), vecstoso(v), vecstoso(w))) == vecsadd(u, v, w)
+
+def test_vecsosub():
+    v, w = {0:1, 2:3, 7:1}, {0:2, 1:4, 2:3}
+    assert vecsotos(vecsosub(vecstoso(v), vecstoso(w))) == vecssub(v, w)
+    assert vecsotos(vecsosub(vecstoso(w), vecstoso(v))) == vecssub(w, v)
+
+def test_vecsodot():
+    v, w = {0:1, 2:3j, 7:1}, {0:2, 1:4, 2:3, 8:1}
+    weights = {i:i+1 for i in range(10)}
+    assert vecsodot(vecstoso(v), vecstoso(w)) == vecsdot(v, w)
+    assert vecsodot(vecstoso(v), vecstoso(w), conjugate=True) == vecsdot(v, w, conjugate=True)
+    assert vecsodot(vecstoso(v), vecstoso(w), weights=weights) == vecsdot(v, w, weights=weights)
+    assert vecsodot(vecstoso(vecszero), vecstoso(w), zero=0.0) == 0.0
+
+def test_vecsohadamard():
+    u, v, w = {0:1, 1:2, 2:3}, {0:4, 1:5}, {0:6, 1:7, 2:8, 3:9}
+    assert vecsotos(vecsohadamard()) == vecshadamard()
+    assert vecsotos(vecsohadamard(vecstoso(u), vecstoso(v), vecstoso(w))) == vecshadamard(u, v, w)
+
+def test_vecsohadamardmin():
+    u = {0: 3, 1:6, 2:1}
+    v = {0:10, 1:3, 2:7, 3:9, 4:10}
+    w = {0: 5, 1:2, 2:3, 3:6, 4: 1, 5:9}
+    assert vecsotos(vecsohadamardmin(vecstoso(u), vecstoso(v), vecstoso(w))) == vecshadamardmin(u, v, w)
+
+def test_vecsohadamardmax():
+    u = {0: 3, 1:6, 2:1}
+    v = {0:10, 1:3, 2:7, 3:9, 4:10}
+    w = {0: 5, 1:2, 2:3, 3:6, 4: 1, 5:9}
+    assert vecsotos(vecsohadamardmax(vecstoso(u), vecstoso(v), vecstoso(w))) == vecshadamardmax(u, v, w)
+
+def test_VectorSparseSorted():
+    v, w = VectorSparse({0:1, 2:3}), VectorSparse({2:4, 5:6})
+    s, t = VectorSparseSorted(v), VectorSparseSorted(w)
+    assert VectorSparse(s).data == v.data
+    assert VectorSparse(s+t).data == (v+w).data
+    assert VectorSparse(s-t).data == (v-w).data
+    assert s.dot(t) == 12
+    assert s[2] == 3 and s[1] == 0 and 2 in s and 1 not in s
+
+def test_VectorSparseIndex():
+    index = VectorSparseIndex({'a':{0:1, 1:2}, 'b':{1:3}, 'c':{2:1}})
+    assert index.topk({1:1}, 2) == [('b', 3), ('a', 2)]
+    assert index.topk({1:1}, 5) == [('b', 3), ('a', 2), ('c', 0)]
+    def brute(vs, q, k, cosine=False):
+        vs = {key:v for key, v in vs.items() if not cosine or vecsabs(v)}
+        score = lambda v: vecsdot(q, v)/(vecsabs(q)*vecsabs(v)) if cosine else vecsdot(q, v)
+        order = {key:i for i, key in enumerate(vs)}
+        return sorted(((key, score(v)) for key, v in vs.items()), key=lambda t: (-t[1], order[t[0]]))[:k]
+    vs = {i:{randint(0, 30):random()-0.3 for _ in range(randint(0, 6))} for i in range(200)}
+    index = VectorSparseIndex(vs)
+    for i in range(0, 200, 3): #delete & reinsert
+        index.delete(i)
+        del vs[i]
+    for i in range(0, 200, 7): #replaced vectors move to the end
+        vs.pop(i, None)
+        vs[i] = {randint(0, 30):random() for _ in range(randint(1, 6))}
+        index.insert(i, vs[i])
+    assert len(index) == len(vs) and 3 not in index and 7 in index
+    for _ in range(20):
+        q = {randint(0, 30):random()-0.3 for _ in range(randint(1, 5))}
+        for k in (1, 5, 300):
+            assert index.topk(q, k) == brute(vs, q, k)
+            assert index.topk(q, k, cosine=True) == brute(vs, q, k, cosine=True)
+    ints = {i:{randint(0, 10):randint(-5, 5) for _ in range(3)} for i in range(50)}
+    assert VectorSparseIndex(ints).topk({1:2, 3:-1}, 10) == brute(ints, {1:2, 3:-1}, 10)
@@ -1,6 +1,9 @@
 from .dense import *
 from .sparse import *
 from .parallelised import *
+from .parallel import *
+from .aio import *
 from .multilinear import *
 from .multilinear_sparse import *
 from .util import *
+from .profiling import *
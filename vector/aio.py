@@ -0,0 +1,180 @@
+"""Asynchronous (`asyncio`) reductions over streams of vectors.
+
+```python
+>>> import asyncio
+>>> from vector import Accumulator
+>>> async def source():
+...     for i in range(3):
+...         yield {i:1}
+>>> asyncio.run(Accumulator().feed(source()))
+{0: 1, 1: 1, 2: 1}
+```
+
+Vectors arriving from asynchronous producers (network, disk, queues) are
+reduced as they come, nothing has to be buffered before the first addition.
+Sources can be asynchronous or ordinary iterables.
+
+Cheap operations are applied on the event loop directly. With a `chunk`
+size the vectors are reduced in batches by an executor (default: the loop's
+thread pool), so the event loop isn't blocked. For pure Python coefficients,
+which hold the GIL, pass a `ProcessPoolExecutor` explicitly. The batches are
+reduced in stream order, results don't depend on the executor.
+
+Sources are pulled lazily, a producer can't run ahead of the reduction
+(backpressure). With `prefetch` up to that many batches are collected ahead
+while the previous one is being reduced.
+"""
+
+import asyncio
+from functools import partial
+from iteration import sum_default
+from .sparse.vectorspace import vecsiadd
+from .sparse.hilbertspace import vecsdot, vecsabsq
+from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Mapping
+
+
+
+__all__ = ('aiochunks', 'Accumulator', 'aiovecsdot', 'aiovecsabsq')
+
+
+
+async def _aiter(source):
+    """Yield from an asynchronous or ordinary iterable."""
+    if isinstance(source, AsyncIterable):
+        async for x in source:
+            yield x
+    else:
+        for x in source:
+            yield x
+
+async def aiochunks(source:AsyncIterable|Iterable, size:int, prefetch:int=0) -> AsyncIterator[list]:
+    """Yield the items of `source` in lists of `size` (the last may be shorter).
+    
+    Without `prefetch` the next chunk is only collected when it is asked
+    for. Otherwise a task collects up to `prefetch` chunks ahead into a
+    bounded queue, and waits while it is full.
+    """
+    if size < 1:
+        raise ValueError(f'chunk size must be positive, got {size}')
+    if not prefetch:
+        chunk = []
+        async for x in _aiter(source):
+            chunk.append(x)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    
+    queue, done, error = asyncio.Queue(prefetch), object(), None
+    async def produce():
+        nonlocal error
+        try:
+            async for chunk in aiochunks(source, size):
+                await queue.put(chunk)
+        except Exception as e:
+            error = e
+        await queue.put(done)
+    task = asyncio.create_task(produce())
+    try:
+        while (chunk := await queue.get()) is not done:
+            yield chunk
+        if error is not None:
+            raise error
+    finally:
+        task.cancel()
+
+
+
+def _sumchunk(f, chunk, zero):
+    """Return the sum of `f` over a chunk."""
+    return sum_default(map(f, chunk), default=zero)
+
+async def _reduce(source, f, zero, chunk, executor, prefetch):
+    """Return the sum of `f` over the source, in chunks by an executor if `chunk`."""
+    r = zero
+    if chunk is None:
+        async for v in _aiter(source):
+            r = r + f(v)
+        return r
+    loop = asyncio.get_running_loop()
+    async for c in aiochunks(source, chunk, prefetch):
+        r = r + await loop.run_in_executor(executor, _sumchunk, f, c, zero)
+    return r
+
+
+
+class Accumulator:
+    """Running sum of a stream of vectors.
+    
+    By default of sparse vectors (`dict`s added by
+    [`vecsiadd`][vector.sparse.vectorspace.vecsiadd]), for dense vectors
+    start with a `list` and [`veciadd`][vector.dense.vectorspace.veciadd]:
+    
+    ```python
+    >>> acc = Accumulator([], veciadd)
+    ```
+    """
+    __slots__ = ('value', 'add')
+    
+    def __init__(self, value:Any=None, add:Callable[...,Any]=vecsiadd):
+        self.value = {} if value is None else value
+        self.add = add
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.value!r})'
+    
+    def iadd(self, *vs:Any) -> 'Accumulator':
+        """Add vectors to the sum."""
+        self.value = self.add(self.value, *vs)
+        return self
+    
+    async def feed(self, source:AsyncIterable|Iterable, chunk:int|None=None, executor=None, prefetch:int=0) -> Any:
+        """Add all vectors of `source` and return the sum.
+        
+        With `chunk` the vectors are summed in batches of that size by the
+        `executor` (into a new empty vector of the sum's type), the batch sums
+        are added on the event loop.
+        """
+        if chunk is None:
+            async for v in _aiter(source):
+                self.iadd(v)
+            return self.value
+        loop = asyncio.get_running_loop()
+        async for c in aiochunks(source, chunk, prefetch):
+            self.iadd(await loop.run_in_executor(executor, self.add, type(self.value)(), *c))
+        return self.value
+
+
+
+async def aiovecsdot(vs:AsyncIterable|Iterable, w:Mapping[int,Any], conjugate:bool=False, zero:Any=0, chunk:int|None=None, executor=None, prefetch:int=0) -> Any:
+    r"""Return the inner product of a sparse vector given in pieces.
+    
+    $$
+        \left<\sum_k\vec{v}_k\mid\vec{w}\right>=\sum_k\left<\vec{v}_k\mid\vec{w}\right>
+    $$
+    
+    The pieces $\vec{v}_k$ of the first vector arrive from `vs` (they may
+    overlap), by linearity they are reduced one by one with
+    [`vecsdot`][vector.sparse.hilbertspace.vecsdot] without being
+    summed up. `chunk`, `executor` & `prefetch` like in
+    [`Accumulator.feed`][vector.aio.Accumulator.feed].
+    """
+    return await _reduce(vs, partial(vecsdot, w=w, conjugate=conjugate, zero=zero), zero, chunk, executor, prefetch)
+
+async def aiovecsabsq(vs:AsyncIterable|Iterable, conjugate:bool=False, zero:Any=0, chunk:int|None=None, executor=None, prefetch:int=0) -> Any:
+    r"""Return the sum of absolute squares of a sparse vector given in pieces.
+    
+    $$
+        ||\vec{v}||^2=\sum_k||\vec{v}_k||^2
+    $$
+    
+    The pieces $\vec{v}_k$ arrive from `vs` and must have disjoint indices
+    (like the chunks of [`vecchunkabsq`][vector.dense.chunked.vecchunkabsq]),
+    each is reduced by [`vecsabsq`][vector.sparse.hilbertspace.vecsabsq].
+    `chunk`, `executor` & `prefetch` like in
+    [`Accumulator.feed`][vector.aio.Accumulator.feed].
+    """
+    return await _reduce(vs, partial(vecsabsq, conjugate=conjugate, zero=zero), zero, chunk, executor, prefetch)
@@ -15,12 +15,42 @@ Two families of functions:
   (default `tuple`, configurable via `factory`).
 - **`veci...`** — accept a `MutableSequence`, mutate it in-place and return it.
 
+The arithmetic `vec...` functions also take an **`out`** `MutableSequence`
+(`list`, `array.array`, ...). The result is written into it instead, `out` is
+grown or truncated to the result length and returned. Loops reusing the same
+`out` don't allocate new containers. Fixed size buffers (`numpy.ndarray`,
+`memoryview`) are filled by `factory=vecinto(buffer)` instead.
+
 The functions are **type-independent**. However, the coefficients used must
 **support necessary scalar operations**. For instance, for vector addition,
 coefficients must be addable.
 
 For complete type safety a **zero** argument is available. Default is `int(0)`.
 
+One-dimensional **floating point buffers** (`array.array`, `memoryview` &
+`numpy.ndarray` of a double precision float or complex typecode) take a
+vectorised `numpy` fast path in the vector space operations. The results are
+the same, returned in the same container type (or through `factory`). Integer
+buffers stay on the generic path, as `numpy` integers don't detect overflows,
+and so do single precision buffers, which `numpy` would compute in single
+precision.
+
+`vecadd`, `vecsub`, `vecdot` & `vecabsq` are backed by an optional
+**C extension** (`vector.dense._cdense`), selected at import time with the pure
+Python implementations as fallback. Signatures, `factory` semantics and
+operation counts are the same.
+
+`vecconv` multiplies vectors as polynomials (`Vector.__matmul__`), by
+Karatsuba for exact & by FFT for floating point coefficients from tunable
+lengths (`vector.dense.algebra.KARATSUBA_THRESHOLD` & `FFT_THRESHOLD`) on.
+
+Vectors too large for memory are read in **chunks** (`vecreadraw`,
+`vecreadnpy`, `vecreadtext`) and reduced chunk by chunk (`vecchunkdot`,
+`vecchunkabsq`, `vecchunkabs`) with compensated summation across chunks.
+
+`Vector.lazy()` returns a **`VectorLazy`** expression: chained arithmetic like
+`a*x + b*y - z` is deferred and evaluated in a single fused pass.
+
 ## Docstring conventions
 
 Summary
@@ -51,4 +81,7 @@ from .utility import *
 from .hilbertspace import *
 from .vectorspace import *
 from .elementwise import *
+from .algebra import *
+from .chunked import *
 from .objectoriented import *
+from .lazy import *
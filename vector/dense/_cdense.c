@@ -0,0 +1,483 @@
+/* C implementation of the hottest dense vector routines.
+ *
+ * Same signatures, `factory` semantics and scalar operation counts as
+ * the pure Python versions in `vector.dense.vectorspace` &
+ * `vector.dense.hilbertspace`, which dispatch to these functions if the
+ * extension is available.
+ *
+ * Results are collected eagerly, so the Python wrappers keep `factory=iter`
+ * (lazy evaluation) on the pure Python path.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <math.h>
+
+
+
+static PyObject *builtin_iter = NULL;
+static PyObject *abc_iterator = NULL;
+
+
+
+/* utility */
+
+static PyObject *
+try_conjugate(PyObject *x)
+{
+    PyObject *conj;
+    if (PyObject_GetOptionalAttrString(x, "conjugate", &conj) < 0) {
+        return NULL;
+    }
+    if (conj == NULL || !PyCallable_Check(conj)) {
+        Py_XDECREF(conj);
+        return Py_NewRef(x);
+    }
+    PyObject *r = PyObject_CallNoArgs(conj);
+    Py_DECREF(conj);
+    return r;
+}
+
+/* `factory or (iter if isinstance(first, Iterator) else type(first))` */
+static PyObject *
+resolve_factory(PyObject *factory, PyObject *first)
+{
+    if (factory != Py_None) {
+        return Py_NewRef(factory);
+    }
+    if (first == NULL) {
+        return Py_NewRef((PyObject *)&PyTuple_Type);
+    }
+    int is_iterator = PyObject_IsInstance(first, abc_iterator);
+    if (is_iterator < 0) {
+        return NULL;
+    }
+    return Py_NewRef(is_iterator ? builtin_iter : (PyObject *)Py_TYPE(first));
+}
+
+/* Fetch the next item into `*item`. Clears `*it` when exhausted.
+ * Returns -1 on error, 0 if exhausted, 1 otherwise. */
+static int
+next_item(PyObject **it, PyObject **item)
+{
+    *item = NULL;
+    if (*it == NULL) {
+        return 0;
+    }
+    *item = PyIter_Next(*it);
+    if (*item == NULL) {
+        Py_CLEAR(*it);
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    return 1;
+}
+
+
+
+/* Inner product accumulator.
+ *
+ * Generic coefficients are summed left to right, the first product is taken
+ * as is (no addition with a start value). As long as all factors are exact
+ * `float`s the products are accumulated error-free transformed
+ * (TwoProduct & TwoSum, "Dot2" by Ogita, Rump & Oishi) for precision
+ * comparable to `math.sumprod`.
+ */
+typedef struct {
+    PyObject *acc;  /* generic accumulator, NULL if empty or in float mode */
+    int floating;   /* accumulating in s & c */
+    double s, c;
+} dotacc;
+
+static PyObject *
+dotacc_float(dotacc *d)
+{
+    /* skip a zero or non-finite correction, keeps signed zeros and infinities */
+    return PyFloat_FromDouble(d->c == 0.0 || !isfinite(d->s) ? d->s : d->s + d->c);
+}
+
+static int
+dotacc_add(dotacc *d, PyObject *a, PyObject *b)
+{
+    if ((d->acc == NULL || d->floating) && PyFloat_CheckExact(a) && PyFloat_CheckExact(b)) {
+        double x = PyFloat_AS_DOUBLE(a), y = PyFloat_AS_DOUBLE(b);
+        double p = x * y, e = fma(x, y, -p);
+        if (!d->floating) {
+            d->floating = 1;
+            d->s = p;
+            d->c = e;
+        }
+        else {
+            double s = d->s + p, bp = s - d->s;
+            d->c += ((d->s - (s - bp)) + (p - bp)) + e;
+            d->s = s;
+        }
+        d->acc = NULL;
+        return 0;
+    }
+    if (d->floating) {
+        d->acc = dotacc_float(d);
+        d->floating = 0;
+        if (d->acc == NULL) {
+            return -1;
+        }
+    }
+    PyObject *p = PyNumber_Multiply(a, b);
+    if (p == NULL) {
+        return -1;
+    }
+    if (d->acc == NULL) {
+        d->acc = p;
+        return 0;
+    }
+    PyObject *s = PyNumber_Add(d->acc, p);
+    Py_DECREF(p);
+    Py_SETREF(d->acc, s);
+    return s == NULL ? -1 : 0;
+}
+
+static PyObject *
+dotacc_result(dotacc *d, PyObject *zero)
+{
+    if (d->floating) {
+        return dotacc_float(d);
+    }
+    if (d->acc == NULL) {
+        return Py_NewRef(zero);
+    }
+    return Py_NewRef(d->acc);
+}
+
+
+
+/* vectorspace */
+
+PyDoc_STRVAR(vecadd_doc,
+"vecadd(*vs, factory=None)\n--\n\n"
+"Return the sum.\n\n"
+"C implementation of `vector.dense.vectorspace.vecadd`.");
+
+static PyObject *
+vecadd(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"factory", NULL};
+    PyObject *factory = Py_None, *empty = PyTuple_New(0);
+    if (empty == NULL) {
+        return NULL;
+    }
+    int ok = PyArg_ParseTupleAndKeywords(empty, kwargs, "|$O:vecadd", kwlist, &factory);
+    Py_DECREF(empty);
+    if (!ok) {
+        return NULL;
+    }
+
+    Py_ssize_t n = PyTuple_GET_SIZE(args);
+    factory = resolve_factory(factory, n ? PyTuple_GET_ITEM(args, 0) : NULL);
+    if (factory == NULL) {
+        return NULL;
+    }
+    PyObject *result = PyList_New(0), *r = NULL;
+    PyObject **its = PyMem_Calloc(n ? n : 1, sizeof(PyObject *));
+    if (result == NULL || its == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        its[i] = PyObject_GetIter(PyTuple_GET_ITEM(args, i));
+        if (its[i] == NULL) {
+            goto finally;
+        }
+    }
+
+    Py_ssize_t alive = n;
+    while (alive) {
+        PyObject *acc = NULL;
+        for (Py_ssize_t i = 0; i < n; i++) {
+            PyObject *x;
+            int status = next_item(&its[i], &x);
+            if (status < 0) {
+                Py_XDECREF(acc);
+                goto finally;
+            }
+            if (status == 0) {
+                continue;
+            }
+            if (acc == NULL) {
+                acc = x;
+                continue;
+            }
+            Py_SETREF(acc, PyNumber_Add(acc, x));
+            Py_DECREF(x);
+            if (acc == NULL) {
+                goto finally;
+            }
+        }
+        alive = 0;
+        for (Py_ssize_t i = 0; i < n; i++) {
+            alive += its[i] != NULL;
+        }
+        if (acc != NULL) {
+            int err = PyList_Append(result, acc);
+            Py_DECREF(acc);
+            if (err < 0) {
+                goto finally;
+            }
+        }
+    }
+    r = PyObject_CallOneArg(factory, result);
+
+finally:
+    if (its != NULL) {
+        for (Py_ssize_t i = 0; i < n; i++) {
+            Py_XDECREF(its[i]);
+        }
+        PyMem_Free(its);
+    }
+    Py_XDECREF(result);
+    Py_DECREF(factory);
+    return r;
+}
+
+PyDoc_STRVAR(vecsub_doc,
+"vecsub(v, w, factory=None)\n--\n\n"
+"Return the difference.\n\n"
+"C implementation of `vector.dense.vectorspace.vecsub`.");
+
+static PyObject *
+vecsub(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"v", "w", "factory", NULL};
+    PyObject *v, *w, *factory = Py_None;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO|O:vecsub", kwlist, &v, &w, &factory)) {
+        return NULL;
+    }
+    factory = resolve_factory(factory, v);
+    if (factory == NULL) {
+        return NULL;
+    }
+    PyObject *itv = PyObject_GetIter(v), *itw = NULL, *result = NULL, *r = NULL;
+    if (itv == NULL || (itw = PyObject_GetIter(w)) == NULL || (result = PyList_New(0)) == NULL) {
+        goto finally;
+    }
+
+    for (;;) {
+        PyObject *vi, *wi, *ri;
+        if (next_item(&itv, &vi) < 0) {
+            goto finally;
+        }
+        if (next_item(&itw, &wi) < 0) {
+            Py_XDECREF(vi);
+            goto finally;
+        }
+        if (vi == NULL && wi == NULL) {
+            break;
+        }
+        if (wi == NULL) {
+            ri = vi;
+        }
+        else if (vi == NULL) {
+            ri = PyNumber_Negative(wi);
+            Py_DECREF(wi);
+        }
+        else {
+            ri = PyNumber_Subtract(vi, wi);
+            Py_DECREF(vi);
+            Py_DECREF(wi);
+        }
+        if (ri == NULL) {
+            goto finally;
+        }
+        int err = PyList_Append(result, ri);
+        Py_DECREF(ri);
+        if (err < 0) {
+            goto finally;
+        }
+    }
+    r = PyObject_CallOneArg(factory, result);
+
+finally:
+    Py_XDECREF(itv);
+    Py_XDECREF(itw);
+    Py_XDECREF(result);
+    Py_DECREF(factory);
+    return r;
+}
+
+
+
+/* hilbertspace */
+
+/* Shared loop of vecdot & vecabsq: sum of conj(v_i)*w_i(*weights_i).
+ * `w` is NULL for the absolute square, then w_i=v_i. */
+static PyObject *
+dot(PyObject *v, PyObject *w, PyObject *weights, int conjugate, PyObject *zero)
+{
+    PyObject *itv = NULL, *itw = NULL, *itweights = NULL, *r = NULL;
+    dotacc d = {NULL, 0, 0.0, 0.0};
+    if ((itv = PyObject_GetIter(v)) == NULL
+            || (w != NULL && (itw = PyObject_GetIter(w)) == NULL)
+            || (weights != Py_None && (itweights = PyObject_GetIter(weights)) == NULL)) {
+        goto finally;
+    }
+
+    for (;;) {
+        PyObject *vi, *wi = NULL, *weighti = NULL, *a, *b;
+        int status = next_item(&itv, &vi);
+        if (status <= 0) {
+            if (status < 0) {
+                goto finally;
+            }
+            break;
+        }
+        if (w != NULL) {
+            status = next_item(&itw, &wi);
+            if (status <= 0) {
+                Py_DECREF(vi);
+                if (status < 0) {
+                    goto finally;
+                }
+                break;
+            }
+        }
+        else {
+            wi = Py_NewRef(vi);
+        }
+        if (weights != Py_None) {
+            status = next_item(&itweights, &weighti);
+            if (status <= 0) {
+                Py_DECREF(vi);
+                Py_DECREF(wi);
+                if (status < 0) {
+                    goto finally;
+                }
+                break;
+            }
+        }
+
+        a = conjugate ? try_conjugate(vi) : Py_NewRef(vi);
+        Py_DECREF(vi);
+        if (a == NULL) {
+            Py_DECREF(wi);
+            Py_XDECREF(weighti);
+            goto finally;
+        }
+        if (weighti == NULL) {
+            b = wi;
+        }
+        else {
+            /* (v_i*w_i)*weights_i */
+            PyObject *p = PyNumber_Multiply(a, wi);
+            Py_DECREF(a);
+            Py_DECREF(wi);
+            a = p;
+            b = weighti;
+            if (a == NULL) {
+                Py_DECREF(b);
+                goto finally;
+            }
+        }
+        status = dotacc_add(&d, a, b);
+        Py_DECREF(a);
+        Py_DECREF(b);
+        if (status < 0) {
+            goto finally;
+        }
+    }
+    r = dotacc_result(&d, zero);
+
+finally:
+    Py_XDECREF(itv);
+    Py_XDECREF(itw);
+    Py_XDECREF(itweights);
+    Py_XDECREF(d.acc);
+    return r;
+}
+
+PyDoc_STRVAR(vecdot_doc,
+"vecdot(v, w, weights=None, conjugate=False, zero=0)\n--\n\n"
+"Return the inner product.\n\n"
+"C implementation of `vector.dense.hilbertspace.vecdot`.");
+
+static PyObject *
+vecdot(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"v", "w", "weights", "conjugate", "zero", NULL};
+    PyObject *v, *w, *weights = Py_None, *zero = NULL;
+    int conjugate = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OO|OpO:vecdot", kwlist,
+                                     &v, &w, &weights, &conjugate, &zero)) {
+        return NULL;
+    }
+    if (zero == NULL) {
+        zero = PyLong_FromLong(0);
+        PyObject *r = zero ? dot(v, w, weights, conjugate, zero) : NULL;
+        Py_XDECREF(zero);
+        return r;
+    }
+    return dot(v, w, weights, conjugate, zero);
+}
+
+PyDoc_STRVAR(vecabsq_doc,
+"vecabsq(v, weights=None, conjugate=False, zero=0)\n--\n\n"
+"Return the sum of absolute squares.\n\n"
+"C implementation of `vector.dense.hilbertspace.vecabsq`.");
+
+static PyObject *
+vecabsq(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"v", "weights", "conjugate", "zero", NULL};
+    PyObject *v, *weights = Py_None, *zero = NULL;
+    int conjugate = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OpO:vecabsq", kwlist,
+                                     &v, &weights, &conjugate, &zero)) {
+        return NULL;
+    }
+    if (zero == NULL) {
+        zero = PyLong_FromLong(0);
+        PyObject *r = zero ? dot(v, NULL, weights, conjugate, zero) : NULL;
+        Py_XDECREF(zero);
+        return r;
+    }
+    return dot(v, NULL, weights, conjugate, zero);
+}
+
+
+
+static PyMethodDef cdense_methods[] = {
+    {"vecadd",  (PyCFunction)(void(*)(void))vecadd,  METH_VARARGS | METH_KEYWORDS, vecadd_doc},
+    {"vecsub",  (PyCFunction)(void(*)(void))vecsub,  METH_VARARGS | METH_KEYWORDS, vecsub_doc},
+    {"vecdot",  (PyCFunction)(void(*)(void))vecdot,  METH_VARARGS | METH_KEYWORDS, vecdot_doc},
+    {"vecabsq", (PyCFunction)(void(*)(void))vecabsq, METH_VARARGS | METH_KEYWORDS, vecabsq_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cdense_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cdense",
+    "C implementation of the hottest dense vector routines.",
+    -1,
+    cdense_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__cdense(void)
+{
+    PyObject *builtins = PyImport_ImportModule("builtins");
+    PyObject *abc = PyImport_ImportModule("collections.abc");
+    if (builtins == NULL || abc == NULL) {
+        Py_XDECREF(builtins);
+        Py_XDECREF(abc);
+        return NULL;
+    }
+    builtin_iter = PyObject_GetAttrString(builtins, "iter");
+    abc_iterator = PyObject_GetAttrString(abc, "Iterator");
+    Py_DECREF(builtins);
+    Py_DECREF(abc);
+    if (builtin_iter == NULL || abc_iterator == NULL) {
+        return NULL;
+    }
+    return PyModule_Create(&cdense_module);
+}
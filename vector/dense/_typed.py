@@ -0,0 +1,316 @@
+"""Vectorised kernels for homogeneous floating point buffers.
+
+The dense functions are type-independent and iterate coefficient by
+coefficient. If all operands are one-dimensional buffers
+(`array.array`, `memoryview` or `numpy.ndarray`) of double precision
+floating point or complex typecode, the same results can be computed by
+`numpy` in a single vectorised pass.
+
+Single precision (and other floating point) buffers stay on the generic
+path too: their coefficients are Python `float`s there, `numpy` would
+compute in single precision.
+
+Integer typecodes intentionally stay on the generic path:
+`numpy` integers don't detect overflows, Python `int`s do.
+
+All `typed...` functions return `NotImplemented` if the operands don't
+qualify, so the caller can fall back to the generic implementation.
+
+Reductions run blockwise, so large (e.g. memory-mapped) buffers are streamed
+without temporaries of their full size.
+"""
+
+from math import fsum
+from ..util import summate
+from array import array
+import numpy as np
+
+
+
+BLOCK = 2**16
+
+
+
+def typed(v):
+    """Return `v` as a `numpy.ndarray` view if it qualifies, else `None`.
+    
+    Qualifying are one-dimensional `array.array`s, `memoryview`s and
+    `numpy.ndarray`s with a `float64` or `complex128` dtype.
+    No data is copied.
+    """
+    if not isinstance(v, (np.ndarray, array, memoryview)):
+        return None
+    try:
+        a = np.asarray(v)
+    except (TypeError, ValueError):
+        return None
+    if a.ndim!=1 or a.dtype.char not in 'dD':
+        return None
+    return a
+
+def scalar(a):
+    """Return whether `a` is a scalar that `numpy` treats like Python does."""
+    return isinstance(a, (int, float, complex))
+
+class Into:
+    """Factory writing the coefficients into a preallocated buffer.
+    
+    Returns a view (`numpy.ndarray` or `memoryview`) of the written prefix.
+    Raises `ValueError` if the buffer is too small.
+    """
+    __slots__ = ('out',)
+    
+    def __init__(self, out):
+        self.out = out
+    
+    def view(self, n):
+        if isinstance(self.out, (np.ndarray, memoryview)):
+            return self.out[:n]
+        return memoryview(self.out)[:n]
+    
+    def write(self, r):
+        """Copy the array `r` into the buffer."""
+        out = self.out if isinstance(self.out, np.ndarray) else np.asarray(memoryview(self.out))
+        if len(r) > len(out):
+            raise ValueError('output buffer too small')
+        out[:len(r)] = r
+        return self.view(len(r))
+    
+    def __call__(self, it):
+        n = 0
+        try:
+            for n, x in enumerate(it, 1):
+                self.out[n-1] = x
+        except IndexError:
+            raise ValueError('output buffer too small') from None
+        return self.view(n)
+
+class Resize(Into):
+    """Factory overwriting a `MutableSequence` with the coefficients.
+    
+    The sequence is grown (`append`) or truncated (`del`) to the number of
+    coefficients and returned itself.
+    """
+    __slots__ = ()
+    
+    def write(self, r):
+        """Copy the array `r` into the sequence, in bulk for a matching `array.array`."""
+        out = self.out
+        if not (isinstance(out, array) and out.typecode==r.dtype.char):
+            return self(r.tolist())
+        del out[len(r):]
+        out.frombytes(bytes((len(r)-len(out)) * out.itemsize))
+        with memoryview(out) as m:
+            np.asarray(m)[:] = r
+        return out
+    
+    def __call__(self, it):
+        out, n = self.out, len(self.out)
+        i = 0
+        for i, x in enumerate(it, 1):
+            if i <= n:
+                out[i-1] = x
+            else:
+                out.append(x)
+        del out[i:]
+        return out
+
+def output(r, v, factory):
+    """Return the result array `r` in the container the generic path would.
+    
+    With a `factory` given, it is called with the coefficients as Python
+    scalars. Otherwise the type of the first operand `v` is reproduced.
+    Returns `NotImplemented` if the result can't be represented in that type
+    (e.g. complex results for an `array.array`).
+    """
+    if isinstance(factory, Into):
+        return factory.write(r)
+    if factory is not None:
+        return factory(r.tolist())
+    if isinstance(v, np.ndarray):
+        return r
+    if isinstance(v, memoryview):
+        return memoryview(r)
+    if r.dtype.char != 'd':
+        return NotImplemented
+    result = array(r.dtype.char)
+    result.frombytes(r.tobytes())
+    return result
+
+
+
+def typedunary(f, v, factory):
+    """Apply the ufunc `f` to every coefficient."""
+    a = typed(v)
+    if a is None:
+        return NotImplemented
+    return output(f(a), v, factory)
+
+def typedscalar(f, v, c, factory, reflected=False):
+    """Apply the binary ufunc `f` to every coefficient and the scalar `c`.
+    
+    Zero divisors are left to the generic path, so that they raise
+    `ZeroDivisionError` instead of returning `inf`/`nan`.
+    """
+    a = typed(v)
+    if a is None or not scalar(c) or (f in {np.divide, np.floor_divide, np.mod} and c==0):
+        return NotImplemented
+    return output(f(c, a) if reflected else f(a, c), v, factory)
+
+def typedadd(vs, factory):
+    """Return the sum with zero-padding, in the same order as the generic path."""
+    arrays = tuple(map(typed, vs))
+    if not arrays or any(a is None for a in arrays):
+        return NotImplemented
+    r = np.empty(max(map(len, arrays)), dtype=np.result_type(*arrays))
+    #the covered indices are always a prefix, initialise new ones by copy
+    #and add to already covered ones to keep the summation order
+    covered = 0
+    for a in arrays:
+        n = len(a)
+        r[covered:n] = a[covered:n]
+        np.add(r[:min(covered, n)], a[:min(covered, n)], out=r[:min(covered, n)])
+        covered = max(covered, n)
+    return output(r, vs[0], factory)
+
+def typedsub(v, w, factory):
+    """Return the difference with zero-padding."""
+    a, b = typed(v), typed(w)
+    if a is None or b is None:
+        return NotImplemented
+    r = np.empty(max(len(a), len(b)), dtype=np.result_type(a, b))
+    n = min(len(a), len(b))
+    np.subtract(a[:n], b[:n], out=r[:n])
+    r[n:len(a)] = a[n:]
+    np.negative(b[n:], out=r[n:len(b)])
+    return output(r, v, factory)
+
+
+
+def blocks(n):
+    """Yield slices partitioning `range(n)` into blocks."""
+    for k in range(0, n, BLOCK):
+        yield slice(k, min(k+BLOCK, n))
+
+def twoproduct(x, y):
+    """Return the rounded products & their rounding errors (Dekker).
+    
+    `x*y == p+e` holds exactly as long as nothing overflows.
+    """
+    def split(z):
+        c = 134217729.0 * z
+        h = c - (c - z)
+        return h, z - h
+    with np.errstate(over='ignore', invalid='ignore'):
+        p = x * y
+        (xh, xl), (yh, yl) = split(x), split(y)
+        return p, xl*yl - (((p - xh*yh) - xl*yh) - xh*yl)
+
+class Accumulator:
+    """Double-length sum of float arrays, corrected by `math.fsum`."""
+    __slots__ = ('hi', 'lo')
+    
+    def __init__(self):
+        self.hi, self.lo = 0.0, 0.0
+    
+    def add(self, *xs):
+        terms = [self.hi, self.lo]
+        for x in xs:
+            terms.extend(x.tolist())
+        self.hi = fsum(terms)
+        terms.append(-self.hi)
+        self.lo = fsum(terms)
+
+def typeddot(v, w, weights, conjugate, zero):
+    """Return the inner product, accumulated blockwise.
+    
+    Like the C extension the products are summed error-free transformed,
+    for precision comparable to `math.sumprod`.
+    Returns `NotImplemented` for non-finite (or overflowing) products.
+    """
+    a, b = typed(v), typed(w)
+    c = typed(weights) if weights is not None else None
+    if a is None or b is None or (weights is not None and c is None):
+        return NotImplemented
+    n = min(len(a), len(b), len(c) if c is not None else len(a))
+    if not n:
+        return zero
+    cmplx = any(x.dtype.kind=='c' for x in (a, b, c) if x is not None)
+    re, im = Accumulator(), Accumulator()
+    for k in blocks(n):
+        x, y = a[k].astype(np.complex128 if cmplx else np.float64), b[k]
+        if conjugate:
+            x = np.conjugate(x)
+        if not cmplx:
+            terms = twoproduct(x, y)
+            if c is not None:
+                p, e = terms
+                terms = (*twoproduct(p, c[k]), e*c[k])
+            if not all(np.isfinite(t).all() for t in terms):
+                return NotImplemented
+            re.add(*terms)
+        else:
+            y = y.astype(np.complex128)
+            if c is None:
+                #real & imaginary parts of all products as exact terms
+                retems = (*twoproduct(x.real, y.real), *map(np.negative, twoproduct(x.imag, y.imag)))
+                imterms = (*twoproduct(x.real, y.imag), *twoproduct(x.imag, y.real))
+            else:
+                p = x * y * c[k]
+                retems, imterms = (p.real,), (p.imag,)
+            if not all(np.isfinite(t).all() for t in retems+imterms):
+                return NotImplemented
+            re.add(*retems)
+            im.add(*imterms)
+    return complex(re.hi, im.hi) if cmplx else re.hi
+
+def typedsummate(v, w, weights, conjugate, summation, zero):
+    """Return the inner product with the products summed by `summation`.
+    
+    The products are formed vectorised, `'pairwise'` sums them by `numpy`
+    (pairwise as well), the other modes by `summate`.
+    """
+    a, b = typed(v), typed(w)
+    c = typed(weights) if weights is not None else None
+    if a is None or b is None or (weights is not None and c is None):
+        return NotImplemented
+    n = min(len(a), len(b), len(c) if c is not None else len(a))
+    p = (np.conjugate(a[:n]) if conjugate else a[:n]) * b[:n]
+    if c is not None:
+        p *= c[:n]
+    if not n:
+        return zero
+    if summation == 'pairwise':
+        return np.add.reduce(p).item()
+    return summate(p.tolist(), summation, zero)
+
+def typedeq(v, w):
+    """Return whether two vectors are equal, comparing blockwise."""
+    a, b = typed(v), typed(w)
+    if a is None or b is None:
+        return NotImplemented
+    n = min(len(a), len(b))
+    return (all(np.array_equal(a[k], b[k]) for k in blocks(n))
+            and not any(a[n:][k].any() for k in blocks(len(a)-n))
+            and not any(b[n:][k].any() for k in blocks(len(b)-n)))
+
+def typedtrim(v, tol, factory):
+    """Return `v` without trailing near zero coefficients.
+    
+    The result is a slice of `v`, so no data is copied for `numpy.ndarray`s
+    & `memoryview`s.
+    """
+    a = typed(v)
+    if a is None or not (tol is None or scalar(tol)):
+        return NotImplemented
+    n = len(a)
+    for k in reversed(list(blocks(n))):
+        nonzero = np.flatnonzero(a[k] if tol is None else np.abs(a[k])>tol)
+        if len(nonzero):
+            n = k.start + nonzero[-1] + 1
+            break
+    else:
+        n = 0
+    if factory is None and isinstance(v, (np.ndarray, memoryview)):
+        return v[:n]
+    return output(a[:n], v, factory)
@@ -0,0 +1,155 @@
+from fractions import Fraction
+from itertools import chain
+from iteration import sumprod_default
+from ._typed import typed, output, Resize
+import numpy as np
+from typing import TypeVar
+from collections.abc import Iterable, Iterator, Sequence, MutableSequence, Callable
+
+
+
+__all__ = ('vecconv', 'veciconv')
+
+
+
+V = TypeVar('V', bound=Sequence)
+M = TypeVar('M', bound=MutableSequence)
+
+#minimum length of the shorter operand to recurse into Karatsuba
+KARATSUBA_THRESHOLD = 64
+#minimum length of the shorter operand to convolve floats by FFT
+FFT_THRESHOLD = 32
+
+
+
+def _schoolbook(v, w):
+    """Return the convolution of two nonempty lists, coefficient by coefficient."""
+    n, m, wr = len(v), len(w), w[::-1]
+    return [sumprod_default(v[max(0, k-m+1):min(k, n-1)+1], wr[max(m-1-k, 0):m-1-k+min(k, n-1)+1])
+            for k in range(n+m-1)]
+
+def _addat(r, x, k):
+    """Add `x` into `r` starting at index `k`, appending beyond its end."""
+    for i, xi in enumerate(x, k):
+        if i < len(r):
+            r[i] += xi
+        else:
+            r.append(xi)
+
+def _karatsuba(v, w):
+    """Return the convolution of two nonempty lists by Karatsuba's recursion."""
+    n, m = len(v), len(w)
+    if min(n, m) < KARATSUBA_THRESHOLD:
+        return _schoolbook(v, w)
+    if n < m: #unbalanced, split the longer one into blocks of the shorter
+        r = []
+        for k in range(0, m, n):
+            _addat(r, _karatsuba(v, w[k:k+n]), k)
+        return r
+    if m < n:
+        r = []
+        for k in range(0, n, m):
+            _addat(r, _karatsuba(v[k:k+m], w), k)
+        return r
+    h = n // 2
+    v0, v1, w0, w1 = v[:h], v[h:], w[:h], w[h:]
+    z0, z2 = _karatsuba(v0, w0), _karatsuba(v1, w1)
+    #(v0+v1)(w0+w1) - v0w0 - v1w1 = v0w1 + v1w0
+    z1 = _karatsuba([a+b for a, b in zip(v0, v1)]+v1[h:], [a+b for a, b in zip(w0, w1)]+w1[h:])
+    z1 = [z1k-z2k for z1k, z2k in zip(z1, z2)]
+    for k, z0k in enumerate(z0):
+        z1[k] -= z0k
+    #z0 & z2 don't overlap, z1 covers the gap between them
+    r = z0 + [z1[h-1]] + z2
+    _addat(r, z1[:h-1], h)
+    _addat(r, z1[h:], 2*h)
+    return r
+
+def _fft(a, b):
+    """Return the convolution of nonempty float or complex arrays by FFT along the last axis."""
+    n = a.shape[-1] + b.shape[-1] - 1
+    #numpy transforms float32 in single precision, promote to the common type first
+    dtype = np.result_type(a, b)
+    a, b = a.astype(dtype, copy=False), b.astype(dtype, copy=False)
+    if dtype.kind=='c':
+        return np.fft.ifft(np.fft.fft(a, n)*np.fft.fft(b, n))
+    return np.fft.irfft(np.fft.rfft(a, n)*np.fft.rfft(b, n), n)
+
+def vecconv(v:Iterable, w:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
+    r"""Return the convolution (product of the polynomials).
+    
+    $$
+        \left(\sum_{i+j=k}v_iw_j\right)_k \qquad \mathbb{K}^m\times\mathbb{K}^n\to\mathbb{K}^{m+n-1}
+    $$
+    
+    The algorithm is chosen by the length $\min(m, n)$ of the shorter vector
+    and the coefficient types:
+    
+    - exact (`int`s, `Fraction`s): Karatsuba's recursion from
+      `KARATSUBA_THRESHOLD` on, the result is the same,
+    - `float`s & `complex`es: FFT from `FFT_THRESHOLD` on, `numpy`
+      `float64` (`complex128`) precision,
+    - otherwise & below the thresholds: the schoolbook method.
+    
+    One-dimensional double precision buffers are convolved by `numpy` directly
+    (`numpy.convolve` below `FFT_THRESHOLD`).
+    
+    Complexity
+    ----------
+    For two vectors of lengths $n\le m$ with the schoolbook method there will be
+    
+    - $nm$ scalar multiplications (`mul`) &
+    - $(n-1)(m-1)$ scalar additions (`add`).
+    
+    Karatsuba needs $\mathcal{O}(m n^{\log_23-1})$ scalar operations
+    (`mul`, `add` & `sub`), FFT $\mathcal{O}((n+m)\log(n+m))$
+    floating point operations.
+    
+    Notes
+    -----
+    Coefficients are multiplied as $v_iw_j$ (in this order), so
+    non-commutative coefficients are fine.
+    
+    The error of the FFT is relative to the largest coefficients, small
+    coefficients of the result may lose relative accuracy.
+    
+    See also
+    --------
+    - in-place: [`veciconv`][vector.dense.algebra.veciconv]
+    - for tensors: [`tenconv`][vector.multilinear.algebra.tenconv]
+    """
+    if out is not None:
+        factory = Resize(out)
+    a, b = typed(v), typed(w)
+    if a is not None and b is not None:
+        if not len(a) or not len(b):
+            r = np.zeros(0, dtype=np.result_type(a, b))
+        elif min(len(a), len(b)) >= FFT_THRESHOLD:
+            r = _fft(a, b).astype(np.result_type(a, b), copy=False)
+        else:
+            r = np.convolve(a, b)
+        #release the views, `out` may be one of the operands
+        a = b = None
+        r = output(r, v, factory)
+        if r is not NotImplemented:
+            return r
+    factory = factory or (iter if isinstance(v, Iterator) else type(v))
+    v, w = list(v), list(w)
+    if not v or not w:
+        return factory(())
+    if min(len(v), len(w)) >= FFT_THRESHOLD and all(isinstance(x, (float, complex)) for x in chain(v, w)):
+        return factory(_fft(np.array(v), np.array(w)).tolist())
+    if all(isinstance(x, (int, Fraction)) for x in chain(v, w)):
+        return factory(_karatsuba(v, w))
+    return factory(_schoolbook(v, w))
+
+def veciconv(v:M, w:Iterable) -> M:
+    r"""Return the convolution (product of the polynomials).
+    
+    $$
+        \vec{v} = \left(\sum_{i+j=k}v_iw_j\right)_k \qquad \mathbb{K}^m\times\mathbb{K}^n\to\mathbb{K}^{m+n-1}
+    $$
+    
+    Same algorithms as [`vecconv`][vector.dense.algebra.vecconv].
+    """
+    return vecconv(v, w, out=v)
@@ -0,0 +1,178 @@
+from os import PathLike
+from itertools import islice
+from ..util import _Neumaier
+import numpy as np
+from typing import Any, BinaryIO, TextIO
+from collections.abc import Generator, Iterable
+
+
+
+__all__ = ('vecreadraw', 'vecreadnpy', 'vecreadtext',
+           'vecchunkabs', 'vecchunkabsq', 'vecchunkdot')
+
+
+
+#default number of coefficients per chunk (8MiB of float64)
+CHUNK = 2**20
+
+
+
+#readers
+def vecreadraw(file:str|PathLike|BinaryIO, dtype:Any='d', chunk:int=CHUNK, offset:int=0) -> Generator[np.ndarray]:
+    """Yield the coefficients of a raw binary file in chunks.
+    
+    The file holds the coefficients as a flat array of `dtype` (native byte
+    order unless specified, like `numpy.tofile` writes them), starting at
+    byte `offset`. Every chunk is a new `numpy.ndarray` of at most `chunk`
+    coefficients, so only one chunk has to be in memory at a time.
+    A `ValueError` is raised if the file ends with a partial coefficient
+    (its size after `offset` isn't a multiple of the itemsize).
+    
+    See also
+    --------
+    - wraps: [`numpy.frombuffer`](https://numpy.org/doc/stable/reference/generated/numpy.frombuffer.html)
+    """
+    dtype = np.dtype(dtype)
+    f = open(file, 'rb') if isinstance(file, (str, PathLike)) else file
+    try:
+        f.seek(offset)
+        while data := f.read(chunk*dtype.itemsize):
+            if len(data) % dtype.itemsize:
+                raise ValueError(f'{getattr(f, "name", f)!r} ends with {len(data) % dtype.itemsize} bytes '
+                                 f'of a partial element, expected itemsize {dtype.itemsize} of {dtype}')
+            yield np.frombuffer(data, dtype=dtype)
+    finally:
+        if f is not file:
+            f.close()
+
+def vecreadnpy(file:str|PathLike, chunk:int=CHUNK) -> Generator[np.ndarray]:
+    """Yield the coefficients of a one-dimensional `.npy` file in chunks.
+    
+    The file is memory-mapped, the chunks are read-only views of at most
+    `chunk` coefficients, nothing is loaded before it is accessed.
+    
+    See also
+    --------
+    - wraps: [`numpy.load`](https://numpy.org/doc/stable/reference/generated/numpy.load.html)
+    """
+    a = np.load(file, mmap_mode='r')
+    if a.ndim != 1:
+        raise ValueError(f'expected a one-dimensional array, got shape {a.shape}')
+    for k in range(0, len(a), chunk):
+        yield a[k:k+chunk]
+
+def vecreadtext(file:str|PathLike|TextIO, dtype:Any=float, chunk:int=CHUNK) -> Generator[np.ndarray]:
+    """Yield the coefficients of a text file (one per line) in chunks.
+    
+    Every chunk of at most `chunk` lines is parsed into a new
+    `numpy.ndarray` of `dtype`. Empty lines and `#` comments are skipped
+    before chunking, so no chunk is empty.
+    
+    See also
+    --------
+    - wraps: [`numpy.loadtxt`](https://numpy.org/doc/stable/reference/generated/numpy.loadtxt.html)
+    """
+    f = open(file) if isinstance(file, (str, PathLike)) else file
+    try:
+        data = (l for l in f if l.split('#', 1)[0].strip())
+        while lines := list(islice(data, chunk)):
+            yield np.loadtxt(lines, dtype=dtype, ndmin=1)
+    finally:
+        if f is not file:
+            f.close()
+
+
+
+#reductions
+def _aligned(vs, ws):
+    """Yield pairs of equally long pieces of two chunk streams.
+    
+    Stops with the shorter stream.
+    """
+    vs, ws = map(iter, (vs, ws))
+    x = y = np.zeros(0)
+    while True:
+        while not len(x):
+            if (x := next(vs, None)) is None:
+                return
+            x = np.asarray(x)
+        while not len(y):
+            if (y := next(ws, None)) is None:
+                return
+            y = np.asarray(y)
+        n = min(len(x), len(y))
+        yield x[:n], y[:n]
+        x, y = x[n:], y[n:]
+
+def _dot(pairs, conjugate, zero):
+    """Return the sum of the inner products of the chunk pairs."""
+    re, im, exact = _Neumaier(), _Neumaier(), zero
+    floating = cmplx = False
+    for x, y in pairs:
+        if x.dtype.kind in 'fc' or y.dtype.kind in 'fc':
+            p = (np.vdot if conjugate else np.dot)(x, y)
+            floating, cmplx = True, cmplx or np.iscomplexobj(p)
+            re.add(float(p.real))
+            im.add(float(p.imag))
+        else:
+            #exact, object arrays are conjugated coefficient by coefficient
+            x, y = x.astype(object), y.astype(object)
+            exact = exact + np.dot(np.conjugate(x) if conjugate else x, y)
+    if not floating:
+        return exact
+    return exact + (complex(re.sum(), im.sum()) if cmplx else re.sum())
+
+def vecchunkdot(vs:Iterable[Iterable], ws:Iterable[Iterable], conjugate:bool=False, zero:Any=0) -> Any:
+    r"""Return the inner product of two vectors given in chunks.
+    
+    $$
+        \left<\vec{v}\mid\vec{w}\right>_{\ell_{\mathbb{N}_0}^2}=\sum_iv_i^{(*)}w_i \qquad \mathbb{K}^m\times\mathbb{K}^n\to\mathbb{K}
+    $$
+    
+    The chunks (e.g. from [`vecreadraw`][vector.dense.chunked.vecreadraw])
+    are consumed one after another, chunk boundaries of `vs` & `ws` don't
+    have to match. Every chunk is reduced by `numpy.dot`, the partial sums
+    are accumulated by compensated (Neumaier) summation, so the rounding
+    error doesn't grow with the number of chunks.
+    Integer chunks are reduced exactly on Python `int`s.
+    
+    Complexity
+    ----------
+    Memory is bounded by the two chunks currently in use.
+    
+    See also
+    --------
+    - for a vector in memory: [`vecdot`][vector.dense.hilbertspace.vecdot]
+    """
+    return _dot(_aligned(vs, ws), conjugate, zero)
+
+def vecchunkabsq(vs:Iterable[Iterable], conjugate:bool=False, zero:Any=0) -> Any:
+    r"""Return the sum of absolute squares of a vector given in chunks.
+    
+    $$
+        ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}^2=\sum_iv_i^{(*)}v_i \qquad \mathbb{K}^n\to\mathbb{K}_0^+
+    $$
+    
+    Same accumulation as [`vecchunkdot`][vector.dense.chunked.vecchunkdot],
+    the chunks are read only once.
+    
+    See also
+    --------
+    - for a vector in memory: [`vecabsq`][vector.dense.hilbertspace.vecabsq]
+    """
+    return _dot(((v, v) for v in map(np.asarray, vs)), conjugate, zero)
+
+def vecchunkabs(vs:Iterable[Iterable], conjugate:bool=False, zero:Any=0) -> Any:
+    r"""Return the Euclidean/$\ell_{\mathbb{N}_0}^2$-norm of a vector given in chunks.
+    
+    $$
+        ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}=\sqrt{\sum_iv_i^{(*)}v_i} \qquad \mathbb{K}^n\to\mathbb{K}_0^+
+    $$
+    
+    Returns the square root of [`vecchunkabsq`][vector.dense.chunked.vecchunkabsq].
+    
+    See also
+    --------
+    - for a vector in memory: [`vecabs`][vector.dense.hilbertspace.vecabs]
+    """
+    return vecchunkabsq(vs, conjugate=conjugate, zero=zero)**0.5
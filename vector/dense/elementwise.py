@@ -2,6 +2,7 @@ from operator import truediv, floordiv, mod
 from itertools import chain, islice, repeat
 from functools import partial
 from iteration import MISSING, raiser, group_ordinal, prod_default
+from ._typed import Resize
 from typing import Any, TypeVar
 from collections.abc import Iterable, Iterator, Sequence, MutableSequence, Callable
 
@@ -21,7 +22,7 @@ M = TypeVar('M', bound=MutableSequence)
 
 
 
-def vechadamard(*vs:Iterable, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamard(*vs:Iterable, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise product.
     
     $$
@@ -34,6 +35,8 @@ def vechadamard(*vs:Iterable, factory:Callable[[Iterable],S]|None=None) -> S:
     
     - $\begin{cases}(N-1)\min_in_i&N\ge1\land\min_in_i\ge1\\0&N\le1\lor\min_in_i=0\end{cases}$ scalar multiplications (`mul`).
     """
+    if out is not None:
+        factory = Resize(out)
     if factory is None:
         factory = (iter if isinstance(vs[0], Iterator) else type(vs[0])) if vs else tuple
     return factory(map(partial(prod_default, default=MISSING), zip(*vs)))
@@ -53,7 +56,7 @@ def vecihadamard(v:M, *ws:Sequence) -> M:
     return v
 
 
-def vechadamardtruediv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamardtruediv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise true quotient.
     
     $$
@@ -66,6 +69,8 @@ def vechadamardtruediv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|No
     
     - $n$ scalar true divisions (`truediv`).
     """
+    if out is not None:
+        factory = Resize(out)
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(truediv, v, chain(w, raiser(ZeroDivisionError))))
 
@@ -81,7 +86,7 @@ def vecihadamardtruediv(v:M, w:Iterable) -> M:
     return v
 
 
-def vechadamardfloordiv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamardfloordiv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise floor quotient.
     
     $$
@@ -94,6 +99,8 @@ def vechadamardfloordiv(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|N
     
     - $n$ scalar floor divisions (`floordiv`).
     """
+    if out is not None:
+        factory = Resize(out)
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(floordiv, v, chain(w, raiser(ZeroDivisionError))))
 
@@ -109,7 +116,7 @@ def vecihadamardfloordiv(v:M, w:Iterable) -> M:
     return v
 
 
-def vechadamardmod(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamardmod(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise remainder.
     
     $$
@@ -122,6 +129,8 @@ def vechadamardmod(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|None=N
     
     - $n$ scalar modulos (`mod`).
     """
+    if out is not None:
+        factory = Resize(out)
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(mod, v, chain(w, raiser(ZeroDivisionError))))
 
@@ -162,7 +171,7 @@ def vechadamarddivmod(v:Iterable, w:Iterable, factory:Callable[[Iterable],S]|Non
     return factory(q), factory(r)
 
 
-def vechadamardmin(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamardmin(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise minimum.
     
     $$
@@ -175,11 +184,13 @@ def vechadamardmin(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Cal
     
     - $\min\{n, m\}$ comparisons (`lt`).
     """
+    if out is not None:
+        factory = Resize(out)
     if factory is None:
         factory = (iter if isinstance(vs[0], Iterator) else type(vs[0])) if vs else tuple
     return factory(map(partial(min, key=key), group_ordinal(*vs)))
 
-def vechadamardmax(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Callable[[Iterable],S]|None=None) -> S:
+def vechadamardmax(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Callable[[Iterable],S]|None=None, out:MutableSequence|None=None) -> S:
     r"""Return the elementwise maximum.
     
     $$
@@ -192,6 +203,8 @@ def vechadamardmax(*vs:Iterable, key:Callable[[Any], Any]|None=None, factory:Cal
     
     - $\min\{n, m\}$ comparisons (`gt`).
     """
+    if out is not None:
+        factory = Resize(out)
     if factory is None:
         factory = (iter if isinstance(vs[0], Iterator) else type(vs[0])) if vs else tuple
     return factory(map(partial(max, key=key), group_ordinal(*vs)))
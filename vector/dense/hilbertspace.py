@@ -1,7 +1,12 @@
 from operator import mul
 from itertools import tee
-from ..util import try_conjugate
+from ..util import try_conjugate, summate, _gramtiles, _gram
 from iteration import sumprod_default
+from ._typed import Resize, typeddot, typedsummate
+try:
+    from . import _cdense
+except ImportError:
+    _cdense = None
 from typing import Any, TypeVar
 from collections.abc import Callable, Generator, Iterable, Iterator, MutableSequence, Sequence
 
@@ -10,7 +15,8 @@ from collections.abc import Callable, Generator, Iterable, Iterator, MutableSequ
 __all__ = ('vecconj', 'veciconj',
            'vecabs',
            'vecabsq', 'vecabsqs',
-           'vecdot',  'vecdots')
+           'vecdot',  'vecdots',
+           'vecgram')
 
 
 
@@ -20,7 +26,7 @@ M = TypeVar('M', bound=MutableSequence)
 
 
 
-def vecconj(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecconj(v:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the complex conjugate.
     
     $$
@@ -36,6 +42,8 @@ def vecconj(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar conjugations (`conjugate`).
     """
+    if out is not None:
+        factory = Resize(out)
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(try_conjugate, v))
 
@@ -54,14 +62,15 @@ def veciconj(v:M) -> M:
     return v
 
 
-def vecabs(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecabs(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the Euclidean/$\ell_{\mathbb{N}_0}^2$-norm.
     
     $$
         ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}=\sqrt{\sum_iv_i^{(*)}v_i\omega_i} \qquad \mathbb{K}^n\to\mathbb{K}_0^+
     $$
     
-    Returns the square root of [`vecabsq`][vector.dense.vecabsq].
+    Returns the square root of [`vecabsq`][vector.dense.vecabsq],
+    also with its `summation` mode.
     
     Complexity
     ----------
@@ -78,7 +87,7 @@ def vecabs(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:An
     """
     #hypot(*v) doesn't work for complex
     #math.sqrt doesn't work for complex and cmath.sqrt always returns complex
-    return vecabsq(v, weights=weights, conjugate=conjugate, zero=zero)**0.5
+    return vecabsq(v, weights=weights, conjugate=conjugate, zero=zero, summation=summation)**0.5
 
 
 def vecabsqs(v:Iterable, weights:Iterable|None=None, conjugate:bool=False) -> Generator:
@@ -109,13 +118,17 @@ def vecabsqs(v:Iterable, weights:Iterable|None=None, conjugate:bool=False) -> Ge
     """
     yield from vecdots(*tee(v, 2), weights, conjugate)
 
-def vecabsq(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecabsq(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the sum of absolute squares.
     
     $$
         ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}^2=\sum_iv_i^{(*)}v_i\omega_i \qquad \mathbb{K}^n\to\mathbb{K}_0^+
     $$
     
+    With a `summation` mode (`'naive'`, `'pairwise'`, `'kahan'` or
+    `'exact'`, see [`summate`][vector.util.summate]) the products are summed
+    by that algorithm instead of the default extended precision `sumprod`.
+    
     Complexity
     ----------
     For a vector of length $n$ there will be
@@ -135,6 +148,16 @@ def vecabsq(v:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:A
     ----------
     - <https://docs.python.org/3/library/itertools.html#itertools-recipes>: `sum_of_squares`
     """
+    if summation is not None:
+        r = typedsummate(v, v, weights, conjugate, summation, zero)
+        if r is not NotImplemented:
+            return r
+        return vecdot(*tee(v, 2), weights, conjugate, zero, summation)
+    r = typeddot(v, v, weights, conjugate, zero)
+    if r is not NotImplemented:
+        return r
+    if _cdense is not None:
+        return _cdense.vecabsq(v, weights, conjugate, zero)
     return vecdot(*tee(v, 2), weights, conjugate, zero)
 
 
@@ -162,13 +185,17 @@ def vecdots(v:Iterable, w:Iterable, weights:Iterable|None=None, conjugate:bool=F
         yield from map(mul, map(mul, v, w), weights)
 
 
-def vecdot(v:Iterable, w:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecdot(v:Iterable, w:Iterable, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the inner product.
     
     $$
         \left<\vec{v}\mid\vec{w}\right>_{\ell_{\mathbb{N}_0}^2}=\sum_iv_i^{(*)}w_i\omega_i \qquad \mathbb{K}^m\times\mathbb{K}^n\to\mathbb{K}
     $$
     
+    With a `summation` mode (`'naive'`, `'pairwise'`, `'kahan'` or
+    `'exact'`, see [`summate`][vector.util.summate]) the products are summed
+    by that algorithm instead of the default extended precision `sumprod`.
+    
     Complexity
     ----------
     For two vectors of lengths $n$ & $m$ there will be
@@ -177,6 +204,16 @@ def vecdot(v:Iterable, w:Iterable, weights:Iterable|None=None, conjugate:bool=Fa
     - $\min\{n, m\}$/$2\min\{n, m\}$ scalar multiplications (`mul` without/with weights) &
     - $\begin{cases}\min\{n, m\}-1&n\ge1\land m\ge1\\0&n\le1\lor m\le1\end{cases}$ scalar additions (`add`).
     """
+    if summation is not None:
+        r = typedsummate(v, w, weights, conjugate, summation, zero)
+        if r is not NotImplemented:
+            return r
+        return summate(vecdots(v, w, weights, conjugate), summation, zero)
+    r = typeddot(v, w, weights, conjugate, zero)
+    if r is not NotImplemented:
+        return r
+    if _cdense is not None:
+        return _cdense.vecdot(v, w, weights, conjugate, zero)
     if conjugate:
         v = vecconj(v, iter)
     #don't sum(vecldot) but rather use sumprod explicitly for improved float precision
@@ -184,3 +221,39 @@ def vecdot(v:Iterable, w:Iterable, weights:Iterable|None=None, conjugate:bool=Fa
         return sumprod_default(v, w, default=zero)
     else:
         return sumprod_default(map(mul, v, w), weights, default=zero)
+
+
+def vecgram(vs:Iterable[Iterable], ws:Iterable[Iterable]|None=None, weights:Iterable|None=None, conjugate:bool=False, zero:Any=0, triangular:bool=False, block:int|None=None) -> tuple[tuple[Any,...],...]|Generator:
+    r"""Return the Gram matrix (all pairwise inner products).
+    
+    $$
+        \left(\left<\vec{v}_i\mid\vec{w}_j\right>_{\ell_{\mathbb{N}_0}^2}\right)_{i,j}
+    $$
+    
+    The entries are computed by [`vecdot`][vector.dense.hilbertspace.vecdot]
+    and returned as `tuple` of rows.
+    
+    Without `ws` the Gram matrix of `vs` with itself is symmetric
+    (Hermitian if `conjugate`), only the upper triangle is computed and
+    mirrored. If `triangular`, it isn't mirrored, the lower triangle is `zero`.
+    
+    If `block` is given, a generator of the `block`$\times$`block` tiles
+    `(i, j, rows)` starting at row `i` & column `j` is returned instead,
+    so that the matrix never has to be in memory at once
+    (only the upper tiles if `triangular`).
+    
+    Complexity
+    ----------
+    For $n$ & $m$ vectors there will be $nm$ (or $n(n+1)/2$ without `ws`)
+    inner products.
+    """
+    vs = [tuple(v) if isinstance(v, Iterator) else v for v in vs]
+    symmetric = ws is None
+    ws = vs if symmetric else [tuple(w) if isinstance(w, Iterator) else w for w in ws]
+    if weights is not None and isinstance(weights, Iterator):
+        weights = tuple(weights)
+    def tile(i0, i1, j0, j1, upper):
+        return [[vecdot(vs[i], ws[j], weights, conjugate, zero) if not upper or j>=i else zero
+                 for j in range(j0, j1)] for i in range(i0, i1)]
+    tiles = _gramtiles(len(vs), len(ws), tile, symmetric, triangular, conjugate, block or max(len(vs), len(ws), 1))
+    return tiles if block else _gram(len(vs), len(ws), tiles, zero)
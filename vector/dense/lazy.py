@@ -0,0 +1,206 @@
+import re
+from functools import lru_cache
+from itertools import count
+from collections.abc import Callable, Iterable, Sequence
+
+
+
+__all__ = ('VectorLazy',)
+
+
+
+#maximum nesting depth of a compiled expression, deeper subtrees are evaluated in stages
+_DEPTH = 32
+_NAME = re.compile(r'[xc]\d+')
+
+@lru_cache(maxsize=256)
+def _compile(noperands:int, nscalars:int, expr:str) -> Callable:
+    """Return a function evaluating `expr` elementwise over the operands."""
+    ls = ', '.join(f'l{k}' for k in range(noperands))
+    cs = ', '.join(f'c{k}' for k in range(nscalars))
+    xs = ', '.join(f'x{k}' for k in range(noperands))
+    return eval(f'lambda {ls}, {cs}: [{expr} for {xs}, in zip({ls})]')
+
+def _evaluate(expr:str, operands:list, scalars:list) -> list:
+    """Return the values of `expr` over the operands `x0, x1, ...` & scalars `c0, c1, ...`.
+    
+    The expression is compiled over the names it uses only, renumbered in
+    order of appearance, so equally shaped (sub)expressions share the cache.
+    """
+    names = dict.fromkeys(_NAME.findall(expr))
+    xs, cs = [n for n in names if n[0]=='x'], [n for n in names if n[0]=='c']
+    local = {n:f'x{k}' for k, n in enumerate(xs)} | {n:f'c{k}' for k, n in enumerate(cs)}
+    f = _compile(len(xs), len(cs), _NAME.sub(lambda m: local[m[0]], expr))
+    return f(*(operands[int(n[1:])] for n in xs), *(scalars[int(n[1:])] for n in cs))
+
+
+
+class VectorLazy:
+    """Unevaluated arithmetic expression of dense vectors.
+    
+    ```python
+    >>> from vector import Vector
+    >>> x, y, z = Vector((1, 2, 3)), Vector((4, 5)), Vector((6,))
+    >>> e = 2*x.lazy() + 3*y.lazy() - z
+    >>> e.compute()
+    Vector(8, 19, 6)
+    ```
+    
+    Created by [`Vector.lazy`][vector.dense.objectoriented.Vector.lazy].
+    Arithmetic (`+`, `-`, scalar `*`, `/`, `//`, `%`, unary `+` & `-`) builds an
+    expression tree instead of intermediate vectors. `compute()` (or `.data`)
+    evaluates it in a single fused pass over the coefficients into one output.
+    
+    The results are the same as from the eager operations
+    (missing coefficients are not padded with zeros but left out,
+    e.g. $(a+b)_i=a_i$ where $b$ is too short).
+    
+    Notes
+    -----
+    The index range is split into segments by the lengths of the operands.
+    In each segment the set of present operands is fixed, so the expression is
+    simplified accordingly and compiled to a single list comprehension over the
+    zipped operands. Deeply nested expressions (e.g. built in a loop) are
+    evaluated in stages: subexpressions of a bounded depth are compiled
+    separately and evaluated into intermediate lists first. Compiled
+    expressions are cached, so repeated evaluation of the same expression
+    shape doesn't recompile.
+    """
+    __slots__ = ('op', 'args')
+    
+    
+    
+    def __init__(self, data:Iterable=()):
+        self.op = None
+        self.args = (data if isinstance(data, Sequence) else tuple(data),)
+    
+    @classmethod
+    def _node(cls, op, *args):
+        r = cls.__new__(cls)
+        r.op, r.args = op, args
+        return r
+    
+    @classmethod
+    def _wrap(cls, x):
+        from .objectoriented import Vector
+        if isinstance(x, cls):
+            return x
+        if isinstance(x, Vector):
+            return cls(x.data)
+        return cls(x)
+    
+    
+    
+    #evaluation
+    def _leaves(self, leaves):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.op is None:
+                leaves.append(node.args[0])
+            else:
+                stack.extend(arg for arg in reversed(node.args) if isinstance(arg, VectorLazy))
+        return leaves
+    
+    def _segment(self, leaves, present, s, e):
+        """Return the coefficients `s:e`, where exactly the leaves `present` are long enough."""
+        operands = [leaves[k][s:e] for k in present]
+        ids = {k:i for i, k in enumerate(present)}
+        scalars, leafids = [], count()
+        #iterative postorder, values are (source, depth) or None if no operand is present
+        stack, values = [(self, False)], []
+        while stack:
+            node, visited = stack.pop()
+            if node.op is None:
+                k = next(leafids)
+                values.append((f'x{ids[k]}', 0) if k in ids else None)
+                continue
+            if not visited:
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in reversed(node.args) if isinstance(arg, VectorLazy))
+                continue
+            if node.op in {'add', 'sub'}:
+                b, a = values.pop(), values.pop()
+                if a is None:
+                    r = b if b is None or node.op=='add' else (f'(-{b[0]})', b[1]+1)
+                elif b is None:
+                    r = a
+                else:
+                    r = (f'({a[0]}{"+" if node.op=="add" else "-"}{b[0]})', max(a[1], b[1])+1)
+            elif (a := values.pop()) is None:
+                r = None
+            elif node.op in {'pos', 'neg'}:
+                r = (f'({"+" if node.op=="pos" else "-"}{a[0]})', a[1]+1)
+            else:
+                scalars.append(node.args[1])
+                c = f'c{len(scalars)-1}'
+                r = ({'mul':f'({a[0]}*{c})', 'rmul':f'({c}*{a[0]})', 'truediv':f'({a[0]}/{c})',
+                      'floordiv':f'({a[0]}//{c})', 'mod':f'({a[0]}%{c})'}[node.op], a[1]+1)
+            if r is not None and r[1] >= _DEPTH:
+                #evaluate deep subtrees into an intermediate operand
+                operands.append(_evaluate(r[0], operands, scalars))
+                r = (f'x{len(operands)-1}', 0)
+            values.append(r)
+        return _evaluate(values.pop()[0], operands, scalars)
+    
+    def compute(self, factory:Callable|None=None):
+        """Evaluate the expression.
+        
+        Returns a [`Vector`][vector.dense.objectoriented.Vector] or, if a
+        `factory` is given, the coefficients passed through it.
+        """
+        from .objectoriented import Vector
+        leaves = self._leaves([])
+        lengths = sorted(set(map(len, leaves)) | {0})
+        r = []
+        for s, e in zip(lengths, lengths[1:]):
+            present = [k for k, l in enumerate(leaves) if len(l)>=e]
+            r.extend(self._segment(leaves, present, s, e))
+        return factory(r) if factory is not None else Vector(tuple(r))
+    
+    @property
+    def data(self):
+        return self.compute().data
+    
+    
+    
+    #vectorspace
+    def __pos__(self):
+        return self._node('pos', self)
+    
+    def __neg__(self):
+        return self._node('neg', self)
+    
+    def __add__(self, other):
+        return self._node('add', self, self._wrap(other))
+    
+    def __radd__(self, other):
+        return self._node('add', self._wrap(other), self)
+    
+    def __sub__(self, other):
+        return self._node('sub', self, self._wrap(other))
+    
+    def __rsub__(self, other):
+        return self._node('sub', self._wrap(other), self)
+    
+    def __mul__(self, other):
+        return self._node('mul', self, other)
+    
+    def __rmul__(self, other):
+        return self._node('rmul', self, other)
+    
+    def __truediv__(self, other):
+        return self._node('truediv', self, other)
+    
+    def __floordiv__(self, other):
+        return self._node('floordiv', self, other)
+    
+    def __mod__(self, other):
+        return self._node('mod', self, other)
+    
+    
+    #IO
+    def __repr__(self):
+        if self.op is None:
+            return f'{type(self).__name__}{self.args[0]!r}'
+        return f'{type(self).__name__}.{self.op}{self.args!r}'
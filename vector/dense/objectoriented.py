@@ -1,8 +1,18 @@
+import numpy as np
 from .creation import vecbasis, vecbases, vecrand, vecrandn
 from .utility import veceq, vectrim, vecrshift, veclshift
 from .hilbertspace import vecconj, vecabs, vecabsq
 from .vectorspace import vecpos, vecneg, vecadd, vecaddc, vecsub, vecsubc, vecmul, vecrmul, vectruediv, vecfloordiv, vecmod, vecdivmod
+from .lazy import VectorLazy
+from .algebra import vecconv
 from .elementwise import vechadamard, vechadamardtruediv, vechadamardfloordiv, vechadamardmod, vechadamarddivmod, vechadamardmin, vechadamardmax
+from collections.abc import Iterable
+
+
+
+def _data(v):
+    """Return the coefficients of a `Vector` or any other iterable operand."""
+    return getattr(v, 'data', v)
 
 
 
@@ -28,6 +38,15 @@ class Vector:
     def randn(cls, n, normed=True, mu=0, sigma=1, weights=None):
         return cls(vecrandn(n, normed=normed, mu=mu, sigma=sigma, weights=weights))
     
+    @classmethod
+    def memmap(cls, filename, dtype='d', mode='r', offset=0, shape=None):
+        """Return a vector backed by a memory-mapped file (`numpy.memmap`).
+        
+        Nothing is loaded or copied, read-only operations like `abs`, `==` &
+        `trim` stream over the mapped buffer.
+        """
+        return cls(np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape))
+    
     def __init__(self, data=()):
         #data is immutable, therefore use reference
         self.data = data
@@ -61,90 +80,111 @@ class Vector:
         return len(self.data)
     
     def __eq__(self, other):
-        return veceq(self, other)
+        other = _data(other)
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return veceq(self.data, other)
     
     def trim(self, tol=None):
-        return type(self)(vectrim(self, tol=tol))
+        return type(self)(vectrim(self.data, tol=tol))
     
     def __rshift__(self, other):
-        return type(self)(vecrshift(self, other))
+        return type(self)(vecrshift(self.data, other))
     
     def __lshift__(self, other):
-        return type(self)(veclshift(self, other))
+        return type(self)(veclshift(self.data, other))
     
     
     #hilbertspace
     def conjugate(self):
-        return type(self)(vecconj(self))
+        return type(self)(vecconj(self.data))
     
     def __abs__(self):
-        return vecabs(self)
+        return vecabs(self.data)
     
     def absq(self):
-        return vecabsq(self)
+        return vecabsq(self.data)
     
     
     #vectorspace
     def __pos__(self):
-        return type(self)(vecpos(self))
+        return type(self)(vecpos(self.data))
     
     def __neg__(self):
-        return type(self)(vecneg(self))
+        return type(self)(vecneg(self.data))
     
     def __add__(self, other):
-        return type(self)(vecadd(self, other))
+        if isinstance(other, VectorLazy):
+            return NotImplemented
+        return type(self)(vecadd(self.data, _data(other)))
     
     def addc(self, c, i=()):
-        return type(self)(vecaddc(self, c, i=i))
+        return type(self)(vecaddc(self.data, c, i=i))
     
     def __sub__(self, other):
-        return type(self)(vecsub(self, other))
+        if isinstance(other, VectorLazy):
+            return NotImplemented
+        return type(self)(vecsub(self.data, _data(other)))
     
     def subc(self, c, i=()):
-        return type(self)(vecsubc(self, c, i=i))
+        return type(self)(vecsubc(self.data, c, i=i))
     
     def __mul__(self, other):
-        return type(self)(vecmul(self, other))
+        return type(self)(vecmul(self.data, other))
     
     def __rmul__(self, other):
-        return type(self)(vecrmul(other, self))
+        return type(self)(vecrmul(other, self.data))
     
     def __truediv__(self, other):
-        return type(self)(vectruediv(self, other))
+        return type(self)(vectruediv(self.data, other))
     
     def __floordiv__(self, other):
-        return type(self)(vecfloordiv(self, other))
+        return type(self)(vecfloordiv(self.data, other))
     
     def __mod__(self, other):
-        return type(self)(vecmod(self, other))
+        return type(self)(vecmod(self.data, other))
     
     def __divmod__(self, other):
         q, r = type(self)(), type(self)()
-        q.data, r.data = vecdivmod(self, other)
+        q.data, r.data = vecdivmod(self.data, other)
         return q, r
     
     
     #elementwise
     def hadamard(self, *others):
-        return type(self)(vechadamard(self, *others))
+        return type(self)(vechadamard(self.data, *map(_data, others)))
     
     def hadamardtruediv(self, other):
-        return type(self)(vechadamardtruediv(self, other))
+        return type(self)(vechadamardtruediv(self.data, _data(other)))
     
     def hadamardfloordiv(self, other):
-        return type(self)(vechadamardfloordiv(self, other))
+        return type(self)(vechadamardfloordiv(self.data, _data(other)))
     
     def hadamardmod(self, other):
-        return type(self)(vechadamardmod(self, other))
+        return type(self)(vechadamardmod(self.data, _data(other)))
     
     def hadamarddivmod(self, other):
-        return type(self)(vechadamarddivmod(self, other))
+        return type(self)(vechadamarddivmod(self.data, _data(other)))
     
     def hadamardmin(self, *others):
-        return type(self)(vechadamardmin(self, *others))
+        return type(self)(vechadamardmin(self.data, *map(_data, others)))
     
     def hadamardmax(self, *others):
-        return type(self)(vechadamardmax(self, *others))
+        return type(self)(vechadamardmax(self.data, *map(_data, others)))
+    
+    
+    #algebra
+    def __matmul__(self, other):
+        return type(self)(vecconv(self.data, _data(other)))
+    
+    
+    #lazy
+    def lazy(self):
+        """Return a [`VectorLazy`][vector.dense.lazy.VectorLazy] expression of this vector.
+        
+        Arithmetic on it is deferred & fused into a single pass on `compute()`.
+        """
+        return VectorLazy(self.data)
     
     
     #IO
@@ -1,10 +1,11 @@
 from itertools import chain, islice, repeat, zip_longest
+from ._typed import Into, typedeq, typedtrim
 from typing import Any, TypeVar
 from collections.abc import Callable, Iterable, Iterator, MutableSequence
 
 
 
-__all__ = ('veclen',
+__all__ = ('veclen', 'vecinto',
            'veceq',
            'vectrim',   'vecitrim',
            'vecrshift', 'vecirshift',
@@ -33,6 +34,26 @@ def veclen(v:Iterable) -> int:
     return sum(1 for _ in v)
 
 
+def vecinto(out:Any) -> Callable[[Iterable],Any]:
+    """Return a factory writing the coefficients into the buffer `out`.
+    
+    ```python
+    >>> out = numpy.empty(3)
+    >>> vecadd((1.0, 2.0), (3.0, 4.0, 5.0), factory=vecinto(out))
+    array([4., 6., 5.])
+    ```
+    
+    `out` may be any writable buffer (`numpy.ndarray`, `numpy.memmap`,
+    `array.array`, `memoryview`, ...) of at least the result length.
+    The factory returns a view of the written prefix (`numpy.ndarray` or
+    `memoryview`). Results of the vectorised fast path are copied into the
+    buffer directly, without intermediate Python objects.
+    
+    Raises `ValueError` if the buffer is too small.
+    """
+    return Into(out)
+
+
 def veceq(v:Iterable, w:Iterable, factory:Callable[[Iterable[bool]],V]=all) -> V:
     r"""Return whether two vectors are equal.
     
@@ -47,6 +68,11 @@ def veceq(v:Iterable, w:Iterable, factory:Callable[[Iterable[bool]],V]=all) -> V
     - $\min\{n, m\}$ scalar comparisons (`eq`) &
     - $|n-m|$ scalar boolean evaluations (`bool`).
     """
+    if factory is all:
+        r = typedeq(v, w)
+        if r is not NotImplemented:
+            return r
+    
     def result():
         sentinel = object()
         for vi, wi in zip_longest(v, w, fillvalue=sentinel):
@@ -85,7 +111,13 @@ def vectrim(v:Iterable[T], tol:T|None=None, factory:Callable[[Iterable[T]],V]|No
     - Cutting of elements that are `abs(v_i)<=tol` instead of `abs(v_i)<tol` to
     allow cutting of elements that are exactly zero by `trim(v, 0)` instead
     of `trim(v, sys.float_info.min)`.
+    - Floating point `numpy.ndarray`s & `memoryview`s are returned as a slice
+    (a view, no copy) if no `factory` is given.
     """
+    r = typedtrim(v, tol, factory)
+    if r is not NotImplemented:
+        return r
+    
     def result():
         t = []
         for x in v:
@@ -2,6 +2,12 @@ from operator import pos, neg, mul, truediv, floordiv, mod
 from itertools import chain, islice, repeat, zip_longest
 from functools import partial
 from iteration import MISSING, group_ordinal, sum_default
+from ._typed import Resize, typedunary, typedscalar, typedadd, typedsub
+import numpy as np
+try:
+    from . import _cdense
+except ImportError:
+    _cdense = None
 from typing import Any, TypeVar
 from collections.abc import Callable, Iterable, Iterator, MutableSequence
 
@@ -17,7 +23,9 @@ __all__ = ('vecpos',                 'vecipos',
            'vectruediv',             'vecitruediv',
            'vecfloordiv',            'vecifloordiv',
            'vecmod',                 'vecimod',
-           'vecdivmod')
+           'vecdivmod',
+           'vecaxpy',                'veciaxpy',
+           'veclincomb',             'vecilincomb')
 
 
 
@@ -26,7 +34,7 @@ M = TypeVar('M', bound=MutableSequence)
 
 
 
-def vecpos(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecpos(v:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the identity.
     
     $$
@@ -39,6 +47,11 @@ def vecpos(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar unary plus operations (`pos`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedunary(np.positive, v, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(pos, v))
 
@@ -60,7 +73,7 @@ def vecipos(v:M) -> M:
     return v
 
 
-def vecneg(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecneg(v:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the negation.
     
     $$
@@ -73,6 +86,11 @@ def vecneg(v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar negations (`neg`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedunary(np.negative, v, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(neg, v))
 
@@ -94,7 +112,7 @@ def vecineg(v:M) -> M:
     return v
 
 
-def vecadd(*vs:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecadd(*vs:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the sum.
     
     $$
@@ -111,10 +129,16 @@ def vecadd(*vs:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
     --------
     - for sum on a single coefficient: [`vecaddc`][vector.dense.vectorspace.vecaddc]
     """
-    result = map(partial(sum_default, default=MISSING), group_ordinal(*vs))
+    if out is not None:
+        factory = Resize(out)
+    r = typedadd(vs, factory)
+    if r is not NotImplemented:
+        return r
     if factory is None:
         factory = (iter if isinstance(vs[0], Iterator) else type(vs[0])) if vs else tuple
-    return factory(result)
+    if _cdense is not None and factory is not iter:
+        return _cdense.vecadd(*vs, factory=factory)
+    return factory(map(partial(sum_default, default=MISSING), group_ordinal(*vs)))
 
 def veciadd(v:M, *ws:Iterable) -> M:
     r"""Add.
@@ -134,7 +158,7 @@ def veciadd(v:M, *ws:Iterable) -> M:
     return v
 
 
-def vecaddc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecaddc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the sum with a basis vector.
     
     $$
@@ -154,6 +178,9 @@ def vecaddc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],
     --------
     - for sum on more coefficients: [`vecadd`][vector.dense.vectorspace.vecadd]
     """
+    if out is not None:
+        factory = Resize(out)
+    
     def result():
         it = iter(v)
         yield from islice(chain(it, repeat(zero)), i)
@@ -187,7 +214,7 @@ def veciaddc(v:M, c:Any, i:int=0, zero:Any=0) -> M:
     return v
 
 
-def vecsub(v:Iterable, w:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecsub(v:Iterable, w:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the difference.
     
     $$
@@ -205,6 +232,15 @@ def vecsub(v:Iterable, w:Iterable, factory:Callable[[Iterable],V]|None=None) ->
     --------
     - for difference on a single coefficient: [`vecsubc`][vector.dense.vectorspace.vecsubc]
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedsub(v, w, factory)
+    if r is not NotImplemented:
+        return r
+    factory = factory or (iter if isinstance(v, Iterator) else type(v))
+    if _cdense is not None and factory is not iter:
+        return _cdense.vecsub(v, w, factory=factory)
+    
     def result():
         sentinel = object()
         for vi, wi in zip_longest(v, w, fillvalue=sentinel):
@@ -215,7 +251,6 @@ def vecsub(v:Iterable, w:Iterable, factory:Callable[[Iterable],V]|None=None) ->
             else:
                 yield vi - wi
     
-    factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(result())
 
 def vecisub(v:M, w:Iterable) -> M:
@@ -236,7 +271,7 @@ def vecisub(v:M, w:Iterable) -> M:
     return v
 
 
-def vecsubc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecsubc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the difference with a basis vector.
     
     $$
@@ -256,6 +291,9 @@ def vecsubc(v:Iterable, c:Any, i:int=0, zero:Any=0, factory:Callable[[Iterable],
     --------
     - for difference on more coefficients: [`vecsub`][vector.dense.vectorspace.vecsub]
     """
+    if out is not None:
+        factory = Resize(out)
+    
     def result():
         it = iter(v)
         yield from islice(chain(it, repeat(zero)), i)
@@ -289,7 +327,7 @@ def vecisubc(v:M, c:Any, i:int=0, zero:Any=0) -> M:
     return v
 
 
-def vecmul(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecmul(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the product.
     
     $$
@@ -302,10 +340,15 @@ def vecmul(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar multiplications (`rmul`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedscalar(np.multiply, v, a, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(mul, v, repeat(a)))
 
-def vecrmul(a:Any, v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecrmul(a:Any, v:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the product.
     
     $$
@@ -318,6 +361,11 @@ def vecrmul(a:Any, v:Iterable, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar multiplications (`rmul`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedscalar(np.multiply, v, a, factory, reflected=True)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(mul, repeat(a), v))
 
@@ -333,7 +381,7 @@ def vecimul(v:M, a:Any) -> M:
     return v
 
 
-def vectruediv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
+def vectruediv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the true quotient.
     
     $$
@@ -357,6 +405,11 @@ def vectruediv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V
     privileged over the other by getting the universal `div` name.
     - `truediv`/`floordiv` is unambiguous, like Python `operator`s.
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedscalar(np.divide, v, a, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(truediv, v, repeat(a)))
 
@@ -383,7 +436,7 @@ def vecitruediv(v:M, a:Any) -> M:
     return v
 
 
-def vecfloordiv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecfloordiv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the floor quotient.
     
     $$
@@ -396,6 +449,11 @@ def vecfloordiv(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) ->
     
     - $n$ scalar floor divisions (`floordiv`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedscalar(np.floor_divide, v, a, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(floordiv, v, repeat(a)))
 
@@ -411,7 +469,7 @@ def vecifloordiv(v:M, a:Any) -> M:
     return v
 
 
-def vecmod(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
+def vecmod(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
     r"""Return the remainder.
     
     $$
@@ -424,6 +482,11 @@ def vecmod(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None) -> V:
     
     - $n$ scalar modulos (`mod`).
     """
+    if out is not None:
+        factory = Resize(out)
+    r = typedscalar(np.mod, v, a, factory)
+    if r is not NotImplemented:
+        return r
     factory = factory or (iter if isinstance(v, Iterator) else type(v))
     return factory(map(mod, v, repeat(a)))
 
@@ -463,3 +526,118 @@ def vecdivmod(v:Iterable, a:Any, factory:Callable[[Iterable],V]|None=None):
         q.append(qi)
         r.append(ri)
     return factory(q), factory(r)
+
+
+def vecaxpy(a:Any, x:Iterable, y:Iterable, factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
+    r"""Return the scaled sum.
+    
+    $$
+        a\vec{x}+\vec{y} \qquad \mathbb{K}\times\mathbb{K}^m\times\mathbb{K}^n\to\mathbb{K}^{\max\{m, n\}}
+    $$
+    
+    More efficient than `vecadd(vecrmul(a, x), y)`.
+    
+    Complexity
+    ----------
+    For two vectors of lengths $m$ & $n$ there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - $\min\{m, n\}$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in-place: [`veciaxpy`][vector.dense.vectorspace.veciaxpy]
+    - for more vectors: [`veclincomb`][vector.dense.vectorspace.veclincomb]
+    """
+    if out is not None:
+        factory = Resize(out)
+    factory = factory or (iter if isinstance(x, Iterator) else type(x))
+    
+    def result():
+        for xi, yi in zip_longest(x, y, fillvalue=MISSING):
+            if yi is MISSING:
+                yield a * xi
+            elif xi is MISSING:
+                yield yi
+            else:
+                yield a * xi + yi
+    return factory(result())
+
+def veciaxpy(y:M, a:Any, x:Iterable) -> M:
+    r"""Add a scaled vector.
+    
+    $$
+        \vec{y} += a\vec{x} \qquad \mathbb{K}^n\times\mathbb{K}\times\mathbb{K}^m\to\mathbb{K}^{\max\{m, n\}}
+    $$
+    
+    More efficient than `veciadd(y, vecrmul(a, x))`.
+    
+    Complexity
+    ----------
+    For two vectors of lengths $n$ & $m$ there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - $\min\{m, n\}$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`vecaxpy`][vector.dense.vectorspace.vecaxpy]
+    """
+    it = iter(x)
+    for i, xi in zip(range(len(y)), it):
+        y[i] += a * xi
+    y.extend(a * xi for xi in it)
+    return y
+
+def veclincomb(coeffs:Iterable, vs:Iterable[Iterable], factory:Callable[[Iterable],V]|None=None, out:MutableSequence|None=None) -> V:
+    r"""Return the linear combination.
+    
+    $$
+        \sum_ia_i\vec{v}_i \qquad \mathbb{K}^N\times\mathbb{K}^{n_0}\times\mathbb{K}^{n_1}\times\cdots\to\mathbb{K}^{\max_i n_i}
+    $$
+    
+    More efficient than `vecadd(*map(vecrmul, coeffs, vs))`.
+    `coeffs` & `vs` must be of the same length.
+    
+    Complexity
+    ----------
+    For vectors of lengths $n_i$ there will be
+    
+    - $\sum_in_i$ scalar multiplications (`rmul`) &
+    - $\sum_in_i-\max_in_i$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in-place: [`vecilincomb`][vector.dense.vectorspace.vecilincomb]
+    """
+    if out is not None:
+        factory = Resize(out)
+    vs = tuple(vs)
+    if factory is None:
+        factory = (iter if isinstance(vs[0], Iterator) else type(vs[0])) if vs else tuple
+    terms = (map(mul, repeat(a), v) for a, v in zip(coeffs, vs, strict=True))
+    return factory(map(partial(sum_default, default=MISSING), group_ordinal(*terms)))
+
+def vecilincomb(v:M, coeffs:Iterable, ws:Iterable[Iterable]) -> M:
+    r"""Add a linear combination.
+    
+    $$
+        \vec{v} += \sum_ia_i\vec{w}_i \qquad \mathbb{K}^n\times\mathbb{K}^N\times\mathbb{K}^{m_0}\times\mathbb{K}^{m_1}\times\cdots\to\mathbb{K}^{\max\{n, \max_i m_i\}}
+    $$
+    
+    `coeffs` & `ws` must be of the same length.
+    
+    Complexity
+    ----------
+    For vectors of lengths $m_i$ there will be
+    
+    - $\sum_im_i$ scalar multiplications (`rmul`) &
+    - at most $\sum_im_i$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`veclincomb`][vector.dense.vectorspace.veclincomb]
+    """
+    for a, w in zip(coeffs, ws, strict=True):
+        veciaxpy(v, a, w)
+    return v
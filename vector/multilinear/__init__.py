@@ -9,6 +9,13 @@ Tensors are accepted as [`numpy.array_like`](https://numpy.org/doc/stable/glossa
 Broadcasting happens similar to [`numpy`s broadcasting](https://numpy.org/doc/stable/user/basics.broadcasting.html),
 but the axes are matched in ascending order instead of descending order, and
 the arrays don't get stretched but rather padded with zeros.
+
+Result dtypes are promoted from the operands, where zero-dimensional `object`
+zeros like `tenzero` don't count. `tenadd`, `tensub` & `tenhadamard` can be
+pinned to a `dtype` (e.g. `float64`, `complex128`, `int64`) and, with
+`checked=True`, detect signed integer overflows and fall back to Python `int`s.
+
+`tenconv` multiplies tensors as polynomials, by FFT for large float tensors.
 """
 
 
@@ -18,3 +25,4 @@ from .utility import *
 from .hilbertspace import *
 from .vectorspace import *
 from .elementwise import *
+from .algebra import *
@@ -0,0 +1,60 @@
+"""dtype policy of the tensor functions.
+
+By default the result dtype is promoted from the operands by
+`numpy.result_type`. Zero-dimensional `object` zeros (like `tenzero`) carry
+no type information and are ignored, so mixing them in doesn't turn a native
+pipeline into Python-object arithmetic.
+
+A `dtype` can be pinned instead, the operands are then converted to it and
+the results keep it.
+
+`numpy` integers wrap around silently on overflow. In `checked` mode signed
+integer results are verified and, on overflow, the operation is repeated on
+Python `int`s (`object` dtype).
+"""
+
+import numpy as np
+
+
+
+def untyped(t):
+    """Return if `t` is a zero-dimensional `object` zero (like `tenzero`)."""
+    return t.dtype==object and t.ndim==0 and t.item()==0
+
+def result_type(ts, dtype=None):
+    """Return the dtype of a result of the tensors `ts`.
+    
+    `object` if there is neither a pinned `dtype` nor a typed operand.
+    """
+    if dtype is not None:
+        return np.dtype(dtype)
+    typed = tuple(t for t in ts if not untyped(t))
+    return np.result_type(*typed) if typed else np.dtype(object)
+
+def overflows(f, a, b, r):
+    """Return where the signed integer result `r = f(a, b)` overflowed.
+    
+    `f` is one of `numpy.add`, `numpy.subtract` & `numpy.multiply`,
+    the mask has the broadcast shape of the operands.
+    """
+    a, b = np.asarray(a).astype(r.dtype), np.asarray(b).astype(r.dtype)
+    if f is np.add:
+        #sign of the result differs from both operands
+        return ((a ^ r) & (b ^ r)) < 0
+    if f is np.subtract:
+        return ((a ^ b) & (a ^ r)) < 0
+    #the product is exact iff it can be divided back
+    m = np.iinfo(r.dtype).min
+    with np.errstate(all='ignore'):
+        q = np.floor_divide(r, b, out=np.zeros_like(r), where=b!=0)
+    return ((b!=0) & (q!=a)) | ((a==-1) & (b==m)) | ((a==m) & (b==-1))
+
+def checked(f, a, b):
+    """Return `f(a, b)`, `None` if a signed integer result overflowed.
+    
+    `f` is one of `numpy.add`, `numpy.subtract` & `numpy.multiply`.
+    """
+    r = f(a, b)
+    if r.dtype.kind != 'i':
+        return r
+    return None if overflows(f, a, b, r).any() else r
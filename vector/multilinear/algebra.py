@@ -0,0 +1,69 @@
+from ._dtype import result_type
+import numpy as np
+
+
+
+__all__ = ('tenconv',)
+
+
+
+#products of the coefficient counts above which floats are convolved by FFT
+FFT_THRESHOLD = 2**12
+
+
+
+def tenconv(s, t, fft=None):
+    r"""Return the convolution (product of the multivariate polynomials).
+    
+    $$
+        (s*t)_k = \sum_{i+j=k}s_it_j
+    $$
+    
+    The result has the dimensionality $\dim_ks+\dim_kt-1$ in the $k$-th axis.
+    
+    Directly, for every nonzero coefficient of the smaller tensor a scaled
+    copy of the larger one is added, shifted to its index.
+    If `fft`, the convolution is computed as the product of the
+    [`numpy.fft.rfftn`](https://numpy.org/doc/stable/reference/generated/numpy.fft.rfftn.html)s
+    (`fftn` for complex tensors) instead. By default (`None`) the FFT is
+    used if both tensors are of floating (or complex) dtype and the product of
+    their sizes exceeds `FFT_THRESHOLD`.
+    
+    Complexity
+    ----------
+    For two tensors with $n$ & $m$ coefficients, of which $n'$ nonzero,
+    directly $n'm$ scalar multiplications & additions,
+    by FFT $\mathcal{O}(N\log N)$ for the $N$ coefficients of the result.
+    
+    Notes
+    -----
+    The FFT result is rounded to the floating dtype, exact zeros may
+    come out as tiny residues.
+    """
+    s, t = np.asarray(s), np.asarray(t)
+    rank = max(s.ndim, t.ndim)
+    if not rank:
+        return np.multiply(s, t).astype(result_type((s, t)))
+    s = s.reshape(s.shape + (1,)*(rank-s.ndim))
+    t = t.reshape(t.shape + (1,)*(rank-t.ndim))
+    shape = tuple(max(ds+dt-1, 0) for ds, dt in zip(s.shape, t.shape))
+    dtype = result_type((s, t))
+    if fft is None:
+        fft = s.dtype.kind in 'fc' and t.dtype.kind in 'fc' and s.size*t.size > FFT_THRESHOLD
+    if fft and s.size and t.size:
+        axes = tuple(range(rank))
+        #numpy transforms float32 in single precision
+        s, t = s.astype(dtype, copy=False), t.astype(dtype, copy=False)
+        if dtype.kind == 'c':
+            r = np.fft.ifftn(np.fft.fftn(s, shape, axes)*np.fft.fftn(t, shape, axes), shape, axes)
+        else:
+            r = np.fft.irfftn(np.fft.rfftn(s, shape, axes)*np.fft.rfftn(t, shape, axes), shape, axes)
+        return r.astype(dtype)
+    if s.size > t.size:
+        s, t = t, s
+    r = np.zeros(shape, dtype=dtype)
+    for i in zip(*np.nonzero(s)):
+        slc = tuple(slice(ik, ik+dtk) for ik, dtk in zip(i, t.shape))
+        #unsafe for ignored object zeros only, everything else is promoted
+        np.add(r[slc], s[i]*t, out=r[slc], casting='unsafe')
+    return r
@@ -1,4 +1,5 @@
 from ..dense.elementwise import vechadamardmax
+from ._dtype import result_type, checked as _checked
 import numpy as np
 
 
@@ -9,21 +10,29 @@ __all__ = ('tenhadamard', 'tenhadamardtruediv',
 
 
 
-def tenhadamard(*ts):
+def tenhadamard(*ts, dtype=None, checked=False):
     r"""Return the elementwise product.
     
     $$
         \left((t_0)_i \cdot (t_1)_i \cdot \cdots\right)_i
     $$
+    
+    The operands are converted to a given `dtype`, which the result keeps.
+    If `checked`, signed integer overflows are detected and the product is
+    computed on Python `int`s (`object` dtype) instead.
     """
-    ts = tuple(map(np.asarray, ts))
+    ts = tuple(np.asarray(t, dtype=dtype) for t in ts)
     shape = tuple(map(min, zip(*(t.shape for t in ts))))
-    r = np.zeros(shape, dtype=np.result_type(*ts) if ts else object)
+    r = np.zeros(shape, dtype=result_type(ts, dtype))
     slc = tuple(map(slice, shape)) + (...,)
     if ts:
-        r = ts[0][*slc]
+        r = ts[0][*slc].astype(r.dtype)
     for t in ts[1:]:
-        r *= t[*slc]
+        if not checked:
+            #unsafe for ignored object zeros only, everything else is promoted
+            np.multiply(r, t[*slc], out=r, casting='unsafe')
+        elif (r := _checked(np.multiply, r, t[*slc])) is None:
+            return tenhadamard(*(t.astype(object) for t in ts))
     return r
 
 def tenhadamardtruediv(s, t):
@@ -66,12 +75,38 @@ def tenhadamarddivmod(s, t):
     s, t = np.asarray(s), np.asarray(t)
     return np.divmod(s, t[tuple(map(slice, s.shape)), ...])
 
+def _keyselect(r, filled, ts, key, compare):
+    """Fill `r` with the coefficients of `ts` selected by their keys.
+    
+    The keys are evaluated once per tensor, by `key` itself if it is a
+    `numpy.ufunc`, else by `numpy.frompyfunc`. A coefficient replaces an
+    earlier one if `compare` holds for their keys, so ties keep the first.
+    """
+    if not ts:
+        return
+    if not isinstance(key, np.ufunc):
+        key = np.frompyfunc(key, 1, 1)
+    ks = tuple(np.asarray(key(t)) for t in ts)
+    rk = np.empty(r.shape, dtype=np.result_type(*ks))
+    for t, k in zip(ts, ks):
+        slc = tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)
+        #compare only where filled, the other keys are uninitialised
+        select = np.logical_not(filled[slc])
+        compare(k, rk[slc], out=select, where=filled[slc])
+        r[slc] = np.where(select, t, r[slc])
+        rk[slc] = np.where(select, k, rk[slc])
+        filled[slc] = True
+
 def tenhadamardmin(*ts, key=None):
     r"""Return the elementwise minimum.
     
     $$
         \left(\min((t_0)_i, (t_1)_i, \cdots)\right)_i
     $$
+    
+    The `key` is evaluated once per coefficient, a `numpy.ufunc` as `key`
+    is applied to whole tensors at once.
+    Uncovered coefficients are zero.
     """
     ts = tuple(map(np.asarray, ts))
     shape = vechadamardmax(*(t.shape for t in ts))
@@ -83,25 +118,7 @@ def tenhadamardmin(*ts, key=None):
             r[slc] = np.where(filled[slc], np.minimum(r[slc], t), t)
             filled[slc] = True
     else:
-        kcache = np.empty(shape, dtype=object)
-        for t in ts:
-            slc = tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)
-            it = np.nditer(
-                [r[slc], t, filled[slc], kcache[slc]],
-                flags = ['refs_ok'],
-                op_flags = [['readwrite'], ['readonly'], ['readonly'], ['readwrite']]
-            )
-            for r_cell, t_cell, is_filled, k_cell in it:
-                t_val = t_cell.item()
-                t_key = key(t_val)
-                if not bool(is_filled):
-                    r_cell[...] = t_val
-                    k_cell[...] = t_key
-                else:
-                    if t_key < k_cell.item():
-                        r_cell[...] = t_val
-                        k_cell[...] = t_key
-            filled[slc] = True
+        _keyselect(r, filled, ts, key, np.less)
     r[~filled] = 0
     return r
 
@@ -111,6 +128,10 @@ def tenhadamardmax(*ts, key=None):
     $$
         \left(\max((t_0)_i, (t_1)_i, \cdots)\right)_i
     $$
+    
+    The `key` is evaluated once per coefficient, a `numpy.ufunc` as `key`
+    is applied to whole tensors at once.
+    Uncovered coefficients are zero.
     """
     ts = tuple(map(np.asarray, ts))
     shape = vechadamardmax(*(t.shape for t in ts))
@@ -122,24 +143,6 @@ def tenhadamardmax(*ts, key=None):
             r[slc] = np.where(filled[slc], np.maximum(r[slc], t), t)
             filled[slc] = True
     else:
-        kcache = np.empty(shape, dtype=object)
-        for t in ts:
-            slc = tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)
-            it = np.nditer(
-                [r[slc], t, filled[slc], kcache[slc]],
-                flags = ['refs_ok'],
-                op_flags = [['readwrite'], ['readonly'], ['readonly'], ['readwrite']]
-            )
-            for r_cell, t_cell, is_filled, k_cell in it:
-                t_val = t_cell.item()
-                t_key = key(t_val)
-                if not bool(is_filled):
-                    r_cell[...] = t_val
-                    k_cell[...] = t_key
-                else:
-                    if t_key > k_cell.item():
-                        r_cell[...] = t_val
-                        k_cell[...] = t_key
-            filled[slc] = True
+        _keyselect(r, filled, ts, key, np.greater)
     r[~filled] = 0
     return r
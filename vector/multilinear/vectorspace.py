@@ -1,10 +1,12 @@
 from ..dense.elementwise import vechadamardmax
+from ._dtype import result_type, untyped, checked as _checked
 import numpy as np
 
 
 
 __all__ = ('tenpos', 'tenneg', 'tenadd', 'tenaddc', 'tensub', 'tensubc',
-           'tenmul', 'tenrmul', 'tentruediv', 'tenfloordiv', 'tenmod', 'tendivmod')
+           'tenmul', 'tenrmul', 'tentruediv', 'tenfloordiv', 'tenmod', 'tendivmod',
+           'tenaxpy', 'tenlincomb')
 
 
 
@@ -34,22 +36,32 @@ def tenneg(t):
     """
     return np.negative(t)
 
-def tenadd(*ts):
+def tenadd(*ts, dtype=None, checked=False):
     r"""Return the sum.
     
     $$
         t_0 + t_1 + \cdots
     $$
     
+    The operands are converted to a given `dtype`, which the result keeps.
+    If `checked`, signed integer overflows are detected and the sum is
+    computed on Python `int`s (`object` dtype) instead.
+    
     See also
     --------
     - for sum on a single coefficient: [`tenaddc`][vector.multilinear.vectorspace.tenaddc]
     """
-    ts = tuple(map(np.asarray, ts))
+    ts = tuple(np.asarray(t, dtype=dtype) for t in ts)
     shape = vechadamardmax(*(t.shape for t in ts))
-    r = np.zeros(shape, dtype=np.result_type(*ts) if ts else object)
+    r = np.zeros(shape, dtype=result_type(ts, dtype))
     for t in ts:
-        r[tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)] += t
+        slc = tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)
+        if not checked:
+            r[slc] += t
+        elif (rt := _checked(np.add, r[slc], t)) is not None:
+            r[slc] = rt
+        else:
+            return tenadd(*(t.astype(object) for t in ts))
     return r
 
 def tenaddc(t, c, i=(0,)):
@@ -72,22 +84,32 @@ def tenaddc(t, c, i=(0,)):
     t[i + (0,)*(len(i)-t.ndim)] += c
     return t
 
-def tensub(s, t):
+def tensub(s, t, dtype=None, checked=False):
     """Return the difference.
     
     $$
         s - t
     $$
     
+    The operands are converted to a given `dtype`, which the result keeps.
+    If `checked`, signed integer overflows are detected and the difference is
+    computed on Python `int`s (`object` dtype) instead.
+    
     See also
     --------
     - for difference on a single coefficient: [`tensubc`][vector.multilinear.vectorspace.tensubc]
     """
-    s, t = np.asarray(s), np.asarray(t)
+    s, t = np.asarray(s, dtype=dtype), np.asarray(t, dtype=dtype)
     shape = vechadamardmax(s.shape, t.shape)
-    r = np.zeros(shape, dtype=np.result_type(s, t))
+    r = np.zeros(shape, dtype=result_type((s, t), dtype))
     r[tuple(map(slice, s.shape)) + (0,)*(r.ndim-s.ndim)] = s
-    r[tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)] -= t
+    slc = tuple(map(slice, t.shape)) + (0,)*(r.ndim-t.ndim)
+    if not checked:
+        r[slc] -= t
+    elif (rt := _checked(np.subtract, r[slc], t)) is not None:
+        r[slc] = rt
+    else:
+        return tensub(s.astype(object), t.astype(object))
     return r
 
 def tensubc(t, c, i=(0,)):
@@ -198,3 +220,100 @@ def tendivmod(t, a):
     - wraps: [`numpy.divmod`](https://numpy.org/doc/stable/reference/generated/numpy.divmod.html)
     """
     return np.divmod(t, a)
+
+def _scaled(a, t, checked):
+    """Return `a*t`, `None` if `checked` and a signed integer product overflowed.
+    
+    On Python objects if the scalar `a` doesn't fit into the dtype of `t`.
+    """
+    try:
+        p = _checked(np.multiply, a, t) if checked else np.multiply(a, t)
+    except OverflowError:
+        p = np.multiply(np.asarray(a, dtype=object), t.astype(object))
+    return None if p is None else np.asarray(p)
+
+def tenaxpy(a, x, y, dtype=None, checked=False):
+    r"""Return the scaled sum.
+    
+    $$
+        ax+y
+    $$
+    
+    More efficient than `tenadd(tenrmul(a, x), y)`.
+    
+    The dtype follows from the product $ax$ & $y$ (not from the scalar),
+    like for `tenadd(tenrmul(a, x), y)`. The tensors are converted to a given
+    `dtype`, which the result keeps. If `checked`, signed integer overflows
+    are detected and the result is computed on Python `int`s (`object` dtype)
+    instead.
+    
+    Complexity
+    ----------
+    For a tensor $x$ with $m$ coefficients there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - $m$ scalar additions (`add`, padded with zeros where $y$ is smaller).
+    
+    See also
+    --------
+    - for more tensors: [`tenlincomb`][vector.multilinear.vectorspace.tenlincomb]
+    """
+    x, y = np.asarray(x, dtype=dtype), np.asarray(y, dtype=dtype)
+    if (p := _scaled(a, x, checked)) is None:
+        return tenaxpy(a, x.astype(object), y.astype(object))
+    if dtype is not None:
+        p = p.astype(dtype, copy=False)
+    shape = vechadamardmax(p.shape, y.shape)
+    r = np.zeros(shape, dtype=result_type((p, y), dtype))
+    r[tuple(map(slice, y.shape)) + (0,)*(r.ndim-y.ndim)] = y
+    slc = tuple(map(slice, p.shape)) + (0,)*(r.ndim-p.ndim)
+    if untyped(p):
+        pass
+    elif not checked:
+        r[slc] += p
+    elif (rt := _checked(np.add, r[slc], p)) is not None:
+        r[slc] = rt
+    else:
+        return tenaxpy(a, x.astype(object), y.astype(object))
+    return r
+
+def tenlincomb(coeffs, ts, dtype=None, checked=False):
+    r"""Return the linear combination.
+    
+    $$
+        \sum_ia_it_i
+    $$
+    
+    More efficient than `tenadd(*map(tenrmul, coeffs, ts))`.
+    `coeffs` & `ts` must be of the same length.
+    
+    `dtype` & `checked` like in [`tenaxpy`][vector.multilinear.vectorspace.tenaxpy].
+    
+    Complexity
+    ----------
+    For tensors with $n_i$ coefficients there will be
+    
+    - $\sum_in_i$ scalar multiplications (`rmul`) &
+    - $\sum_in_i$ scalar additions (`add`, into a zero initialised result).
+    """
+    coeffs, ts = tuple(coeffs), tuple(np.asarray(t, dtype=dtype) for t in ts)
+    if len(coeffs) != len(ts):
+        raise ValueError('coeffs and ts must be of the same length')
+    ps = tuple(_scaled(a, t, checked) for a, t in zip(coeffs, ts))
+    if any(p is None for p in ps):
+        return tenlincomb(coeffs, (t.astype(object) for t in ts))
+    if dtype is not None:
+        ps = tuple(p.astype(dtype, copy=False) for p in ps)
+    shape = vechadamardmax(*(p.shape for p in ps))
+    r = np.zeros(shape, dtype=result_type(ps, dtype))
+    for p in ps:
+        slc = tuple(map(slice, p.shape)) + (0,)*(r.ndim-p.ndim)
+        if untyped(p):
+            continue
+        if not checked:
+            r[slc] += p
+        elif (rt := _checked(np.add, r[slc], p)) is not None:
+            r[slc] = rt
+        else:
+            return tenlincomb(coeffs, (t.astype(object) for t in ts))
+    return r
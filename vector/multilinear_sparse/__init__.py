@@ -5,6 +5,14 @@ Prefixed by `tens...` (tensor - sparse).
 Handle sparse multiaxis tensors, that for example represent multivariate polynomials.
 
 Sparse tensors are accepted and returned as **`dict`s** whos keys are **trimmed** (no trailing zeros), **non-negative `int` `tuples`**.
+
+For large tensors **`TensorSparseCOO`** stores the indices as one
+`(nnz, rank)` integer array and the coefficients as one value array
+(coordinate/COO layout). The `tensc...` functions operate on it with
+vectorised sorts, merges & broadcasts instead of per-key `tuple`s.
+
+`tensconv` (`TensorSparse.__matmul__`) multiplies tensors as polynomials,
+accumulating the products under `int`-encoded indices.
 """
 
 
@@ -15,4 +23,6 @@ from .utility import *
 from .hilbertspace import *
 from .vectorspace import *
 from .elementwise import *
+from .algebra import *
 from .objectoriented import *
+from .coo import *
@@ -0,0 +1,74 @@
+from .utility import tensdim
+from typing import Any
+from collections.abc import Mapping
+
+
+
+__all__ = ('tensconv',)
+
+
+
+def _strides(bases):
+    """Return the place values of a mixed radix with the given `bases`."""
+    strides, p = [], 1
+    for b in bases:
+        strides.append(p)
+        p *= b
+    return strides
+
+def _encode(t, strides):
+    """Return the coefficients with their indices encoded as `int`s."""
+    return [(sum(ik*sk for ik, sk in zip(i, strides)), ti) for i, ti in t.items()]
+
+def _decode(k, bases):
+    """Return the trimmed index encoded in `k`."""
+    i = []
+    for b in bases:
+        if not k:
+            break
+        k, ik = divmod(k, b)
+        i.append(ik)
+    return tuple(i)
+
+def tensconv(s:Mapping[tuple[int,...],Any], t:Mapping[tuple[int,...],Any]) -> dict[tuple[int,...],Any]:
+    r"""Return the convolution (product of the multivariate polynomials).
+    
+    $$
+        (s*t)_k = \sum_{i+j=k}s_it_j
+    $$
+    
+    Every index is encoded as a single `int` (Kronecker substitution): a
+    mixed radix with base $\dim_ks+\dim_kt-1$ in the $k$-th axis, so that the
+    sum of two codes is the code of the sum of two indices without carry.
+    The products are accumulated in a `dict` with these `int` keys, only
+    the resulting indices are decoded back to `tuple`s.
+    
+    Complexity
+    ----------
+    For two tensors with $n$ & $m$ coefficients there will be
+    
+    - $nm$ scalar multiplications (`mul`) &
+    - $nm-|\{i+j\}|$ scalar additions (`add`), one less per resulting index.
+    
+    Notes
+    -----
+    Products are summed in the iteration order of $s$ (outer) & $t$ (inner),
+    the first product for an index is taken as is.
+    """
+    if not s or not t:
+        return {}
+    ds, dt = tensdim(s), tensdim(t)
+    rank = max(len(ds), len(dt))
+    ds, dt = ds+(1,)*(rank-len(ds)), dt+(1,)*(rank-len(dt))
+    bases = [dsk+dtk-1 for dsk, dtk in zip(ds, dt)]
+    strides = _strides(bases)
+    tc = _encode(t, strides)
+    r:dict[int,Any] = {}
+    for i, si in _encode(s, strides):
+        for j, tj in tc:
+            k = i + j
+            if k in r:
+                r[k] += si * tj
+            else:
+                r[k] = si * tj
+    return {_decode(k, bases):rk for k, rk in r.items()}
@@ -0,0 +1,385 @@
+from ..sparse.batch import _values
+from bisect import bisect_left
+import numpy as np
+from typing import Any
+from collections.abc import Mapping
+
+
+
+__all__ = ('TensorSparseCOO',
+           'tenstoc', 'tensctos',
+           'tenscrank', 'tenscdim', 'tensceq', 'tensctrim',
+           'tenscrshift', 'tensclshift',
+           'tenscpos', 'tenscneg', 'tenscadd', 'tenscsub', 'tenscmul', 'tenscrmul',
+           'tenschadamard')
+
+
+
+def _order(indices):
+    """Return the permutation sorting the indices lexicographically (stable)."""
+    if not indices.shape[1]:
+        return np.arange(len(indices))
+    return np.lexsort(indices.T[::-1])
+
+def _groups(indices):
+    """Return the start positions of runs of equal sorted indices."""
+    if not len(indices):
+        return np.zeros(0, dtype=np.intp)
+    new = np.empty(len(indices), dtype=bool)
+    new[0] = True
+    new[1:] = (indices[1:]!=indices[:-1]).any(axis=1)
+    return np.flatnonzero(new)
+
+def _pad(indices, rank):
+    """Return the indices padded with zero columns to `rank`."""
+    if indices.shape[1] >= rank:
+        return indices
+    return np.pad(indices, ((0, 0), (0, rank-indices.shape[1])))
+
+def _concatenate(cs):
+    """Return the concatenated and sorted indices & coefficients of all tensors.
+    
+    Coefficients of the same index stay in the order of `cs`.
+    """
+    rank = max(c.indices.shape[1] for c in cs)
+    indices = np.concatenate([_pad(c.indices, rank) for c in cs])
+    values = np.concatenate([c.values for c in cs])
+    order = _order(indices)
+    return indices[order], values[order]
+
+def _lengths(indices):
+    """Return the trimmed length of every index."""
+    if not indices.shape[1]:
+        return np.zeros(len(indices), dtype=np.intp)
+    nonzero = indices!=0
+    return np.where(nonzero.any(axis=1), indices.shape[1]-np.argmax(nonzero[:,::-1], axis=1), 0)
+
+
+
+class TensorSparseCOO:
+    """Sparse tensor in coordinate (COO) layout.
+    
+    The `k`-th coefficient `values[k]` is at index `indices[k]`, an
+    `(nnz, rank)`-array of `numpy.int64`. Indices are zero-padded to a common
+    rank, sorted lexicographically and unique. Constructing from arbitrary
+    `indices` & `values` sorts them and adds coefficients of equal indices.
+    
+    Coefficients are stored as `numpy.float64` or `numpy.complex128` if all of
+    them are exactly `float`s or `complex`es, otherwise as Python objects
+    (`dtype=object`), so that no precision is lost.
+    
+    The container interface (`keys`, `items`, `in`, `[]`, ...) is the one of
+    [`TensorSparse`][vector.multilinear_sparse.objectoriented.TensorSparse]
+    with trimmed `tuple` keys, so `TensorSparse(c)` converts losslessly.
+    
+    Per coefficient an index costs `8*rank` bytes instead of a `tuple` & a
+    `dict` slot.
+    
+    See also
+    --------
+    - from `dict`s: [`tenstoc`][vector.multilinear_sparse.coo.tenstoc]
+    - to `dict`s: [`tensctos`][vector.multilinear_sparse.coo.tensctos]
+    """
+    __slots__ = ('indices', 'values')
+    
+    
+    
+    def __init__(self, indices=None, values=None):
+        if indices is None:
+            self.indices, self.values = np.zeros((0, 0), dtype=np.int64), _values([])
+            return
+        indices = np.asarray(indices, dtype=np.int64)
+        values = values if isinstance(values, np.ndarray) else _values(list(values))
+        order = _order(indices)
+        indices, values = indices[order], values[order]
+        starts = _groups(indices)
+        if len(starts) < len(indices):
+            values = np.add.reduceat(values, starts)
+        self.indices, self.values = indices[starts], values
+    
+    @classmethod
+    def _new(cls, indices, values):
+        """Return a tensor from already sorted & unique indices."""
+        r = cls.__new__(cls)
+        r.indices, r.values = indices, values
+        return r
+    
+    
+    
+    #container
+    def __bool__(self):
+        return bool(self.values.astype(bool).any())
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def keys(self):
+        indices = self.indices.tolist()
+        return (tuple(i[:l]) for i, l in zip(indices, _lengths(self.indices).tolist()))
+    
+    def items(self):
+        return zip(self.keys(), self.values.tolist())
+    
+    def __iter__(self):
+        return self.keys()
+    
+    def _find(self, key):
+        """Return the position of the index `key`, `None` if not stored."""
+        rank, key = self.indices.shape[1], tuple(key)
+        if any(key[rank:]):
+            return None
+        key = key[:rank] + (0,)*(rank-len(key))
+        row = lambda j: tuple(self.indices[j].tolist())
+        j = bisect_left(range(len(self)), key, key=row)
+        return j if j<len(self) and row(j)==key else None
+    
+    def __contains__(self, key):
+        return self._find(key) is not None
+    
+    def __getitem__(self, key):
+        j = self._find(key)
+        return self.values[j:j+1].tolist()[0] if j is not None else 0
+    
+    
+    #utility
+    def rank(self):
+        return tenscrank(self)
+    
+    def dim(self):
+        return tenscdim(self)
+    
+    def __eq__(self, other):
+        if isinstance(other, TensorSparseCOO):
+            return tensceq(self, other)
+        return NotImplemented
+    
+    def trim(self, tol=None):
+        return tensctrim(self, tol=tol)
+    
+    def __rshift__(self, other):
+        return tenscrshift(self, other)
+    
+    def __lshift__(self, other):
+        return tensclshift(self, other)
+    
+    
+    #vectorspace
+    def __pos__(self):
+        return tenscpos(self)
+    
+    def __neg__(self):
+        return tenscneg(self)
+    
+    def __add__(self, other):
+        return tenscadd(self, other)
+    
+    def __sub__(self, other):
+        return tenscsub(self, other)
+    
+    def __mul__(self, other):
+        return tenscmul(self, other)
+    
+    def __rmul__(self, other):
+        return tenscrmul(other, self)
+    
+    
+    #elementwise
+    def hadamard(self, *others):
+        return tenschadamard(self, *others)
+    
+    
+    #IO
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())!r})'
+
+
+
+#conversion
+def tenstoc(t:Mapping[tuple[int,...],Any]) -> TensorSparseCOO:
+    """Return a sparse tensor (`dict`) in COO layout.
+    
+    Lossless, explicitly stored zeros are kept.
+    
+    See also
+    --------
+    - inverse: [`tensctos`][vector.multilinear_sparse.coo.tensctos]
+    """
+    rank = max(map(len, t.keys()), default=0)
+    indices = np.zeros((len(t), rank), dtype=np.int64)
+    for k, i in enumerate(t.keys()):
+        indices[k,:len(i)] = i
+    return TensorSparseCOO(indices, _values(list(t.values())))
+
+def tensctos(c:TensorSparseCOO) -> dict[tuple[int,...],Any]:
+    """Return a sparse tensor in COO layout as `dict` with trimmed keys.
+    
+    See also
+    --------
+    - inverse: [`tenstoc`][vector.multilinear_sparse.coo.tenstoc]
+    """
+    return dict(c.items())
+
+
+
+#utility
+def tenscrank(c:TensorSparseCOO) -> int:
+    r"""Return the rank.
+    
+    $$
+        \text{rank}\,t
+    $$
+    
+    Same as [`tensrank`][vector.multilinear_sparse.utility.tensrank],
+    the length of the longest trimmed index.
+    """
+    return int(_lengths(c.indices).max(initial=0))
+
+def tenscdim(c:TensorSparseCOO) -> tuple[int,...]:
+    r"""Return the dimensionalities.
+    
+    $$
+        \dim t
+    $$
+    """
+    return tuple((c.indices[:,:tenscrank(c)].max(axis=0, initial=-1)+1).tolist())
+
+def tensceq(s:TensorSparseCOO, t:TensorSparseCOO) -> bool:
+    r"""Return whether two tensors are equal.
+    
+    $$
+        s\overset{?}{=}t
+    $$
+    
+    Missing coefficients are treated as zero.
+    """
+    return not tenscsub(s, t)
+
+def tensctrim(c:TensorSparseCOO, tol:Any|None=None) -> TensorSparseCOO:
+    """Remove all near zero (`abs(t_i)<=tol`) coefficients.
+    
+    `tol` may also be `None`,
+    then all coefficients that evaluate to `False` are trimmed.
+    """
+    if tol is None:
+        keep = c.values.astype(bool)
+    else:
+        keep = (np.abs(c.values) > tol).astype(bool)
+    indices = c.indices[keep]
+    return TensorSparseCOO._new(indices[:,:int(_lengths(indices).max(initial=0))], c.values[keep])
+
+def tenscrshift(c:TensorSparseCOO, n:tuple[int,...]) -> TensorSparseCOO:
+    """Shift coefficients up.
+    
+    A single broadcast addition on the index array,
+    the lexicographic order is kept.
+    """
+    n = np.asarray(n, dtype=np.int64).reshape(1, -1)
+    rank = max(c.indices.shape[1], n.shape[1])
+    return TensorSparseCOO._new(_pad(c.indices, rank)+_pad(n, rank), c.values)
+
+def tensclshift(c:TensorSparseCOO, n:tuple[int,...]) -> TensorSparseCOO:
+    """Shift coefficients down.
+    
+    A single broadcast subtraction on the index array,
+    coefficients shifted below zero in any axis are dropped.
+    """
+    n = np.asarray(n, dtype=np.int64).reshape(1, -1)
+    rank = max(c.indices.shape[1], n.shape[1])
+    indices = _pad(c.indices, rank) - _pad(n, rank)
+    keep = (indices>=0).all(axis=1)
+    return TensorSparseCOO._new(indices[keep], c.values[keep])
+
+
+
+#vectorspace
+def tenscpos(c:TensorSparseCOO) -> TensorSparseCOO:
+    """Return the identity.
+    
+    $$
+        +t
+    $$
+    """
+    return TensorSparseCOO._new(c.indices, +c.values)
+
+def tenscneg(c:TensorSparseCOO) -> TensorSparseCOO:
+    """Return the negation.
+    
+    $$
+        -t
+    $$
+    """
+    return TensorSparseCOO._new(c.indices, -c.values)
+
+def tenscadd(*cs:TensorSparseCOO) -> TensorSparseCOO:
+    r"""Return the sum.
+    
+    $$
+        t_0 + t_1 + \cdots
+    $$
+    
+    Same result as [`tensadd`][vector.multilinear_sparse.vectorspace.tensadd],
+    by a lexicographic sort & a segmented sum instead of hashing.
+    
+    Notes
+    -----
+    Coefficients present in only one tensor are taken as they are, no unary
+    plus is applied.
+    """
+    if not cs:
+        return TensorSparseCOO()
+    indices, values = _concatenate(cs)
+    starts = _groups(indices)
+    if len(values):
+        values = np.add.reduceat(values, starts)
+    return TensorSparseCOO._new(indices[starts], values)
+
+def tenscsub(s:TensorSparseCOO, t:TensorSparseCOO) -> TensorSparseCOO:
+    """Return the difference.
+    
+    $$
+        s - t
+    $$
+    
+    Same result as [`tenssub`][vector.multilinear_sparse.vectorspace.tenssub],
+    computed as $s+(-t)$.
+    """
+    return tenscadd(s, tenscneg(t))
+
+def tenscmul(c:TensorSparseCOO, a:Any) -> TensorSparseCOO:
+    """Return the product.
+    
+    $$
+        ta
+    $$
+    """
+    return TensorSparseCOO._new(c.indices, c.values*a)
+
+def tenscrmul(a:Any, c:TensorSparseCOO) -> TensorSparseCOO:
+    """Return the product.
+    
+    $$
+        at
+    $$
+    """
+    return TensorSparseCOO._new(c.indices, a*c.values)
+
+
+
+#elementwise
+def tenschadamard(*cs:TensorSparseCOO) -> TensorSparseCOO:
+    r"""Return the elementwise product.
+    
+    $$
+        \left((t_0)_i \cdot (t_1)_i \cdot \cdots\right)_i
+    $$
+    
+    Same result as [`tenshadamard`][vector.multilinear_sparse.elementwise.tenshadamard].
+    """
+    if not cs:
+        return TensorSparseCOO()
+    indices, values = _concatenate(cs)
+    starts = _groups(indices)
+    full = np.diff(np.r_[starts, len(indices)]) == len(cs)
+    if len(values):
+        values = np.multiply.reduceat(values, starts)[full]
+    return TensorSparseCOO._new(indices[starts[full]], values)
@@ -3,6 +3,7 @@ from .utility import tensrank, tensdim, tenseq, tenstrim, tensitrim, tensrshift,
 from .hilbertspace import tensconj, tensiconj
 from .vectorspace import tenspos, tensneg, tensadd, tensiadd, tensaddc, tensiaddc, tenssub, tensisub, tenssubc, tensisubc, tensmul, tensrmul, tensimul, tenstruediv, tensitruediv, tensfloordiv, tensifloordiv, tensmod, tensimod, tensdivmod
 from .elementwise import tenshadamard, tenshadamardtruediv, tenshadamardfloordiv, tenshadamardmod, tenshadamarddivmod, tenshadamardmin, tenshadamardmax
+from .algebra import tensconv
 from ..dense.utility import vectrim
 
 
@@ -233,6 +234,13 @@ class TensorSparse:
         return r
     
     
+    #algebra
+    def __matmul__(self, other):
+        r = type(self)()
+        r.data = tensconv(self.data, other.data)
+        return r
+    
+    
     #IO
     def __repr__(self):
         return f'{type(self).__name__}{self.data!r}'
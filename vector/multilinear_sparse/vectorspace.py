@@ -1,5 +1,5 @@
 from typing import Any
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping
 
 
 
@@ -13,7 +13,9 @@ __all__ = ('tenspos',             'tensipos',
            'tenstruediv',         'tensitruediv',
            'tensfloordiv',        'tensifloordiv',
            'tensmod',             'tensimod',
-           'tensdivmod')
+           'tensdivmod',
+           'tensaxpy',            'tensiaxpy',
+           'tenslincomb',         'tensilincomb')
 
 
 
@@ -315,3 +317,106 @@ def tensdivmod(t:Mapping[tuple[int,...],Any], a:Any) -> tuple[dict[tuple[int,...
     for i, ti in t.items():
         q[i], r[i] = divmod(ti, a)
     return q, r
+
+def tensaxpy(a:Any, x:Mapping[tuple[int,...],Any], y:Mapping[tuple[int,...],Any]) -> dict[tuple[int,...],Any]:
+    r"""Return the scaled sum.
+    
+    $$
+        ax+y
+    $$
+    
+    More efficient than `tensadd(tensrmul(a, x), y)`.
+    
+    Complexity
+    ----------
+    For two tensors with $m$ & $n$ elements there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - at most $\min\{m, n\}$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in-place: [`tensiaxpy`][vector.multilinear_sparse.vectorspace.tensiaxpy]
+    - for more tensors: [`tenslincomb`][vector.multilinear_sparse.vectorspace.tenslincomb]
+    """
+    r:dict[tuple[int,...],Any] = dict(y)
+    for i, xi in x.items():
+        if i in r:
+            r[i] = a*xi + r[i]
+        else:
+            r[i] = a*xi
+    return r
+
+def tensiaxpy(y:MutableMapping[tuple[int,...],Any], a:Any, x:Mapping[tuple[int,...],Any]) -> MutableMapping[tuple[int,...],Any]:
+    r"""Add a scaled tensor.
+    
+    $$
+        y += ax
+    $$
+    
+    More efficient than `tensiadd(y, tensrmul(a, x))`.
+    
+    Complexity
+    ----------
+    For two tensors with $n$ & $m$ elements there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - at most $\min\{m, n\}$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`tensaxpy`][vector.multilinear_sparse.vectorspace.tensaxpy]
+    """
+    for i, xi in x.items():
+        if i in y:
+            y[i] += a*xi
+        else:
+            y[i] = a*xi
+    return y
+
+def tenslincomb(coeffs:Iterable[Any], ts:Iterable[Mapping[tuple[int,...],Any]]) -> dict[tuple[int,...],Any]:
+    r"""Return the linear combination.
+    
+    $$
+        \sum_ia_it_i
+    $$
+    
+    More efficient than `tensadd(*map(tensrmul, coeffs, ts))`.
+    `coeffs` & `ts` must be of the same length.
+    
+    Complexity
+    ----------
+    For tensors with $n_i$ elements there will be
+    
+    - $\sum_in_i$ scalar multiplications (`rmul`) &
+    - at most $\sum_in_i-\max_in_i$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - in-place: [`tensilincomb`][vector.multilinear_sparse.vectorspace.tensilincomb]
+    """
+    return tensilincomb({}, coeffs, ts)
+
+def tensilincomb(s:MutableMapping[tuple[int,...],Any], coeffs:Iterable[Any], ts:Iterable[Mapping[tuple[int,...],Any]]) -> MutableMapping[tuple[int,...],Any]:
+    r"""Add a linear combination.
+    
+    $$
+        s += \sum_ia_it_i
+    $$
+    
+    `coeffs` & `ts` must be of the same length.
+    
+    Complexity
+    ----------
+    For tensors with $m_i$ elements there will be
+    
+    - $\sum_im_i$ scalar multiplications (`rmul`) &
+    - at most $\sum_im_i$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`tenslincomb`][vector.multilinear_sparse.vectorspace.tenslincomb]
+    """
+    for a, t in zip(coeffs, ts, strict=True):
+        tensiaxpy(s, a, t)
+    return s
@@ -0,0 +1,79 @@
+"""Process-pool map over many independent vector operations.
+
+```python
+>>> from fractions import Fraction
+>>> from vector import vecdot, parmap
+>>> parmap(vecdot, [((Fraction(1, 2), 1), (2, 3)), ((1,), (Fraction(1, 3),))])
+[Fraction(4, 1), Fraction(1, 3)]
+```
+
+For coefficient types `numpy` can't vectorise (`Fraction`, `Decimal`, ...)
+the work is distributed over a `concurrent.futures.ProcessPoolExecutor`.
+The argument tuples are sent in chunks, so the pickling overhead is paid
+once per chunk instead of once per call.
+
+The function and all arguments & results must be picklable.
+All `vec...`, `vecs...` & `tens...` functions are, but results that are
+lazy iterators (e.g. `vecadd` on generators) are not.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched
+from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+
+
+
+__all__ = ('parmap', 'parimap')
+
+
+
+def _starmapchunk(f, chunk):
+    """Return `f` applied to every argument tuple of a chunk."""
+    return [f(*args) for args in chunk]
+
+def parimap(f:Callable[...,Any], argss:Iterable[tuple], chunksize:int=1024, max_workers:int|None=None, executor=None, prefetch:int|None=None) -> Iterator[Any]:
+    """Yield `f(*args)` for every `args` in `argss`, computed in parallel.
+    
+    Results are yielded in input order as soon as their chunk is done.
+    The input is consumed lazily: at most `prefetch` chunks
+    (default twice `max_workers` or the number of CPUs) are in flight at a time,
+    so arbitrarily long (or infinite) inputs stream in bounded memory.
+    
+    If no `executor` is given, a `ProcessPoolExecutor` with `max_workers`
+    processes is created and shut down once the generator is exhausted
+    or closed. A given `executor` is used as is and left running.
+    
+    See also
+    --------
+    - eager version: [`parmap`][vector.parallel.parmap]
+    """
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(max_workers)
+    if prefetch is None:
+        prefetch = 2 * (max_workers or os.process_cpu_count() or 1)
+    pending = deque()
+    try:
+        for chunk in batched(argss, chunksize):
+            pending.append(executor.submit(_starmapchunk, f, chunk))
+            if len(pending) >= prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(cancel_futures=True)
+
+def parmap(f:Callable[...,Any], argss:Iterable[tuple], chunksize:int=1024, max_workers:int|None=None, executor=None) -> list[Any]:
+    """Return `[f(*args) for args in argss]`, computed in parallel.
+    
+    See also
+    --------
+    - streaming version: [`parimap`][vector.parallel.parimap]
+    """
+    return list(parimap(f, argss, chunksize=chunksize, max_workers=max_workers, executor=executor))
@@ -1,5 +1,9 @@
+from math import fsum
+from itertools import pairwise
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from .dense.utility import veceq
+from .dense.algebra import FFT_THRESHOLD, _fft
+from .multilinear._dtype import overflows
 
 
 
@@ -8,15 +12,34 @@ __all__ = (#creation
            #utility
            'vecnpdim', 'vecnpeq', 'vecnptrim', 'vecnpround',
            #Hilbert space
-           'vecnpabsq', 'vecnpabs', 'vecnpdot',
+           'vecnpabsq', 'vecnpabs', 'vecnpdot', 'vecnpgram',
            #vector space
            'vecnppos', 'vecnpneg', 'vecnpadd', 'vecnpsub',
-           'vecnpmul', 'vecnptruediv', 'vecnpfloordiv', 'vecnpmod')
+           'vecnpraggedadd', 'vecnpraggedsub',
+           'vecnpmul', 'vecnptruediv', 'vecnpfloordiv', 'vecnpmod',
+           #algebra
+           'vecnpconv')
+
+
+
+def _npblocks(f, workers, height, *args):
+    """Return `f` applied to contiguous row blocks, by `workers` threads.
+    
+    2D operands are split into at most `workers` blocks of `height` rows,
+    1D operands are passed whole. Results are returned in block order.
+    Every row is computed by the same kernel as in a single call, so the
+    results don't depend on the number of workers. `numpy` releases the GIL
+    in its kernels (not for `object` dtype).
+    """
+    bounds = np.linspace(0, height, min(workers, max(height, 1))+1).astype(int)
+    blocks = [tuple(a[i:j] if np.ndim(a)==2 else a for a in args) for i, j in pairwise(bounds)]
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(lambda b: f(*b), blocks))
 
 
 
 #creation
-def vecnpzero(d=None):
+def vecnpzero(d=None, dtype=object):
     r"""Return `d` zero vectors.
     
     $$
@@ -27,18 +50,24 @@ def vecnpzero(d=None):
     
     The returned value is a `(d, 1)`-array of zeros if `d` is not `None`
     or `[0]` otherwise.
+    
+    By default of `object` dtype like `numpy.polynomial.polynomial.polyzero`.
+    Such zero vectors carry no type information and are ignored by the dtype
+    promotion of `vecnpadd` & `vecnpsub`, so they don't turn native
+    arithmetic into Python-object arithmetic. A native `dtype` can be given.
     """
     #same dtype as numpy.polynomial.polynomial.polyzero
-    return np.zeros(1 if d is None else (d, 1), dtype=object)
+    return np.zeros(1 if d is None else (d, 1), dtype=dtype)
 
-def vecnpbasis(i, c=1, d=None):
+def vecnpbasis(i, c=1, d=None, dtype=None):
     """Return `d` many `i`-th basis vectors times `c`.
     
     The returned value is a `(d, i+1)`-array if `d` is not `None`
-    or `(i+1,)` otherwise.
+    or `(i+1,)` otherwise. The dtype is `dtype`, by default that of `c`.
     """
     #choose dtype acc to c
-    v = np.zeros(i+1 if d is None else (d, i+1), dtype=np.dtype(type(c)))
+    dtype = np.dtype(type(c)) if dtype is None else dtype
+    v = np.zeros(i+1 if d is None else (d, i+1), dtype=dtype)
     v[..., -1] = c #maybe scalar, maybe (d,)-array
     return v
 
@@ -66,22 +95,47 @@ def vecnpdim(v):
     return np.asarray(v).shape[-1]
 
 def vecnpeq(v, w):
-    """Return if two vectors are equal."""
+    """Return if two vectors are equal.
+    
+    Missing coefficients of the shorter vectors are zero. The common part is
+    compared elementwise and the excess checked for zeros, both reduced at
+    once over all rows.
+    """
     v, w = np.asarray(v), np.asarray(w)
-    if v.ndim == w.ndim == 1:
-        return veceq(v, w)
-    return np.array([veceq(v[i] if v.ndim>1 else v, w[i] if w.ndim>1 else w) \
-            for i in range(v.shape[0] if v.ndim>1 else w.shape[0])])
+    n = min(v.shape[-1], w.shape[-1])
+    r = np.all(v[...,:n] == w[...,:n], axis=-1) \
+            & ~np.any(v[...,n:], axis=-1) & ~np.any(w[...,n:], axis=-1)
+    return bool(r) if v.ndim == w.ndim == 1 else r
+
+def _nplengths(v, tol):
+    """Return the trimmed length of every vector, 0 if it is near zero."""
+    #not <=, so that nan counts as nonzero
+    nz = ~(np.abs(v) <= tol)
+    return np.where(nz.any(axis=-1), v.shape[-1]-np.argmax(nz[...,::-1], axis=-1), 0)
 
-def vecnptrim(v, tol=1e-9):
-    """Remove all trailing near zero (abs(v_i)<=tol) coefficients."""
+def vecnptrim(v, tol=1e-9, lengths=False, workers=None):
+    """Remove all trailing near zero (abs(v_i)<=tol) coefficients.
+    
+    The last column with a coefficient above `tol` is found by a single
+    reduction. At least one (zeroed) coefficient is left.
+    
+    If `lengths`, the trimmed length of every vector (at least 1) is
+    returned too, e.g. for [`vecnpraggedadd`][vector.parallelised.vecnpraggedadd].
+    
+    With `workers` threads the rows of a 2D batch are scanned in blocks
+    concurrently.
+    """
     v = np.asarray(v)
-    #use np.all, because v[...,-1] maybe a scalar (not iterable)
-    while v.shape[-1]>1 and np.all(np.abs(v[...,-1])<=tol):
-        v = v[...,:-1]
-    if v.shape[-1]==1 and np.all(np.abs(v[...,0])<=tol): #leave 'leading' zero
+    if not v.shape[-1]:
+        return (v, np.zeros(v.shape[:-1], dtype=np.intp)) if lengths else v
+    if workers and v.ndim == 2:
+        ns = np.concatenate(_npblocks(lambda v: _nplengths(v, tol), workers, len(v), v))
+    else:
+        ns = _nplengths(v, tol)
+    v = v[...,:max(int(np.max(ns, initial=0)), 1)]
+    if not np.any(ns): #leave 'leading' zero
         v[...,0] = 0
-    return v
+    return (v, np.maximum(ns, 1)) if lengths else v
 
 def vecnpround(v, ndigits=0):
     """Wrapper for `numpy.round`."""
@@ -89,37 +143,231 @@ def vecnpround(v, ndigits=0):
 
 
 #Hilbert space
-def vecnpabsq(v):
-    """Return the sum of absolute squares of the coefficients."""
-    return np.sum(np.abs(v)**2, axis=-1)
+def _npsum(p, summation):
+    """Return the sums along the last axis by a `summation` mode.
+    
+    `None` & `'pairwise'` are `numpy.sum` (pairwise for contiguous rows),
+    `'naive'` & `'kahan'` run vectorised over the columns,
+    `'exact'` calls `math.fsum` per vector.
+    """
+    match summation:
+        case None | 'pairwise':
+            return np.sum(p, axis=-1)
+        case 'naive':
+            s = np.zeros(p.shape[:-1], dtype=p.dtype)
+            for k in range(p.shape[-1]):
+                s += p[...,k]
+            return s
+        case 'kahan':
+            if p.dtype.kind == 'c':
+                return _npsum(p.real, summation) + 1j*_npsum(p.imag, summation)
+            s, c = np.zeros(p.shape[:-1], dtype=p.dtype), np.zeros(p.shape[:-1], dtype=p.dtype)
+            #no compensation for infinite & nan sums (inf-inf), like math.fsum
+            with np.errstate(invalid='ignore'):
+                for k in range(p.shape[-1]):
+                    x = p[...,k]
+                    t = s + x
+                    c += np.where(np.abs(s)>=np.abs(x), (s-t)+x, (x-t)+s)
+                    s = t
+                return np.where(np.isfinite(s), s + c, s)[()] if p.dtype.kind == 'f' else s + c
+        case 'exact':
+            if p.dtype.kind == 'c':
+                return _npsum(p.real, summation) + 1j*_npsum(p.imag, summation)
+            return np.apply_along_axis(lambda x: fsum(x.tolist()), -1, p) if p.shape[-1] \
+                    else np.zeros(p.shape[:-1], dtype=p.dtype)
+    raise ValueError(f'unknown summation mode {summation!r}')
 
-def vecnpabs(v):
-    """Return the Euclidean/L2-norm."""
-    return np.linalg.norm(v, axis=-1)
+def vecnpabsq(v, summation=None):
+    """Return the sum of absolute squares of the coefficients.
+    
+    The squares are summed by a `summation` mode (`'naive'`, `'pairwise'`,
+    `'kahan'` or `'exact'`, see [`summate`][vector.util.summate]).
+    """
+    return _npsum(np.abs(v)**2, summation)
 
-def vecnpdot(v, w):
-    """Return the inner product of two vectors without conjugation."""
-    v, w = np.asarray(v), np.asarray(w)
+def vecnpabs(v, summation=None, workers=None):
+    """Return the Euclidean/L2-norm.
+    
+    With a `summation` mode the square root of `vecnpabsq`.
+    
+    With `workers` threads the rows of a 2D batch are reduced in blocks
+    concurrently, with the same results.
+    """
+    if workers and np.ndim(v) == 2:
+        v = np.asarray(v)
+        return np.concatenate(_npblocks(lambda v: vecnpabs(v, summation), workers, len(v), v))
+    if summation is None:
+        return np.linalg.norm(v, axis=-1)
+    return np.sqrt(vecnpabsq(v, summation))
+
+def vecnpdot(v, w, summation=None, dtype=None, checked=False, workers=None):
+    """Return the inner product of two vectors without conjugation.
+    
+    The products are summed by a `summation` mode like in `vecnpabsq`.
+    
+    The operands are converted to a given `dtype`. If `checked`, signed
+    integer inner products that may have overflowed are recomputed on Python
+    `int`s, only for the affected vectors (the result is then of `object`
+    dtype). Products & sums wrap around modulo $2^{64}$, so an inner product
+    is exact if the sum of its absolute products (estimated in floating
+    point) stays below $2^{62}$.
+    
+    With `workers` threads the rows of a 2D batch are reduced in blocks
+    concurrently, with the same results.
+    """
+    v, w = np.asarray(v, dtype=dtype), np.asarray(w, dtype=dtype)
     shape = tuple(reversed(tuple(
             map(min, zip(reversed(v.shape), reversed(w.shape))))))
-    return np.sum(v[...,*map(slice, shape)]*w[...,*map(slice, shape)], axis=-1)
+    v, w = v[...,*map(slice, shape)], w[...,*map(slice, shape)]
+    if workers and len(shape) == 2:
+        return np.concatenate(_npblocks(lambda v, w: vecnpdot(v, w, summation, checked=checked),
+                                        workers, shape[0], v, w))
+    r = _npsum(v*w, summation)
+    if checked and r.dtype.kind == 'i':
+        bound = np.sum(np.abs(v.astype(float))*np.abs(w.astype(float)), axis=-1)
+        r = _npexact(r, bound>=2.**62, lambda v, w: np.sum(v*w, axis=-1), (v, w))
+    return r
+
+
+def _npstack(vs):
+    """Return the vectors as rows of a zero-padded 2D array."""
+    if isinstance(vs, np.ndarray) and vs.ndim == 2:
+        return vs
+    vs = list(map(np.asarray, vs))
+    r = np.zeros((len(vs), max((len(v) for v in vs), default=0)), dtype=np.result_type(*vs) if vs else float)
+    for i, v in enumerate(vs):
+        r[i,:len(v)] = v
+    return r
 
+def _npgramtiles(v, w, symmetric, triangular, conjugate, block):
+    """Yield the tiles `(i, j, tile)` of the Gram matrix `v @ w.T`.
+    
+    For `symmetric` matrices the lower tiles are mirrored from the upper
+    ones (conjugated if `conjugate`) or, if `triangular`, left out.
+    """
+    mirror = (lambda t: t.T.conj()) if conjugate else (lambda t: t.T)
+    n, m = len(v), len(w)
+    for i in range(0, n, block):
+        for j in range(i if symmetric else 0, m, block):
+            t = v[i:i+block] @ w[j:j+block].T
+            if symmetric and i==j:
+                t = np.triu(t) if triangular else np.triu(t) + mirror(np.triu(t, 1))
+            yield i, j, t
+            if symmetric and not triangular and i!=j:
+                yield j, i, mirror(t)
+
+def vecnpgram(vs, ws=None, weights=None, conjugate=False, triangular=False, block=None):
+    """Return the Gram matrix (all pairwise inner products) of vectors.
+    
+    `vs` & `ws` are 2D arrays (vectors as rows) or sequences of vectors of
+    different lengths, which are zero-padded. The matrix is a single matrix
+    product `vs @ ws.T` (with conjugation & `weights` applied to `vs`).
+    
+    Without `ws` only the upper triangle is computed, and mirrored unless
+    `triangular`. With `block` a generator of the tiles `(i, j, tile)` is
+    returned instead, like in [`vecgram`][vector.dense.hilbertspace.vecgram].
+    """
+    v = _npstack(vs)
+    symmetric = ws is None
+    w = v if symmetric else _npstack(ws)
+    d = min(v.shape[1], w.shape[1])
+    if weights is not None:
+        weights = np.asarray(weights)
+        d = min(d, len(weights))
+    v, w = v[:,:d], w[:,:d]
+    if conjugate:
+        v = v.conj()
+    if weights is not None:
+        v = v * weights[:d]
+    tiles = _npgramtiles(v, w, symmetric, triangular, conjugate, block or max(len(v), len(w), 1))
+    if block:
+        return tiles
+    r = np.zeros((len(v), len(w)), dtype=np.result_type(v, w))
+    for i, j, t in tiles:
+        r[i:i+t.shape[0], j:j+t.shape[1]] = t
+    return r
 
 #vector space
-def vecnppos(v):
+def _npzero(v):
+    """Return if `v` is an `object` zero vector (like `vecnpzero`)."""
+    return v.dtype==object and v.shape[-1]<=1 and not v.any()
+
+def _npresult_type(vs, dtype=None):
+    """Return the dtype of a result of the vectors `vs`.
+    
+    `object` zero vectors are ignored, `object` if there is neither a
+    `dtype` nor a typed operand.
+    """
+    if dtype is not None:
+        return np.dtype(dtype)
+    typed = tuple(v for v in vs if not _npzero(v))
+    return np.result_type(*typed) if typed else np.dtype(object)
+
+def _npexact(r, bad, f, vs, out=None):
+    """Return `r` with the vectors `bad` recomputed by `f` on Python `int`s.
+    
+    `bad` is a scalar for a 1D result or a mask of the rows for a 2D result,
+    1D operands are broadcast. `r` is promoted to `object` dtype, which a
+    given native `out` can't hold (`OverflowError`).
+    """
+    if not np.any(bad):
+        return r if out is None else out
+    if out is not None:
+        raise OverflowError(f'integer overflow in output of dtype {out.dtype}')
+    if np.ndim(r) < 2:
+        return f(*(v.astype(object) for v in vs))
+    r = r.astype(object)
+    r[bad] = f(*((v[bad] if v.ndim == 2 else v).astype(object) for v in vs))
+    return r
+
+def _outprefix(out, shape):
+    """Return the leading `shape` part of `out`, the remaining coefficients are zeroed.
+    
+    A longer `out` represents the same vectors (trailing zeros),
+    a shorter one or a different height raises a `ValueError`.
+    """
+    if out.shape[:-1]!=tuple(shape[:-1]) or out.shape[-1]<shape[-1]:
+        raise ValueError(f'output of shape {out.shape} can\'t hold a result of shape {tuple(shape)}')
+    out[...,shape[-1]:] = 0
+    return out[...,:shape[-1]]
+
+def _ufunc(f, out, *args):
+    """Apply the ufunc `f`, writing into `out` if given."""
+    if out is None:
+        return f(*args)
+    f(*args, out=_outprefix(out, np.broadcast_shapes(*map(np.shape, args))))
+    return out
+
+def vecnppos(v, out=None):
     """Return the vector with the unary positive operator applied."""
-    return +np.asarray(v)
+    return _ufunc(np.positive, out, np.asarray(v))
 
-def vecnpneg(v):
+def vecnpneg(v, out=None):
     """Return the vector with the unary negative operator applied."""
-    return -np.asarray(v)
+    return _ufunc(np.negative, out, np.asarray(v))
 
-def vecnpadd(*vs):
-    """Return the sum of vectors."""
+def vecnpadd(*vs, out=None, dtype=None, checked=False, workers=None):
+    """Return the sum of vectors.
+    
+    If `out` is given, the result is written into it and it is returned.
+    It has to be at least as long as the longest vector,
+    additional coefficients are zeroed.
+    
+    The operands are converted to a given `dtype`, which the result keeps.
+    If `checked`, signed integer overflows are detected (vectorised) and
+    only the overflowing vectors are recomputed on Python `int`s, the
+    result is then of `object` dtype (`OverflowError` for a native `out`).
+    
+    With `workers` threads the rows of a 2D batch are added in blocks
+    concurrently, with the same results.
+    """
     if not vs: #empty sum
+        if out is not None:
+            out[...] = 0
+            return out
         return vecnpzero()
     
-    vs = tuple(map(np.asarray, vs))
+    vs = tuple(np.asarray(v, dtype=dtype) for v in vs)
     if not all(v.ndim in {1, 2} for v in vs): #all 1D or 2D
         raise ValueError
     
@@ -127,15 +375,57 @@ def vecnpadd(*vs):
     if len(heights) > 1: #all 2D same height
         raise ValueError
     
-    r = np.zeros(tuple(heights)+(max(v.shape[-1] for v in vs),),
-            dtype=np.result_type(*vs))
+    shape = tuple(heights)+(max(v.shape[-1] for v in vs),)
+    if workers and len(shape) == 2:
+        if checked or (out is not None and any(np.shares_memory(out, v) for v in vs)):
+            r = np.concatenate(_npblocks(lambda *vs: vecnpadd(*vs, checked=checked), workers, shape[0], *vs))
+            if out is None:
+                return r
+            if r.dtype==object and out.dtype!=object:
+                raise OverflowError(f'integer overflow in output of dtype {out.dtype}')
+            _outprefix(out, shape)[...] = r
+            return out
+        r = np.empty(shape, dtype=_npresult_type(vs)) if out is None else _outprefix(out, shape)
+        _npblocks(lambda r, *vs: vecnpadd(*vs, out=r), workers, shape[0], r, *vs)
+        return r if out is None else out
+    operands = vs
+    if out is None:
+        r = np.zeros(shape, dtype=_npresult_type(vs))
+    elif any(np.shares_memory(out, v) for v in vs[1:]):
+        #operands would be overwritten before they are read
+        r = vecnpadd(*vs, checked=checked)
+        if checked and r.dtype==object and out.dtype!=object:
+            raise OverflowError(f'integer overflow in output of dtype {out.dtype}')
+        _outprefix(out, shape)[...] = r
+        return out
+    else:
+        r = _outprefix(out, shape)
+        r[...,:vs[0].shape[-1]] = vs[0]
+        r[...,vs[0].shape[-1]:] = 0
+        vs = vs[1:]
+    bad = np.zeros(shape[:-1], dtype=bool)
     for v in vs:
-        r[...,:v.shape[-1]] += v
-    return r
+        n = v.shape[-1]
+        if r.dtype!=object and _npzero(v):
+            continue
+        if checked and r.dtype.kind == 'i':
+            t = r[...,:n] + v
+            bad |= overflows(np.add, r[...,:n], v, t).any(axis=-1)
+            r[...,:n] = t
+        else:
+            r[...,:n] += v
+    return _npexact(r, bad, vecnpadd, operands, out)
 
-def vecnpsub(v, w):
-    """Return the difference of two vectors."""
-    v, w = np.asarray(v), np.asarray(w)
+def vecnpsub(v, w, out=None, dtype=None, checked=False):
+    """Return the difference of two vectors.
+    
+    If `out` is given, the result is written into it and it is returned.
+    It has to be at least as long as the longer vector,
+    additional coefficients are zeroed.
+    
+    `dtype` & `checked` like in `vecnpadd`.
+    """
+    v, w = np.asarray(v, dtype=dtype), np.asarray(w, dtype=dtype)
     if v.ndim not in {1, 2} or w.ndim not in {1, 2}: #1D-1D, 1D-2D, 2D-1D, 2D-2D
         raise ValueError
     
@@ -143,24 +433,155 @@ def vecnpsub(v, w):
     if len(heights) > 1: #both same height if both 2D
         raise ValueError
     
-    r = np.zeros(tuple(heights)+(max(v.shape[-1], w.shape[-1]),),
-            dtype=np.result_type(v, w))
-    r[...,:v.shape[-1]] += v
-    r[...,:w.shape[-1]] -= w
-    return r
+    shape = tuple(heights)+(max(v.shape[-1], w.shape[-1]),)
+    if out is None:
+        r = np.zeros(shape, dtype=_npresult_type((v, w)))
+        if r.dtype==object or not _npzero(v):
+            r[...,:v.shape[-1]] += v
+    elif np.shares_memory(out, w):
+        #w would be overwritten before it is read
+        r = vecnpsub(v, w, checked=checked)
+        if checked and r.dtype==object and out.dtype!=object:
+            raise OverflowError(f'integer overflow in output of dtype {out.dtype}')
+        _outprefix(out, shape)[...] = r
+        return out
+    else:
+        r = _outprefix(out, shape)
+        r[...,:v.shape[-1]] = v
+        r[...,v.shape[-1]:] = 0
+    bad, n = np.zeros(shape[:-1], dtype=bool), w.shape[-1]
+    if r.dtype!=object and _npzero(w):
+        pass
+    elif checked and r.dtype.kind == 'i':
+        t = r[...,:n] - w
+        bad = overflows(np.subtract, r[...,:n], w, t).any(axis=-1)
+        r[...,:n] = t
+    else:
+        r[...,:n] -= w
+    return _npexact(r, bad, vecnpsub, (v, w), out)
+
+def _npragged(vs, lengths):
+    """Return the flat coefficients, the start of every vector in them & their lengths."""
+    if isinstance(vs, np.ndarray) and vs.ndim == 2:
+        #padded, rows are read in place
+        height, width = vs.shape
+        lengths = np.full(height, width) if lengths is None else np.asarray(lengths, dtype=np.intp)
+        if lengths.shape != (height,) or np.any((lengths < 0) | (lengths > width)):
+            raise ValueError(f'lengths {lengths} don\'t fit a padded array of shape {vs.shape}')
+        return vs.reshape(-1), np.arange(0, height*width, width), lengths
+    if lengths is not None:
+        raise ValueError('lengths are only given for a padded two-dimensional array')
+    vs = [np.asarray(v) for v in vs]
+    if not all(v.ndim == 1 for v in vs):
+        raise ValueError('ragged vectors must be one-dimensional')
+    lengths = np.fromiter(map(len, vs), dtype=np.intp, count=len(vs))
+    starts = np.zeros(len(vs), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return np.concatenate(vs) if vs else np.zeros(0), starts, lengths
 
-def vecnpmul(a, v):
-    """Return the product of a scalar and a vector."""
-    return a * np.asarray(v)
+def vecnpraggedadd(vs, lengths=None, out=None):
+    r"""Return the sum of many vectors of different lengths.
+    
+    `vs` are either one-dimensional vectors or a padded two-dimensional
+    array whose `i`-th row holds a vector of length `lengths[i]`
+    (default full width), coefficients beyond are ignored.
+    
+    Instead of adding every vector into a zero array of the full width, the
+    coefficients are gathered by index (the $k$-th coefficient of every
+    vector longer than $k$, longest vectors first) and reduced in one
+    `numpy.add.reduceat` pass. The gathered copy has as many coefficients
+    as the vectors, so many short vectors don't cost the full width each.
+    
+    If `out` is given, the result is written into it and it is returned.
+    It has to be at least as long as the longest vector,
+    additional coefficients are zeroed.
+    
+    Complexity
+    ----------
+    For $m$ vectors with $N$ coefficients in total
+    $\mathcal{O}(N+m\log m)$ operations and $\mathcal{O}(N)$ memory.
+    """
+    flat, starts, lengths = _npragged(vs, lengths)
+    n = int(lengths.max(initial=0))
+    if not n: #empty sum
+        if out is not None:
+            out[...] = 0
+            return out
+        return vecnpzero()
+    #longest first, so the vectors contributing to index k are the first counts[k]
+    order = np.argsort(-lengths, kind='stable')
+    counts = len(lengths) - np.cumsum(np.bincount(lengths, minlength=n)[:n])
+    ks = np.repeat(np.arange(n), counts)
+    bounds = np.zeros(n, dtype=np.intp)
+    np.cumsum(counts[:-1], out=bounds[1:])
+    js = np.arange(len(ks)) - np.repeat(bounds, counts)
+    gathered = flat[starts[order][js] + ks]
+    if out is None:
+        return np.add.reduceat(gathered, bounds)
+    np.add.reduceat(gathered, bounds, out=_outprefix(out, (n,)))
+    return out
+
+def vecnpraggedsub(v, ws, lengths=None, out=None):
+    """Return a vector minus many vectors of different lengths.
+    
+    `ws` are given like for [`vecnpraggedadd`][vector.parallelised.vecnpraggedadd],
+    their sum is subtracted from `v` by [`vecnpsub`][vector.parallelised.vecnpsub].
+    
+    If `out` is given, the result is written into it and it is returned.
+    It has to be at least as long as the longest vector,
+    additional coefficients are zeroed.
+    """
+    return vecnpsub(v, vecnpraggedadd(ws, lengths), out=out)
 
-def vecnptruediv(v, a):
+def vecnpmul(a, v, out=None, dtype=None, checked=False):
+    """Return the product of a scalar and a vector.
+    
+    `dtype` & `checked` like in `vecnpadd`.
+    """
+    v = np.asarray(v, dtype=dtype)
+    r = _ufunc(np.multiply, out, a, v)
+    if not checked or r.dtype.kind != 'i':
+        return r
+    p = r[...,:v.shape[-1]]
+    return _npexact(r, overflows(np.multiply, a, v, p).any(axis=-1), lambda v: np.asarray(a).astype(object)*v, (v,), out)
+
+def vecnptruediv(v, a, out=None):
     """Return the true division of a vector and a scalar."""
-    return np.asarray(v) / a
+    return _ufunc(np.true_divide, out, np.asarray(v), a)
 
-def vecnpfloordiv(v, a):
+def vecnpfloordiv(v, a, out=None):
     """Return the floor division of a vector and a scalar."""
-    return np.asarray(v) // a
+    return _ufunc(np.floor_divide, out, np.asarray(v), a)
 
-def vecnpmod(v, a):
+def vecnpmod(v, a, out=None):
     """Return the elementwise mod of a vector and a scalar."""
-    return np.asarray(v) % a
+    return _ufunc(np.mod, out, np.asarray(v), a)
+
+
+#algebra
+def vecnpconv(v, w):
+    """Return the convolution (product of the polynomials) of vectors.
+    
+    1D and 2D (same height) operands are broadcast like in `vecnpadd`.
+    Float and complex vectors are convolved by FFT along the last axis if the
+    shorter one has at least `FFT_THRESHOLD` coefficients. Otherwise, and
+    always for integer and object vectors (exact), scaled copies of the
+    longer vectors are added for every coefficient of the shorter ones.
+    """
+    v, w = np.asarray(v), np.asarray(w)
+    if v.ndim not in {1, 2} or w.ndim not in {1, 2} \
+            or (v.ndim==w.ndim==2 and v.shape[0]!=w.shape[0]):
+        raise ValueError
+    n, m = v.shape[-1], w.shape[-1]
+    shape = np.broadcast_shapes(v.shape[:-1], w.shape[:-1]) + (n+m-1 if n and m else 0,)
+    dtype = np.result_type(v, w)
+    if n and m and min(n, m)>=FFT_THRESHOLD and v.dtype.kind in 'fc' and w.dtype.kind in 'fc':
+        return _fft(v, w).astype(dtype, copy=False)
+    r = np.zeros(shape, dtype=dtype)
+    if n < m: #loop over the shorter, keep the order of multiplication
+        for i in range(n):
+            r[...,i:i+m] += v[...,i,np.newaxis] * w
+    else:
+        for j in range(m):
+            r[...,j:j+n] += v * w[...,j,np.newaxis]
+    return r
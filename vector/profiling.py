@@ -0,0 +1,160 @@
+"""Opt-in runtime profiling of the `vec...`, `vecs...`, `ten...` & `tens...` functions.
+
+```python
+>>> from vector import vecadd, vecabs, Profile
+>>> with Profile() as p:
+...     vecabs(vecadd((1, 2), (3, 4, 5)))
+>>> p.stats['vecadd']
+FunctionStats(calls=1, time=..., insize=5, outsize=3)
+```
+
+Built on `sys.monitoring`: while no profile is active, no events are
+registered and the functions run without any overhead. While active, the
+Python functions of the package are instrumented on the code object level,
+so no call sites have to be wrapped.
+
+Recorded per function are
+
+- the number of calls,
+- the cumulative wall time in nanoseconds (including nested calls),
+- the cumulative input size (lengths of all sized arguments, `numpy.ndarray`
+  sizes, variadic arguments summed up) &
+- the cumulative result size (same measure).
+
+Generator functions (e.g. `vecbases`) are not instrumented.
+"""
+
+import sys
+import inspect
+import threading
+from time import perf_counter_ns
+from collections.abc import Sized
+import numpy as np
+
+
+
+__all__ = ('FunctionStats', 'Profile')
+
+
+
+class FunctionStats:
+    """Accumulated statistics of a single function."""
+    __slots__ = ('calls', 'time', 'insize', 'outsize')
+    
+    def __init__(self):
+        self.calls = 0
+        self.time = 0
+        self.insize = 0
+        self.outsize = 0
+    
+    def __repr__(self):
+        return (f'{type(self).__name__}(calls={self.calls}, time={self.time}, '
+                f'insize={self.insize}, outsize={self.outsize})')
+
+
+
+def _size(x):
+    """Return the number of coefficients of `x`, `0` if not sized."""
+    if isinstance(x, np.ndarray):
+        return x.size
+    if isinstance(x, Sized) and not isinstance(x, (str, bytes)):
+        return len(x)
+    return 0
+
+def _functions():
+    """Return all instrumentable public functions of the package by code object."""
+    import vector
+    functions = {}
+    for name in vector.__all__ if hasattr(vector, '__all__') else dir(vector):
+        f = getattr(vector, name)
+        if (name.startswith(('vec', 'ten')) and inspect.isfunction(f)
+                and not inspect.isgeneratorfunction(f)):
+            functions[f.__code__] = name
+    return functions
+
+
+
+class Profile:
+    """Context manager recording statistics of all package function calls.
+    
+    Statistics are collected in `stats`, a `dict` mapping function names to
+    [`FunctionStats`][vector.profiling.FunctionStats].
+    A profile can be started & stopped multiple times, statistics accumulate.
+    Only one profile can be active at a time.
+    """
+    
+    TOOL_ID = sys.monitoring.PROFILER_ID
+    
+    def __init__(self):
+        self.stats = {}
+        self._functions = None
+        self._local = threading.local()
+    
+    def start(self):
+        """Start recording."""
+        mon = sys.monitoring
+        try:
+            mon.use_tool_id(self.TOOL_ID, 'vector')
+        except ValueError as e:
+            raise RuntimeError('another profiler is already active') from e
+        if self._functions is None:
+            self._functions = _functions()
+        mon.register_callback(self.TOOL_ID, mon.events.PY_START, self._start)
+        mon.register_callback(self.TOOL_ID, mon.events.PY_RETURN, self._return)
+        mon.register_callback(self.TOOL_ID, mon.events.PY_UNWIND, self._unwind)
+        for code in self._functions:
+            mon.set_local_events(self.TOOL_ID, code, mon.events.PY_START|mon.events.PY_RETURN)
+        mon.set_events(self.TOOL_ID, mon.events.PY_UNWIND)
+        return self
+    
+    def stop(self):
+        """Stop recording and remove all instrumentation."""
+        mon = sys.monitoring
+        mon.set_events(self.TOOL_ID, mon.events.NO_EVENTS)
+        for code in self._functions:
+            mon.set_local_events(self.TOOL_ID, code, mon.events.NO_EVENTS)
+        for event in (mon.events.PY_START, mon.events.PY_RETURN, mon.events.PY_UNWIND):
+            mon.register_callback(self.TOOL_ID, event, None)
+        mon.free_tool_id(self.TOOL_ID)
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+    
+    
+    
+    #callbacks
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+    
+    def _start(self, code, offset):
+        #the instrumented frame is the caller of this callback
+        frame = sys._getframe(1)
+        args = inspect.getargvalues(frame)
+        insize = sum(_size(frame.f_locals[name]) for name in args.args)
+        if args.varargs is not None:
+            insize += sum(map(_size, frame.f_locals[args.varargs]))
+        self._stack().append((code, insize, perf_counter_ns()))
+    
+    def _return(self, code, offset, retval):
+        t = perf_counter_ns()
+        stack = self._stack()
+        if not stack or stack[-1][0] is not code:
+            return
+        _, insize, t0 = stack.pop()
+        stats = self.stats.setdefault(self._functions[code], FunctionStats())
+        stats.calls += 1
+        stats.time += t - t0
+        stats.insize += insize
+        stats.outsize += _size(retval)
+    
+    def _unwind(self, code, offset, exception):
+        stack = self._stack()
+        if stack and stack[-1][0] is code:
+            stack.pop()
@@ -18,6 +18,18 @@ coefficients must be addable.
 
 Index keys are expected to be integers.
 
+Many sparse vectors can be packed into a single **`VectorSparseBatch`**
+(compressed sparse row layout, `numpy` index & coefficient arrays) and be
+operated on at once by the `vecsb...` (vector - sparse - batch) functions.
+
+**`VectorSparseSorted`** stores a sparse vector as sorted parallel index &
+coefficient lists (`vecso...`, vector - sparse - ordered). Binary operations
+are linear merges and give the same results as their `dict` counterparts.
+
+**`VectorSparseIndex`** keeps many `dict` vectors in inverted posting lists
+(index to vectors with a coefficient there) and answers top-k dot product &
+cosine similarity queries without scoring every vector.
+
 ## Docstring conventions
 
 Summary
@@ -50,3 +62,6 @@ from .hilbertspace import *
 from .vectorspace import *
 from .elementwise import *
 from .objectoriented import *
+from .batch import *
+from .ordered import *
+from .index import *
@@ -0,0 +1,249 @@
+from ..util import try_conjugate, summate
+import numpy as np
+from typing import Any
+from collections.abc import Iterable, Mapping
+
+
+
+__all__ = ('VectorSparseBatch',
+           'vecstob', 'vecbtos',
+           'vecsbadd', 'vecsbdot', 'vecsbabsq', 'vecsbtrim', 'vecsbhadamard')
+
+
+
+class VectorSparseBatch:
+    """Many sparse vectors in compressed sparse row (CSR) layout.
+    
+    The indices of the `i`-th vector are `indices[indptr[i]:indptr[i+1]]`
+    (sorted ascending) and its coefficients are
+    `values[indptr[i]:indptr[i+1]]`.
+    
+    Indices are stored as `numpy.int64`. Coefficients are stored as
+    `numpy.float64` or `numpy.complex128` if all of them are exactly `float`s
+    or `complex`es, otherwise as Python objects (`dtype=object`), so that no
+    precision is lost (e.g. `int`s don't overflow).
+    
+    See also
+    --------
+    - from `dict`s: [`vecstob`][vector.sparse.batch.vecstob]
+    - to `dict`s: [`vecbtos`][vector.sparse.batch.vecbtos]
+    """
+    __slots__ = ('indptr', 'indices', 'values')
+    
+    def __init__(self, indptr, indices, values):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+    
+    def __len__(self):
+        return len(self.indptr) - 1
+    
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError
+        slc = slice(self.indptr[i%len(self)], self.indptr[i%len(self)+1])
+        return dict(zip(self.indices[slc].tolist(), self.values[slc].tolist()))
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+
+def _values(values):
+    """Return the coefficients as lossless array."""
+    types = set(map(type, values))
+    if types == {float}:
+        return np.array(values, dtype=np.float64)
+    if types == {complex}:
+        return np.array(values, dtype=np.complex128)
+    r = np.empty(len(values), dtype=object)
+    r[:] = values
+    return r
+
+def _rows(b):
+    """Return the vector number of every stored coefficient."""
+    return np.repeat(np.arange(len(b)), np.diff(b.indptr))
+
+def _batch(n, rows, indices, values):
+    """Return a batch of `n` vectors from coefficients sorted by vector number."""
+    return VectorSparseBatch(np.searchsorted(rows, np.arange(n+1)), indices, values)
+
+def _concatenate(bs):
+    """Return the concatenated and by (vector, index) sorted coefficients.
+    
+    Coefficients of the same (vector, index) stay in the order of `bs`.
+    """
+    if len({len(b) for b in bs}) > 1:
+        raise ValueError('batches must contain the same number of vectors')
+    rows = np.concatenate([_rows(b) for b in bs])
+    indices = np.concatenate([b.indices for b in bs])
+    values = np.concatenate([b.values for b in bs])
+    order = np.lexsort((indices, rows)) #stable
+    return rows[order], indices[order], values[order]
+
+def _groups(rows, indices):
+    """Return the start positions of runs of equal (vector, index)."""
+    if not len(rows):
+        return np.zeros(0, dtype=np.intp)
+    new = np.empty(len(rows), dtype=bool)
+    new[0] = True
+    new[1:] = (rows[1:]!=rows[:-1]) | (indices[1:]!=indices[:-1])
+    return np.flatnonzero(new)
+
+def _rowsum(n, rows, values, zero, summation=None):
+    """Return the sum of `values` per vector, `zero` for empty vectors.
+    
+    With a `summation` mode every vector is summed by `summate`.
+    """
+    r = np.full(n, zero, dtype=values.dtype if values.dtype.kind in 'fc' else object)
+    if len(rows):
+        starts = np.flatnonzero(np.r_[True, rows[1:]!=rows[:-1]])
+        if summation is None:
+            r[rows[starts]] = np.add.reduceat(values, starts)
+        else:
+            for row, start, stop in zip(rows[starts].tolist(), starts.tolist(), np.r_[starts[1:], len(rows)].tolist()):
+                r[row] = summate(values[start:stop].tolist(), summation, zero)
+    return r
+
+def _conjugate(values):
+    """Return the elementwise complex conjugate like `try_conjugate`."""
+    if values.dtype.kind in 'fc':
+        return np.conjugate(values)
+    return _values([try_conjugate(vi) for vi in values])
+
+def _weights(weights, indices):
+    """Return the weights for the given indices."""
+    return _values([weights[i] for i in indices.tolist()])
+
+
+
+def vecstob(vs:Iterable[Mapping[int,Any]]) -> VectorSparseBatch:
+    """Return sparse vectors (`dict`s) as a batch.
+    
+    Lossless, explicitly stored zeros are kept.
+    
+    See also
+    --------
+    - inverse: [`vecbtos`][vector.sparse.batch.vecbtos]
+    """
+    indptr, indices, values = [0], [], []
+    for v in vs:
+        for i, vi in sorted(v.items(), key=lambda item: item[0]):
+            indices.append(i)
+            values.append(vi)
+        indptr.append(len(indices))
+    return VectorSparseBatch(np.array(indptr, dtype=np.intp),
+            np.array(indices, dtype=np.int64), _values(values))
+
+def vecbtos(b:VectorSparseBatch) -> list[dict[int,Any]]:
+    """Return a batch as sparse vectors (`dict`s).
+    
+    See also
+    --------
+    - inverse: [`vecstob`][vector.sparse.batch.vecstob]
+    """
+    return list(b)
+
+
+def vecsbadd(*bs:VectorSparseBatch) -> VectorSparseBatch:
+    r"""Return the sums.
+    
+    $$
+        \left(\vec{v}_{0,j}+\vec{v}_{1,j}+\cdots\right)_j
+    $$
+    
+    Batched version of [`vecsadd`][vector.sparse.vectorspace.vecsadd].
+    All batches must contain the same number of vectors.
+    
+    Complexity
+    ----------
+    For two batches with $n$ & $m$ stored coefficients there will be at most
+    
+    - $\min\{n, m\}$ scalar additions (`add`).
+    
+    Notes
+    -----
+    Coefficients present in only one vector are taken as they are, no unary
+    plus is applied.
+    """
+    if not bs:
+        return vecstob(())
+    rows, indices, values = _concatenate(bs)
+    starts = _groups(rows, indices)
+    if len(values):
+        values = np.add.reduceat(values, starts)
+    return _batch(len(bs[0]), rows[starts], indices[starts], values)
+
+def vecsbdot(b:VectorSparseBatch, c:VectorSparseBatch, weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> np.ndarray:
+    r"""Return the inner products.
+    
+    $$
+        \left(\left<\vec{v}_j\mid\vec{w}_j\right>_{\ell_{\mathbb{N}_0}^2}\right)_j
+    $$
+    
+    Batched version of [`vecsdot`][vector.sparse.hilbertspace.vecsdot].
+    Returns a `numpy.ndarray` with one inner product per vector pair.
+    Products are summed by a `summation` mode like in `vecsdot`.
+    """
+    rows, indices, values = _concatenate((b, c))
+    #equal (vector, index) pairs are adjacent with the one of `b` first
+    left = np.flatnonzero((rows[1:]==rows[:-1]) & (indices[1:]==indices[:-1]))
+    v, w = values[left], values[left+1]
+    products = (_conjugate(v) if conjugate else v) * w
+    if weights is not None:
+        products = products * _weights(weights, indices[left])
+    return _rowsum(len(b), rows[left], products, zero, summation)
+
+def vecsbabsq(b:VectorSparseBatch, weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> np.ndarray:
+    r"""Return the sums of absolute squares.
+    
+    $$
+        \left(||\vec{v}_j||_{\ell_{\mathbb{N}_0}^2}^2\right)_j
+    $$
+    
+    Batched version of [`vecsabsq`][vector.sparse.hilbertspace.vecsabsq].
+    Returns a `numpy.ndarray` with one absolute square per vector.
+    Products are summed by a `summation` mode like in `vecsabsq`.
+    """
+    products = (_conjugate(b.values) if conjugate else b.values) * b.values
+    if weights is not None:
+        products = products * _weights(weights, b.indices)
+    return _rowsum(len(b), _rows(b), products, zero, summation)
+
+def vecsbtrim(b:VectorSparseBatch, tol:Any|None=None) -> VectorSparseBatch:
+    """Remove all near zero (`abs(v_i)<=tol`) coefficients.
+    
+    Batched version of [`vecstrim`][vector.sparse.utility.vecstrim].
+    
+    `tol` may also be `None`,
+    then all coefficients that evaluate to `False` are trimmed.
+    """
+    if tol is None:
+        keep = b.values.astype(bool)
+    else:
+        keep = (np.abs(b.values) > tol).astype(bool)
+    return _batch(len(b), _rows(b)[keep], b.indices[keep], b.values[keep])
+
+def vecsbhadamard(*bs:VectorSparseBatch) -> VectorSparseBatch:
+    r"""Return the elementwise products.
+    
+    $$
+        \left(\left((\vec{v}_{0,j})_i\cdot(\vec{v}_{1,j})_i\cdot\cdots\right)_i\right)_j
+    $$
+    
+    Batched version of [`vecshadamard`][vector.sparse.elementwise.vecshadamard].
+    All batches must contain the same number of vectors.
+    """
+    if not bs:
+        return vecstob(())
+    rows, indices, values = _concatenate(bs)
+    starts = _groups(rows, indices)
+    full = np.diff(np.r_[starts, len(rows)]) == len(bs)
+    if len(values):
+        values = np.multiply.reduceat(values, starts)[full]
+    starts = starts[full]
+    return _batch(len(bs[0]), rows[starts], indices[starts], values)
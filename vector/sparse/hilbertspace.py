@@ -1,13 +1,13 @@
-from ..util import try_conjugate
+from ..util import try_conjugate, summate, _gramtiles, _gram
 from iteration import sum_default, sumprod_default
 from typing import Any
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Generator, Iterable, Mapping, MutableMapping
 
 
 
 __all__ = ('vecsconj', 'vecsiconj',
            'vecsabs', 'vecsabsq',
-           'vecsdot')
+           'vecsdot', 'vecsgram')
 
 
 
@@ -49,14 +49,15 @@ def vecsiconj(v:MutableMapping[int,Any]) -> MutableMapping[int,Any]:
         v[i] = try_conjugate(vi)
     return v
 
-def vecsabs(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecsabs(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the Euclidean/$\ell_{\mathbb{N}_0}^2$-norm.
     
     $$
         ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}=\sqrt{\sum_iv_i^{(*)}v_i\omega_i}
     $$
     
-    Returns the square root of [`vecsabsq`][vector.sparse.hilbertspace.vecsabsq].
+    Returns the square root of [`vecsabsq`][vector.sparse.hilbertspace.vecsabsq],
+    also with its `summation` mode.
     
     Complexity
     ----------
@@ -71,15 +72,19 @@ def vecsabs(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bo
     --------
     - squared version without square root: [`vecsabsq`][vector.sparse.hilbertspace.vecsabsq]
     """
-    return vecsabsq(v, weights=weights, conjugate=conjugate, zero=zero)**0.5
+    return vecsabsq(v, weights=weights, conjugate=conjugate, zero=zero, summation=summation)**0.5
 
-def vecsabsq(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecsabsq(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the sum of absolute squares.
     
     $$
         ||\vec{v}||_{\ell_{\mathbb{N}_0}^2}^2=\sum_iv_i^{(*)}v_i\omega_i \qquad \mathbb{K}^n\to\mathbb{K}_0^+
     $$
     
+    With a `summation` mode (`'naive'`, `'pairwise'`, `'kahan'` or
+    `'exact'`, see [`summate`][vector.util.summate]) the products are summed
+    by that algorithm.
+    
     Notes
     -----
     Reasons why it exists:
@@ -91,6 +96,11 @@ def vecsabsq(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:b
     ----------
     - <https://docs.python.org/3/library/itertools.html#itertools-recipes>: `sum_of_squares`
     """
+    if summation is not None:
+        conj = try_conjugate if conjugate else (lambda x: x)
+        if weights is None:
+            return summate((conj(vi)*vi for vi in v.values()), summation, zero)
+        return summate((conj(vi)*vi*weights[i] for i, vi in v.items()), summation, zero)
     if weights is None:
         if not conjugate:
             return sumprod_default(v.values(), v.values(), default=zero)
@@ -102,13 +112,22 @@ def vecsabsq(v:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:b
         else:
             return sum_default((try_conjugate(vi)*vi*weights[i] for i, vi in v.items()), default=zero)
 
-def vecsdot(v:Mapping[int,Any], w:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0) -> Any:
+def vecsdot(v:Mapping[int,Any], w:Mapping[int,Any], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
     r"""Return the inner product.
     
     $$
         \left<\vec{v}\mid\vec{w}\right>_{\ell_{\mathbb{N}_0}^2}=\sum_iv_i^{(*)}w_i\omega_i
     $$
+    
+    With a `summation` mode (`'naive'`, `'pairwise'`, `'kahan'` or
+    `'exact'`, see [`summate`][vector.util.summate]) the products are summed
+    by that algorithm.
     """
+    if summation is not None:
+        conj = try_conjugate if conjugate else (lambda x: x)
+        if weights is None:
+            return summate((conj(v[k])*w[k] for k in v.keys()&w.keys()), summation, zero)
+        return summate((conj(v[k])*w[k]*weights[k] for k in v.keys()&w.keys()), summation, zero)
     if weights is None:
         if not conjugate:
             return sum_default((v[k]*w[k] for k in v.keys()&w.keys()), default=zero)
@@ -119,3 +138,49 @@ def vecsdot(v:Mapping[int,Any], w:Mapping[int,Any], weights:Mapping[int,Any]|Non
             return sum_default((v[k]*w[k]*weights[k] for k in v.keys()&w.keys()), default=zero)
         else:
             return sum_default((try_conjugate(v[k])*w[k]*weights[k] for k in v.keys()&w.keys()), default=zero)
+
+def vecsgram(vs:Iterable[Mapping[int,Any]], ws:Iterable[Mapping[int,Any]]|None=None, weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, triangular:bool=False, block:int|None=None) -> tuple[tuple[Any,...],...]|Generator:
+    r"""Return the Gram matrix (all pairwise inner products).
+    
+    $$
+        \left(\left<\vec{v}_i\mid\vec{w}_j\right>_{\ell_{\mathbb{N}_0}^2}\right)_{i,j}
+    $$
+    
+    Same result & options (`triangular`, `block`) as
+    [`vecgram`][vector.dense.hilbertspace.vecgram], `zero` for pairs without
+    common indices.
+    
+    An inverted index maps every index to the vectors of `ws` having it,
+    so only the products of overlapping pairs are touched.
+    
+    Complexity
+    ----------
+    There will be one scalar multiplication (two with weights) per
+    common index $k$ of a pair, $\sum_k\#\{i:k\in\vec{v}_i\}\#\{j:k\in\vec{w}_j\}$
+    in total (about half without `ws`).
+    """
+    vs = list(vs)
+    symmetric = ws is None
+    ws = vs if symmetric else list(ws)
+    conj = try_conjugate if conjugate else (lambda x: x)
+    def tile(i0, i1, j0, j1, upper):
+        index:dict[int,list[tuple[int,Any]]] = {}
+        for j in range(j0, j1):
+            for k, wjk in ws[j].items():
+                index.setdefault(k, []).append((j, wjk))
+        rows = []
+        for i in range(i0, i1):
+            r:dict[int,Any] = {}
+            for k, vik in vs[i].items():
+                if k not in index:
+                    continue
+                c = conj(vik)
+                for j, wjk in index[k]:
+                    if upper and j < i:
+                        continue
+                    p = c*wjk if weights is None else c*wjk*weights[k]
+                    r[j] = r[j]+p if j in r else p
+            rows.append([r.get(j, zero) for j in range(j0, j1)])
+        return rows
+    tiles = _gramtiles(len(vs), len(ws), tile, symmetric, triangular, conjugate, block or max(len(vs), len(ws), 1))
+    return tiles if block else _gram(len(vs), len(ws), tiles, zero)
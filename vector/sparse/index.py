@@ -0,0 +1,162 @@
+from .hilbertspace import vecsdot, vecsabs
+from heapq import heappush, heappushpop
+from math import fsum
+from typing import Any, Hashable
+from collections.abc import Iterable, Mapping
+
+
+
+__all__ = ('VectorSparseIndex',)
+
+
+
+class VectorSparseIndex:
+    """Inverted index over sparse vectors for top-k similarity queries.
+    
+    Every index `i` has a posting list of the vectors (by key) with a
+    coefficient at `i`, together with the minimum & maximum coefficient
+    (absolute & normalised by the vector's norm). A query only touches the
+    posting lists of its own indices, and stops early (MaxScore): lists are
+    processed by descending upper bound of their contribution, once the
+    bounds of the remaining lists can't reach the current $k$-th best score,
+    no further vector can enter the result.
+    
+    Scores are computed by [`vecsdot`][vector.sparse.hilbertspace.vecsdot]
+    (`vecsdot(q, v)`), or for cosine similarity as
+    `vecsdot(q, v) / (vecsabs(q)*vecsabs(v))`, so they are exactly the
+    brute force ones. Coefficients must be real (ordered).
+    
+    Vectors are inserted & deleted incrementally by key.
+    
+    ```python
+    >>> index = VectorSparseIndex({'a':{0:1, 1:2}, 'b':{1:3}, 'c':{2:1}})
+    >>> index.topk({1:1}, 2)
+    [('b', 3), ('a', 2)]
+    ```
+    """
+    __slots__ = ('_vectors', '_norms', '_order', '_count', '_postings', '_bounds')
+    
+    def __init__(self, vs:Mapping[Hashable,Mapping[int,Any]]|Iterable[Mapping[int,Any]]=()):
+        self._vectors:dict[Hashable,Mapping[int,Any]] = {}
+        self._norms:dict[Hashable,Any] = {}
+        self._order:dict[Hashable,int] = {}
+        self._count = 0
+        self._postings:dict[int,dict[Hashable,Any]] = {}
+        #index -> (min, max, normalised min, normalised max), None if outdated
+        self._bounds:dict[int,tuple[Any,Any,Any,Any]|None] = {}
+        for key, v in (vs.items() if isinstance(vs, Mapping) else enumerate(vs)):
+            self.insert(key, v)
+    
+    
+    
+    #container
+    def __len__(self):
+        return len(self._vectors)
+    
+    def __contains__(self, key):
+        return key in self._vectors
+    
+    def __iter__(self):
+        return iter(self._vectors)
+    
+    def __getitem__(self, key):
+        return self._vectors[key]
+    
+    def insert(self, key:Hashable, v:Mapping[int,Any]) -> None:
+        """Add the vector `v` under `key`, replacing a previous one."""
+        if key in self._vectors:
+            self.delete(key)
+        v = dict(v)
+        self._vectors[key], self._norms[key] = v, vecsabs(v)
+        self._order[key], self._count = self._count, self._count+1
+        for i, vi in v.items():
+            self._postings.setdefault(i, {})[key] = vi
+            bounds = self._bounds.get(i)
+            if i in self._bounds and bounds is None:
+                continue #recomputed on the next query anyway
+            ni = vi / self._norms[key] if self._norms[key] else 0
+            if bounds is None:
+                self._bounds[i] = (vi, vi, ni, ni)
+            else:
+                lo, hi, nlo, nhi = bounds
+                self._bounds[i] = (min(lo, vi), max(hi, vi), min(nlo, ni), max(nhi, ni))
+    
+    def delete(self, key:Hashable) -> None:
+        """Remove the vector under `key`, raises `KeyError` if there is none."""
+        v = self._vectors.pop(key)
+        del self._norms[key], self._order[key]
+        for i in v:
+            posting = self._postings[i]
+            del posting[key]
+            if posting:
+                self._bounds[i] = None
+            else:
+                del self._postings[i], self._bounds[i]
+    
+    
+    
+    #queries
+    def _bound(self, i):
+        """Return the coefficient bounds of index `i`, recomputed if outdated."""
+        if self._bounds[i] is None:
+            posting = self._postings[i]
+            ns = [vi / self._norms[key] if self._norms[key] else 0 for key, vi in posting.items()]
+            self._bounds[i] = (min(posting.values()), max(posting.values()), min(ns), max(ns))
+        return self._bounds[i]
+    
+    def topk(self, q:Mapping[int,Any], k:int, cosine:bool=False) -> list[tuple[Hashable,Any]]:
+        """Return the `k` most similar vectors as `(key, score)` pairs.
+        
+        Sorted by descending score, ties in insertion order, the same as
+        sorting all vectors by their brute force score.
+        Vectors without common indices score zero. For cosine similarity
+        vectors of zero norm are skipped.
+        """
+        if k <= 0:
+            return []
+        qabs = vecsabs(q) if cosine else 1
+        if cosine and not qabs:
+            raise ZeroDivisionError('cosine similarity of a zero query')
+        score = (lambda key: vecsdot(q, self._vectors[key]) / (qabs*self._norms[key])) if cosine \
+                else (lambda key: vecsdot(q, self._vectors[key]))
+        
+        #upper bounds of the contributions, a vector without the index contributes 0
+        terms = []
+        for i, qi in q.items():
+            if i in self._postings:
+                lo, hi, nlo, nhi = self._bound(i)
+                lo, hi = (nlo, nhi) if cosine else (lo, hi)
+                terms.append((max(qi*hi, qi*lo, 0), i))
+        terms.sort(key=lambda t: t[0], reverse=True)
+        #remaining[p]: bound of the lists p... (fsum & slack so rounding can't undercut a score)
+        remaining = [fsum(float(ub) for ub, _ in terms[p:]) for p in range(len(terms))]
+        remaining = [r*(1+len(q)*2**-50)/(qabs if cosine else 1) for r in remaining]
+        
+        heap:list[tuple[Any,int,Hashable]] = [] #(score, -order, key), worst on top
+        seen = set()
+        for p, (_, i) in enumerate(terms):
+            if len(heap)==k and remaining[p] < heap[0][0]:
+                break
+            for key in self._postings[i]:
+                if key in seen or (cosine and not self._norms[key]):
+                    continue
+                seen.add(key)
+                item = (score(key), -self._order[key], key)
+                if len(heap) < k:
+                    heappush(heap, item)
+                else:
+                    heappushpop(heap, item)
+        #vectors without common indices score zero, nothing was pruned if the heap isn't full or its minimum isn't positive
+        if len(heap) < k or heap[0][0] <= 0:
+            zero = 0*qabs if cosine else 0
+            for key in self._vectors:
+                if key in seen or (cosine and not self._norms[key]):
+                    continue
+                if len(heap)==k and (zero, -self._order[key]) <= heap[0][:2]:
+                    break #insertion order, all following are worse
+                item = (score(key), -self._order[key], key)
+                if len(heap) < k:
+                    heappush(heap, item)
+                else:
+                    heappushpop(heap, item)
+        return [(key, s) for s, _, key in sorted(heap, reverse=True)]
@@ -0,0 +1,316 @@
+from ..util import try_conjugate, summate
+from iteration import sum_default
+from bisect import bisect_left
+from typing import Any
+from collections.abc import Mapping
+
+
+
+__all__ = ('vecstoso', 'vecsotos',
+           'vecsoadd', 'vecsosub', 'vecsodot',
+           'vecsohadamard', 'vecsohadamardmin', 'vecsohadamardmax',
+           'VectorSparseSorted')
+
+
+
+#conversion
+def vecstoso(v:Mapping[int,Any]) -> tuple[list[int],list[Any]]:
+    """Return a sparse vector (`dict`) as sorted parallel index & coefficient lists.
+    
+    See also
+    --------
+    - inverse: [`vecsotos`][vector.sparse.ordered.vecsotos]
+    """
+    items = sorted(v.items(), key=lambda item: item[0])
+    return [i for i, _ in items], [vi for _, vi in items]
+
+def vecsotos(v:tuple[list[int],list[Any]]) -> dict[int,Any]:
+    """Return sorted parallel index & coefficient lists as a sparse vector (`dict`).
+    
+    See also
+    --------
+    - inverse: [`vecstoso`][vector.sparse.ordered.vecstoso]
+    """
+    return dict(zip(*v))
+
+
+
+#merge kernels
+def _add(v, w):
+    """Merge two sorted vectors, adding common coefficients.
+    
+    Coefficients only in `v` are taken as they are,
+    coefficients only in `w` are passed through unary plus.
+    """
+    (vi, vv), (wi, wv) = v, w
+    ri, rv = [], []
+    j, k, n, m = 0, 0, len(vi), len(wi)
+    while j<n and k<m:
+        if vi[j] < wi[k]:
+            ri.append(vi[j]); rv.append(vv[j]); j += 1
+        elif wi[k] < vi[j]:
+            ri.append(wi[k]); rv.append(+wv[k]); k += 1
+        else:
+            ri.append(vi[j]); rv.append(vv[j]+wv[k]); j += 1; k += 1
+    ri.extend(vi[j:]); rv.extend(vv[j:])
+    ri.extend(wi[k:]); rv.extend(+wk for wk in wv[k:])
+    return ri, rv
+
+def _union(v, w, f):
+    """Merge two sorted vectors, combining common coefficients by `f`.
+    
+    Coefficients only in one vector are taken as they are.
+    """
+    (vi, vv), (wi, wv) = v, w
+    ri, rv = [], []
+    j, k, n, m = 0, 0, len(vi), len(wi)
+    while j<n and k<m:
+        if vi[j] < wi[k]:
+            ri.append(vi[j]); rv.append(vv[j]); j += 1
+        elif wi[k] < vi[j]:
+            ri.append(wi[k]); rv.append(wv[k]); k += 1
+        else:
+            ri.append(vi[j]); rv.append(f(vv[j], wv[k])); j += 1; k += 1
+    ri.extend(vi[j:]); rv.extend(vv[j:])
+    ri.extend(wi[k:]); rv.extend(wv[k:])
+    return ri, rv
+
+def _intersection(v, w):
+    """Yield `(i, v_i, w_i)` for all common indices in ascending order."""
+    (vi, vv), (wi, wv) = v, w
+    j, k, n, m = 0, 0, len(vi), len(wi)
+    while j<n and k<m:
+        if vi[j] < wi[k]:
+            j += 1
+        elif wi[k] < vi[j]:
+            k += 1
+        else:
+            yield vi[j], vv[j], wv[k]
+            j += 1; k += 1
+
+
+
+#vectorspace
+def vecsoadd(*vs:tuple[list[int],list[Any]]) -> tuple[list[int],list[Any]]:
+    r"""Return the sum.
+    
+    $$
+        \vec{v}_0+\vec{v}_1+\cdots
+    $$
+    
+    Same result as [`vecsadd`][vector.sparse.vectorspace.vecsadd],
+    but by a linear merge instead of hashing.
+    
+    Complexity
+    ----------
+    For two vectors with $n$ & $m$ elements there will be
+    
+    - $\min\{n, m\}$ scalar additions (`add`) &
+    - $\begin{cases}m-n&m\ge n\\0&m\le n\end{cases}$ unary plus operations (`pos`).
+    """
+    if not vs:
+        return [], []
+    r = list(vs[0][0]), list(vs[0][1])
+    for v in vs[1:]:
+        r = _add(r, v)
+    return r
+
+def vecsosub(v:tuple[list[int],list[Any]], w:tuple[list[int],list[Any]]) -> tuple[list[int],list[Any]]:
+    r"""Return the difference.
+    
+    $$
+        \vec{v}-\vec{w}
+    $$
+    
+    Same result as [`vecssub`][vector.sparse.vectorspace.vecssub],
+    but by a linear merge instead of hashing.
+    
+    Complexity
+    ----------
+    For two vectors with $n$ & $m$ elements there will be
+    
+    - $\min\{n, m\}$ scalar subtractions (`sub`) &
+    - $\begin{cases}m-n&m\ge n\\0&m\le n\end{cases}$ negations (`neg`).
+    """
+    (vi, vv), (wi, wv) = v, w
+    ri, rv = [], []
+    j, k, n, m = 0, 0, len(vi), len(wi)
+    while j<n and k<m:
+        if vi[j] < wi[k]:
+            ri.append(vi[j]); rv.append(vv[j]); j += 1
+        elif wi[k] < vi[j]:
+            ri.append(wi[k]); rv.append(-wv[k]); k += 1
+        else:
+            ri.append(vi[j]); rv.append(vv[j]-wv[k]); j += 1; k += 1
+    ri.extend(vi[j:]); rv.extend(vv[j:])
+    ri.extend(wi[k:]); rv.extend(-wk for wk in wv[k:])
+    return ri, rv
+
+
+
+#hilbertspace
+def vecsodot(v:tuple[list[int],list[Any]], w:tuple[list[int],list[Any]], weights:Mapping[int,Any]|None=None, conjugate:bool=False, zero:Any=0, summation:str|None=None) -> Any:
+    r"""Return the inner product.
+    
+    $$
+        \left<\vec{v}\mid\vec{w}\right>_{\ell_{\mathbb{N}_0}^2}=\sum_iv_i^{(*)}w_i\omega_i
+    $$
+    
+    Same result as [`vecsdot`][vector.sparse.hilbertspace.vecsdot],
+    but the common indices are found by a linear merge
+    instead of a temporary set intersection.
+    
+    Notes
+    -----
+    The products are summed in ascending index order,
+    by a `summation` mode like in `vecsdot` if given.
+    """
+    if summation is not None:
+        conj = try_conjugate if conjugate else (lambda x: x)
+        if weights is None:
+            return summate((conj(vk)*wk for _, vk, wk in _intersection(v, w)), summation, zero)
+        return summate((conj(vk)*wk*weights[k] for k, vk, wk in _intersection(v, w)), summation, zero)
+    if weights is None:
+        if not conjugate:
+            return sum_default((vk*wk for _, vk, wk in _intersection(v, w)), default=zero)
+        else:
+            return sum_default((try_conjugate(vk)*wk for _, vk, wk in _intersection(v, w)), default=zero)
+    else:
+        if not conjugate:
+            return sum_default((vk*wk*weights[k] for k, vk, wk in _intersection(v, w)), default=zero)
+        else:
+            return sum_default((try_conjugate(vk)*wk*weights[k] for k, vk, wk in _intersection(v, w)), default=zero)
+
+
+
+#elementwise
+def vecsohadamard(*vs:tuple[list[int],list[Any]]) -> tuple[list[int],list[Any]]:
+    r"""Return the elementwise product.
+    
+    $$
+        \left((\vec{v}_0)_i\cdot(\vec{v}_1)_i\cdot\cdots\right)_i
+    $$
+    
+    Same result as [`vecshadamard`][vector.sparse.elementwise.vecshadamard].
+    """
+    if not vs:
+        return [], []
+    r = list(vs[0][0]), list(vs[0][1])
+    for v in vs[1:]:
+        ri, rv = [], []
+        for k, rk, vk in _intersection(r, v):
+            ri.append(k); rv.append(rk*vk)
+        r = ri, rv
+    return r
+
+def vecsohadamardmin(*vs:tuple[list[int],list[Any]]) -> tuple[list[int],list[Any]]:
+    r"""Return the elementwise minimum.
+    
+    $$
+        \left(\min((\vec{v}_0)_i,(\vec{v}_1)_i,\cdots)\right)_i
+    $$
+    
+    Same result as [`vecshadamardmin`][vector.sparse.elementwise.vecshadamardmin].
+    """
+    if not vs:
+        return [], []
+    r = list(vs[0][0]), list(vs[0][1])
+    for v in vs[1:]:
+        r = _union(r, v, min)
+    return r
+
+def vecsohadamardmax(*vs:tuple[list[int],list[Any]]) -> tuple[list[int],list[Any]]:
+    r"""Return the elementwise maximum.
+    
+    $$
+        \left(\max((\vec{v}_0)_i,(\vec{v}_1)_i,\cdots)\right)_i
+    $$
+    
+    Same result as [`vecshadamardmax`][vector.sparse.elementwise.vecshadamardmax].
+    """
+    if not vs:
+        return [], []
+    r = list(vs[0][0]), list(vs[0][1])
+    for v in vs[1:]:
+        r = _union(r, v, max)
+    return r
+
+
+
+class VectorSparseSorted:
+    """Sparse vector as sorted parallel index & coefficient lists.
+    
+    Can be constructed from & converted to
+    [`VectorSparse`][vector.sparse.objectoriented.VectorSparse]
+    (or any `dict`) directly: `VectorSparseSorted(v)`, `VectorSparse(s)`.
+    """
+    __slots__ = ('indices', 'values')
+    
+    
+    
+    def __init__(self, data=None):
+        self.indices, self.values = vecstoso(data) if data is not None else ([], [])
+    
+    @classmethod
+    def _wrap(cls, v):
+        r = cls()
+        r.indices, r.values = v
+        return r
+    
+    @property
+    def data(self):
+        return self.indices, self.values
+    
+    
+    
+    #container
+    def keys(self):
+        return iter(self.indices)
+    
+    def items(self):
+        return zip(self.indices, self.values)
+    
+    def __iter__(self):
+        return iter(self.indices)
+    
+    def __contains__(self, key):
+        j = bisect_left(self.indices, key)
+        return j<len(self.indices) and self.indices[j]==key
+    
+    def __getitem__(self, key):
+        j = bisect_left(self.indices, key)
+        if j<len(self.indices) and self.indices[j]==key:
+            return self.values[j]
+        return 0
+    
+    def __eq__(self, other):
+        return vecsotos(self.data) == vecsotos(other.data)
+    
+    
+    #hilbertspace
+    def dot(self, other, weights=None, conjugate=False, zero=0, summation=None):
+        return vecsodot(self.data, other.data, weights=weights, conjugate=conjugate, zero=zero, summation=summation)
+    
+    
+    #vector_space
+    def __add__(self, other):
+        return self._wrap(vecsoadd(self.data, other.data))
+    
+    def __sub__(self, other):
+        return self._wrap(vecsosub(self.data, other.data))
+    
+    
+    #elementwise
+    def hadamard(self, *others):
+        return self._wrap(vecsohadamard(self.data, *(other.data for other in others)))
+    
+    def hadamardmin(self, *others):
+        return self._wrap(vecsohadamardmin(self.data, *(other.data for other in others)))
+    
+    def hadamardmax(self, *others):
+        return self._wrap(vecsohadamardmax(self.data, *(other.data for other in others)))
+    
+    
+    #IO
+    def __repr__(self):
+        return f'{type(self).__name__}{vecsotos(self.data)!r}'
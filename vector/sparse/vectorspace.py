@@ -1,5 +1,5 @@
 from typing import Any
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping
 
 
 
@@ -13,7 +13,9 @@ __all__ = ('vecspos',             'vecsipos',
            'vecstruediv',         'vecsitruediv',
            'vecsfloordiv',        'vecsifloordiv',
            'vecsmod',             'vecsimod',
-           'vecsdivmod')
+           'vecsdivmod',
+           'vecsaxpy',            'vecsiaxpy',
+           'vecslincomb',         'vecsilincomb')
 
 
 
@@ -465,3 +467,106 @@ def vecsdivmod(v:Mapping[int,Any], a:Any) -> tuple[dict[int,Any],dict[int,Any]]:
     for i, vi in v.items():
         q[i], r[i] = divmod(vi, a)
     return q, r
+
+def vecsaxpy(a:Any, x:Mapping[int,Any], y:Mapping[int,Any]) -> dict[int,Any]:
+    r"""Return the scaled sum.
+    
+    $$
+        a\vec{x}+\vec{y}
+    $$
+    
+    More efficient than `vecsadd(vecsrmul(a, x), y)`.
+    
+    Complexity
+    ----------
+    For two vectors with $m$ & $n$ elements there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - at most $\min\{m, n\}$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in-place: [`vecsiaxpy`][vector.sparse.vectorspace.vecsiaxpy]
+    - for more vectors: [`vecslincomb`][vector.sparse.vectorspace.vecslincomb]
+    """
+    r = dict(y)
+    for i, xi in x.items():
+        if i in r:
+            r[i] = a*xi + r[i]
+        else:
+            r[i] = a*xi
+    return r
+
+def vecsiaxpy(y:MutableMapping[int,Any], a:Any, x:Mapping[int,Any]) -> MutableMapping[int,Any]:
+    r"""Add a scaled vector.
+    
+    $$
+        \vec{y} += a\vec{x}
+    $$
+    
+    More efficient than `vecsiadd(y, vecsrmul(a, x))`.
+    
+    Complexity
+    ----------
+    For two vectors with $n$ & $m$ elements there will be
+    
+    - $m$ scalar multiplications (`rmul`) &
+    - at most $\min\{m, n\}$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`vecsaxpy`][vector.sparse.vectorspace.vecsaxpy]
+    """
+    for i, xi in x.items():
+        if i in y:
+            y[i] += a*xi
+        else:
+            y[i] = a*xi
+    return y
+
+def vecslincomb(coeffs:Iterable[Any], vs:Iterable[Mapping[int,Any]]) -> dict[int,Any]:
+    r"""Return the linear combination.
+    
+    $$
+        \sum_ia_i\vec{v}_i
+    $$
+    
+    More efficient than `vecsadd(*map(vecsrmul, coeffs, vs))`.
+    `coeffs` & `vs` must be of the same length.
+    
+    Complexity
+    ----------
+    For vectors with $n_i$ elements there will be
+    
+    - $\sum_in_i$ scalar multiplications (`rmul`) &
+    - at most $\sum_in_i-\max_in_i$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - in-place: [`vecsilincomb`][vector.sparse.vectorspace.vecsilincomb]
+    """
+    return vecsilincomb({}, coeffs, vs)
+
+def vecsilincomb(v:MutableMapping[int,Any], coeffs:Iterable[Any], ws:Iterable[Mapping[int,Any]]) -> MutableMapping[int,Any]:
+    r"""Add a linear combination.
+    
+    $$
+        \vec{v} += \sum_ia_i\vec{w}_i
+    $$
+    
+    `coeffs` & `ws` must be of the same length.
+    
+    Complexity
+    ----------
+    For vectors with $m_i$ elements there will be
+    
+    - $\sum_im_i$ scalar multiplications (`rmul`) &
+    - at most $\sum_im_i$ scalar additions (`iadd`).
+    
+    See also
+    --------
+    - not in-place: [`vecslincomb`][vector.sparse.vectorspace.vecslincomb]
+    """
+    for a, w in zip(coeffs, ws, strict=True):
+        vecsiaxpy(v, a, w)
+    return v
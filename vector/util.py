@@ -1,8 +1,13 @@
+from math import fsum
+from cmath import isfinite
+from itertools import chain
+from iteration import MISSING, sum_default
 from typing import Any
+from collections.abc import Iterable
 
 
 
-__all__ = ('try_conjugate', )
+__all__ = ('try_conjugate', 'summate')
 
 
 
@@ -20,3 +25,123 @@ def try_conjugate(x:Any) -> Any:
     """
     conj = getattr(x, 'conjugate', None)
     return conj() if callable(conj) else x
+
+
+class _Neumaier:
+    """Compensated (Kahan-Babuška-Neumaier) sum of real scalars."""
+    __slots__ = ('s', 'c')
+    
+    def __init__(self):
+        self.s, self.c = 0, 0
+    
+    def add(self, x):
+        t = self.s + x
+        if self._finite(t):
+            if abs(self.s) >= abs(x):
+                self.c += (self.s - t) + x
+            else:
+                self.c += (x - t) + self.s
+        self.s = t
+    
+    @staticmethod
+    def _finite(x):
+        return not isinstance(x, (float, complex)) or isfinite(x)
+    
+    def sum(self):
+        #an infinite or nan sum is returned as is, like by sum & fsum (no inf-inf)
+        return self.s + self.c if self._finite(self.s) else self.s
+
+def _pairwise(xs):
+    """Return the pairwise sum of nonempty terms, in logarithmic memory."""
+    stack = [] #(partial sum, number of terms)
+    for x in xs:
+        s, n = x, 1
+        while stack and stack[-1][1]==n:
+            s, n = stack.pop()[0] + s, 2*n
+        stack.append((s, n))
+    s = stack.pop()[0]
+    while stack:
+        s = stack.pop()[0] + s
+    return s
+
+def summate(xs:Iterable, summation:str|None=None, zero:Any=0) -> Any:
+    r"""Return the sum.
+    
+    $$
+        \sum_ix_i
+    $$
+    
+    The `summation` mode selects the algorithm:
+    
+    - `None` or `'naive'`: left to right, like `sum`,
+    - `'pairwise'`: the two halves summed recursively,
+      error bound $\mathcal{O}(\varepsilon\log n)$ instead of $\mathcal{O}(\varepsilon n)$,
+    - `'kahan'`: compensated (Kahan-Babuška-Neumaier) summation,
+      error bound $\mathcal{O}(\varepsilon)$ independent of $n$,
+    - `'exact'`: [`math.fsum`](https://docs.python.org/3/library/math.html#math.fsum),
+      correctly rounded `float`s.
+    
+    For `'kahan'` & `'exact'` the real & imaginary parts of `complex` terms
+    are summed separately. `'kahan'` keeps exact types (`int`, `Fraction`)
+    exact, the compensation stays zero.
+    
+    Returns `zero` for no terms.
+    """
+    xs = iter(xs)
+    if (x0 := next(xs, MISSING)) is MISSING:
+        return zero
+    xs = chain((x0,), xs)
+    match summation:
+        case None | 'naive':
+            return sum_default(xs, default=zero)
+        case 'pairwise':
+            return _pairwise(xs)
+        case 'kahan':
+            re, im, cmplx = _Neumaier(), _Neumaier(), False
+            for x in xs:
+                if isinstance(x, complex):
+                    cmplx = True
+                    re.add(x.real)
+                    im.add(x.imag)
+                else:
+                    re.add(x)
+            return complex(re.sum(), im.sum()) if cmplx else re.sum()
+        case 'exact':
+            xs = list(xs)
+            if any(isinstance(x, complex) for x in xs):
+                return complex(fsum(x.real for x in xs), fsum(x.imag for x in xs))
+            return fsum(xs)
+    raise ValueError(f'unknown summation mode {summation!r}')
+
+
+
+def _gramtiles(n, m, tile, symmetric, triangular, conjugate, block):
+    """Yield the tiles `(i, j, rows)` of a Gram matrix.
+    
+    `tile(i0, i1, j0, j1, upper)` returns the rows of the entries
+    `[i0:i1, j0:j1]`, if `upper` only those on & above the diagonal are
+    computed, the others are zero. For `symmetric` matrices only the
+    upper tiles are computed, the lower ones are mirrored (conjugated if
+    `conjugate`) or, if `triangular`, not yielded at all.
+    """
+    conj = try_conjugate if conjugate else (lambda x: x)
+    for i0 in range(0, n, block):
+        i1 = min(i0+block, n)
+        for j0 in range(i0 if symmetric else 0, m, block):
+            j1 = min(j0+block, m)
+            rows = tile(i0, i1, j0, j1, symmetric)
+            if symmetric and not triangular and i0==j0:
+                for a in range(i1-i0):
+                    for b in range(a):
+                        rows[a][b] = conj(rows[b][a])
+            yield i0, j0, rows
+            if symmetric and not triangular and i0!=j0:
+                yield j0, i0, [[conj(row[b]) for row in rows] for b in range(j1-j0)]
+
+def _gram(n, m, tiles, zero):
+    """Return the Gram matrix assembled from its tiles as `tuple` of rows."""
+    r = [[zero]*m for _ in range(n)]
+    for i0, j0, rows in tiles:
+        for i, row in enumerate(rows, i0):
+            r[i][j0:j0+len(row)] = row
+    return tuple(map(tuple, r))